@@ -0,0 +1,627 @@
+#!/usr/bin/env python3
+"""
+Redline one Word document against another as tracked changes.
+
+Body paragraphs and tables of both documents are aligned by a hash of their
+text; only blocks that differ are diffed further. A changed paragraph pair is
+diffed word by word, so unchanged words keep their original runs and
+formatting, deleted words keep their old run properties and inserted words
+take the run properties of the new document. All changes are then applied to
+the old document in one batch, with ids, RSIDs, authors and dates injected
+by DocxXMLEditor in a single pass.
+
+Usage:
+    from skills.docx.scripts.document import Document
+    from skills.docx.scripts.compare import compare
+
+    # For large documents, open document.xml with the lxml backend
+    doc = Document('workspace/old', lxml_parts=["word/document.xml"])
+    counts = compare(doc, 'workspace/new')  # {"modified": 3, "inserted": 1, "deleted": 2}
+    doc.save()  # Validated against the old document like any other edit
+
+Only text is compared: formatting-only changes are not tracked, and block
+content other than paragraphs and tables (content controls, section
+properties) is kept from the old document. Relationships referenced by
+inserted content (images, hyperlinks) are copied into the old document under
+new r:id values, together with the parts they target; a part that has
+relationships of its own (charts, embedded objects) cannot be copied and makes
+compare() raise.
+"""
+
+import bisect
+import copy
+import html
+import posixpath
+import re
+import shutil
+from collections import Counter
+from difflib import SequenceMatcher
+from pathlib import Path
+
+import lxml.etree
+
+from .revisions import W, serialize_element
+
+# Paragraph children and run children the word-level diff can rebuild; other
+# content (fields, hyperlinks, drawings) makes a changed paragraph be replaced whole
+_SIMPLE_PARAGRAPH_CHILDREN = {W + "pPr", W + "r", W + "proofErr"}
+_SIMPLE_RUN_CHILDREN = {
+    W + "rPr",
+    W + "t",
+    W + "tab",
+    W + "br",
+    W + "cr",
+    W + "lastRenderedPageBreak",
+}
+# Paragraph content that cannot sit inside w:ins/w:del; its runs are wrapped instead
+_RUN_CONTAINERS = {W + "hyperlink", W + "fldSimple", W + "smartTag", W + "customXml"}
+_TRACKED_TAGS = ("ins", "del", "moveFrom", "moveTo")
+_TOKEN = re.compile(r"\w+|\s+|[^\w\s]")
+# Attributes in this namespace (r:id, r:embed, r:link...) hold relationship ids
+R = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PACKAGE_RELS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_CONTENT_TYPES = "{http://schemas.openxmlformats.org/package/2006/content-types}"
+
+
+def compare(document, new_dir):
+    """
+    Turn document's word/document.xml into the new document's as tracked changes.
+
+    Args:
+        document: Document opened on the old version; document.xml must be unedited
+        new_dir: Path to the unpacked new version
+
+    Returns:
+        dict: Number of "modified", "inserted" and "deleted" paragraphs and tables
+
+    Raises:
+        ValueError: If document.xml was already edited, either version
+            contains tracked changes (accept or reject them first, see
+            revisions.py), or inserted content references a part that has
+            relationships of its own
+    """
+    editor = document["word/document.xml"]
+    if editor.dirty:
+        raise ValueError("compare() must run before other edits to word/document.xml")
+
+    parser = lxml.etree.XMLParser(resolve_entities=False, no_network=True)
+    old_root = lxml.etree.parse(str(editor.xml_path), parser).getroot()
+    new_root = lxml.etree.parse(f"{new_dir}/word/document.xml", parser).getroot()
+    for root in (old_root, new_root):
+        if next(root.iter(*(W + tag for tag in _TRACKED_TAGS)), None) is not None:
+            raise ValueError(
+                "compare() requires documents without tracked changes; "
+                "accept or reject them first"
+            )
+
+    old_blocks = list(old_root.find(W + "body").iterchildren(lxml.etree.Element))
+    new_blocks = list(new_root.find(W + "body").iterchildren(lxml.etree.Element))
+    body = editor._iter_elements("w:body")[0]
+    nodes = editor._child_elements(body)
+    if len(nodes) != len(old_blocks):
+        raise ValueError("word/document.xml changed on disk since it was opened")
+
+    relationships = _Relationships(document, new_dir)
+    differ = _Differ(old_root.nsmap, relationships)
+    opcodes = _align(
+        [_block_key(b) for b in old_blocks], [_block_key(b) for b in new_blocks]
+    )
+    inserts = []
+    replacements = []
+    for op, i1, i2, j1, j2 in opcodes:
+        if op == "equal":
+            continue
+        paired = min(i2 - i1, j2 - j1)
+        for old, new, node in zip(
+            old_blocks[i1 : i1 + paired],
+            new_blocks[j1 : j1 + paired],
+            nodes[i1 : i1 + paired],
+        ):
+            xml = differ.modified(old, new)
+            if xml is not None:
+                replacements.append(("replace_node", node, xml))
+        for old, node in zip(old_blocks[i1 + paired : i2], nodes[i1 + paired : i2]):
+            xml = differ.tracked(old, "del")
+            if xml is not None:
+                replacements.append(("replace_node", node, xml))
+        added = [differ.tracked(new, "ins") for new in new_blocks[j1 + paired : j2]]
+        added = "".join(xml for xml in added if xml is not None)
+        if added:
+            # Inserted after the preceding old block, which a replacement may
+            # swap out later in the batch, so insertions go first
+            anchor = i1 + paired - 1
+            if anchor >= 0:
+                inserts.append(("insert_after", nodes[anchor], added))
+            elif nodes:
+                inserts.append(("insert_before", nodes[0], added))
+            else:
+                inserts.append(("append_to", body, added))
+
+    # Nothing is edited before the whole diff was built; fragments may use
+    # prefixes only the new document declares
+    for prefix, uri in new_root.nsmap.items():
+        if prefix and prefix not in old_root.nsmap:
+            editor._declare_namespace(prefix, uri)
+    relationships.apply()
+    editor.batch_insert(inserts + replacements)
+    return differ.counts
+
+
+def _align(a, b):
+    """
+    Opcodes like SequenceMatcher.get_opcodes() for two long key sequences.
+
+    Uses patience diff: common prefix/suffix and keys occurring once on each
+    side anchor the alignment, and SequenceMatcher only runs on the gaps
+    between anchors, so near-identical documents align in near-linear time.
+    """
+    matches = []
+    ranges = [(0, len(a), 0, len(b))]
+    while ranges:
+        a_lo, a_hi, b_lo, b_hi = ranges.pop()
+        while a_lo < a_hi and b_lo < b_hi and a[a_lo] == b[b_lo]:
+            matches.append((a_lo, b_lo))
+            a_lo += 1
+            b_lo += 1
+        while a_lo < a_hi and b_lo < b_hi and a[a_hi - 1] == b[b_hi - 1]:
+            a_hi -= 1
+            b_hi -= 1
+            matches.append((a_hi, b_hi))
+        if a_lo == a_hi or b_lo == b_hi:
+            continue
+
+        anchors = _unique_anchors(a, a_lo, a_hi, b, b_lo, b_hi)
+        if not anchors:
+            matcher = SequenceMatcher(
+                None, a[a_lo:a_hi], b[b_lo:b_hi], autojunk=False
+            )
+            for i, j, size in matcher.get_matching_blocks():
+                matches.extend((a_lo + i + k, b_lo + j + k) for k in range(size))
+            continue
+        for i, j in anchors:
+            matches.append((i, j))
+            ranges.append((a_lo, i, b_lo, j))
+            a_lo, b_lo = i + 1, j + 1
+        ranges.append((a_lo, a_hi, b_lo, b_hi))
+
+    matches.sort()
+    opcodes = []
+    i = j = 0
+    for mi, mj in matches + [(len(a), len(b))]:
+        if i < mi or j < mj:
+            op = "replace" if i < mi and j < mj else "delete" if i < mi else "insert"
+            opcodes.append((op, i, mi, j, mj))
+        if mi < len(a):
+            if opcodes and opcodes[-1][0] == "equal":
+                _, i1, _, j1, _ = opcodes.pop()
+            else:
+                i1, j1 = mi, mj
+            opcodes.append(("equal", i1, mi + 1, j1, mj + 1))
+        i, j = mi + 1, mj + 1
+    return opcodes
+
+
+def _unique_anchors(a, a_lo, a_hi, b, b_lo, b_hi):
+    """Longest increasing run of (i, j) pairs of keys unique on both sides."""
+    a_counts = Counter(a[a_lo:a_hi])
+    b_index = {}
+    for j in range(b_lo, b_hi):
+        b_index[b[j]] = None if b[j] in b_index else j
+    pairs = [
+        (i, b_index[a[i]])
+        for i in range(a_lo, a_hi)
+        if a_counts[a[i]] == 1 and b_index.get(a[i]) is not None
+    ]
+    # Patience sorting: longest subsequence of pairs increasing in j
+    tails = []
+    tail_pairs = []
+    previous = {}
+    for pair in pairs:
+        position = bisect.bisect_left(tails, pair[1])
+        previous[pair] = tail_pairs[position - 1] if position else None
+        if position == len(tails):
+            tails.append(pair[1])
+            tail_pairs.append(pair)
+        else:
+            tails[position] = pair[1]
+            tail_pairs[position] = pair
+    anchors = []
+    pair = tail_pairs[-1] if tail_pairs else None
+    while pair is not None:
+        anchors.append(pair)
+        pair = previous[pair]
+    return anchors[::-1]
+
+
+def _block_text(block):
+    """Text of a paragraph or table: w:t text plus tabs and breaks."""
+    parts = []
+    for elem in block.iter(W + "t", W + "tab", W + "br", W + "cr", W + "p"):
+        if elem.tag == W + "t":
+            parts.append(elem.text or "")
+        elif elem.tag == W + "p":
+            if parts:
+                parts.append("\n")
+        else:
+            parts.append("\t" if elem.tag == W + "tab" else "\n")
+    return "".join(parts)
+
+
+def _block_key(block):
+    """Alignment key: blocks with equal keys are left untouched."""
+    return block.tag, _block_text(block)
+
+
+def _simple_runs(paragraph):
+    """(run, text) pairs if paragraph only holds plain text runs, else None."""
+    runs = []
+    for child in paragraph:
+        if child.tag not in _SIMPLE_PARAGRAPH_CHILDREN:
+            return None
+        if child.tag != W + "r":
+            continue
+        parts = []
+        for elem in child:
+            if elem.tag not in _SIMPLE_RUN_CHILDREN:
+                return None
+            if elem.tag == W + "t":
+                parts.append(elem.text or "")
+            elif elem.tag == W + "tab":
+                parts.append("\t")
+            elif elem.tag in (W + "br", W + "cr"):
+                if len(elem.attrib):
+                    return None
+                parts.append("\n")
+        runs.append((child, "".join(parts)))
+    return runs
+
+
+class _Differ:
+    """Builds tracked-change XML for changed, deleted and inserted blocks."""
+
+    def __init__(self, nsmap, relationships):
+        self.nsmap = nsmap
+        self.relationships = relationships
+        self.counts = {"modified": 0, "inserted": 0, "deleted": 0}
+
+    def _xml(self, elem):
+        return serialize_element(elem, self.nsmap).decode("utf-8")
+
+    def modified(self, old, new):
+        """Tracked-change XML turning block old into new (None if not supported)."""
+        old_runs = _simple_runs(old) if old.tag == W + "p" else None
+        new_runs = _simple_runs(new) if new.tag == W + "p" else None
+        if old_runs is None or new_runs is None:
+            # Replace the block whole: the deletion keeps its place, the
+            # insertion follows it
+            deleted = self.tracked(old, "del")
+            if deleted is None:
+                return None
+            return deleted + (self.tracked(new, "ins") or "")
+
+        self.counts["modified"] += 1
+        result = lxml.etree.Element(old.tag, attrib=old.attrib, nsmap=old.nsmap)
+        props = old.find(W + "pPr")
+        if props is not None:
+            result.append(copy.deepcopy(props))
+
+        old_text, old_owner = _flatten(old_runs)
+        new_text, new_owner = _flatten(new_runs)
+        old_tokens = _TOKEN.findall(old_text)
+        new_tokens = _TOKEN.findall(new_text)
+        old_offsets = _offsets(old_tokens)
+        new_offsets = _offsets(new_tokens)
+        matcher = SequenceMatcher(None, old_tokens, new_tokens, autojunk=False)
+        for op, i1, i2, j1, j2 in matcher.get_opcodes():
+            a, b = old_offsets[i1], old_offsets[i2]
+            c, d = new_offsets[j1], new_offsets[j2]
+            if op == "equal":
+                for run, text in _segments(old_runs, old_owner, old_text, a, b):
+                    result.append(_make_run(run, text, keep_attributes=True))
+                continue
+            if a < b:
+                wrapper = lxml.etree.SubElement(result, W + "del")
+                for run, text in _segments(old_runs, old_owner, old_text, a, b):
+                    wrapper.append(
+                        _make_run(run, text, keep_attributes=True, deleted=True)
+                    )
+            if c < d:
+                wrapper = lxml.etree.SubElement(result, W + "ins")
+                for run, text in _segments(new_runs, new_owner, new_text, c, d):
+                    wrapper.append(_make_run(run, text, keep_attributes=False))
+        return self._xml(result)
+
+    def tracked(self, block, change):
+        """XML for a whole paragraph or table marked as inserted or deleted."""
+        if block.tag not in (W + "p", W + "tbl"):
+            return None
+        self.counts["inserted" if change == "ins" else "deleted"] += 1
+        block = copy.deepcopy(block)
+        if change == "ins":
+            self.relationships.import_references(block)
+        paragraphs = [block] if block.tag == W + "p" else block.iter(W + "p")
+        for paragraph in list(paragraphs):
+            _wrap_content(paragraph, change)
+            _mark(paragraph, W + "pPr", W + "rPr", change)
+        for row in block.iter(W + "tr"):
+            _mark(row, W + "trPr", None, change)
+        return self._xml(block)
+
+
+class _Relationships:
+    """
+    Copies relationships referenced by inserted content into the old document.
+
+    References are renumbered while the diff is built; the old document's
+    relationships, content types and parts only change in apply(), so a
+    reference that cannot be copied fails compare() before any edit.
+    """
+
+    RELS_PATH = "word/_rels/document.xml.rels"
+
+    def __init__(self, document, new_dir):
+        self.document = document
+        self.new_dir = Path(new_dir)
+        self.ids = {}  # new document rId -> rId in the old document
+        self.parts = {}  # new part name -> part name in the old document
+        self.new_rels = None
+        self.new_content_types = None
+        self.old_rels = None
+        self.next_id = None
+        self.added_rels = []
+        self.added_parts = []
+
+    def import_references(self, block):
+        """Rewrite relationship ids in block (from the new document) in place."""
+        for elem in block.iter(lxml.etree.Element):
+            for name, value in elem.attrib.items():
+                if name.startswith(R) and value:
+                    elem.set(name, self._import(value))
+
+    def _import(self, rid):
+        if rid in self.ids:
+            return self.ids[rid]
+        if self.new_rels is None:
+            self._load()
+        if rid not in self.new_rels:
+            raise ValueError(f"Inserted content references unknown relationship {rid}")
+        rel_type, target, mode = self.new_rels[rid]
+        if mode != "External":
+            part = _part_name(target)
+            if part not in self.parts:
+                self.parts[part] = self._copy_target(part)
+            target = _relative_target(self.parts[part], target)
+
+        old_id = self.old_rels.get((rel_type, target, mode))
+        if old_id is None:
+            old_id = f"rId{self.next_id}"
+            self.next_id += 1
+            self.old_rels[(rel_type, target, mode)] = old_id
+            self.added_rels.append((old_id, rel_type, target, mode))
+        self.ids[rid] = old_id
+        return old_id
+
+    def _load(self):
+        """Read the new document's relationships and the old document's state."""
+        new_rels = self.new_dir / self.RELS_PATH
+        if not new_rels.is_file():
+            raise ValueError(
+                f"Inserted content references relationships, but {new_rels} is missing"
+            )
+        self.new_content_types = _parse(self.new_dir / "[Content_Types].xml")
+        root = _parse(new_rels)
+        self.new_rels = {
+            rel.get("Id"): (rel.get("Type"), rel.get("Target"), rel.get("TargetMode"))
+            for rel in root.iter(_PACKAGE_RELS + "Relationship")
+        }
+
+        if not (self.document.unpacked_path / self.RELS_PATH).is_file():
+            raise ValueError(f"The old document has no {self.RELS_PATH}")
+        editor = self.document[self.RELS_PATH]
+        self.old_rels = {}
+        for rel in editor._iter_elements(_prefixed(editor, "Relationship")):
+            key = tuple(
+                editor._get_attr(rel, name) or None
+                for name in ("Type", "Target", "TargetMode")
+            )
+            self.old_rels.setdefault(key, editor._get_attr(rel, "Id"))
+        self.next_id = int(editor.get_next_rid()[3:])
+
+    def _copy_target(self, part):
+        """Part name in the old document holding the same content as the new part."""
+        source = self.new_dir / part
+        if not source.is_file():
+            raise ValueError(f"Inserted content references missing part /{part}")
+        folder, name = posixpath.split(part)
+        if (self.new_dir / folder / "_rels" / f"{name}.rels").is_file():
+            raise ValueError(
+                f"Inserted content references /{part}, which has relationships "
+                "of its own; compare() cannot copy it"
+            )
+
+        content = source.read_bytes()
+        taken = {added for _, added, _ in self.added_parts}
+        stem, suffix = posixpath.splitext(part)
+        candidate, counter = part, 1
+        while candidate in taken or (self.document.unpacked_path / candidate).exists():
+            existing = self.document.unpacked_path / candidate
+            if candidate not in taken and existing.read_bytes() == content:
+                return candidate
+            candidate = f"{stem}_{counter}{suffix}"
+            counter += 1
+        self.added_parts.append((source, candidate, self._content_type(part)))
+        return candidate
+
+    def _content_type(self, part):
+        """Content type of a part in the new document."""
+        root = self.new_content_types
+        for override in root.iter(_CONTENT_TYPES + "Override"):
+            if override.get("PartName") == "/" + part:
+                return override.get("ContentType")
+        extension = posixpath.splitext(part)[1][1:].lower()
+        for default in root.iter(_CONTENT_TYPES + "Default"):
+            if default.get("Extension", "").lower() == extension:
+                return default.get("ContentType")
+        raise ValueError(f"No content type for /{part} in the new document")
+
+    def apply(self):
+        """Add the collected parts, content types and relationships."""
+        if self.added_parts:
+            self._add_parts()
+        if self.added_rels:
+            editor = self.document[self.RELS_PATH]
+            tag = _prefixed(editor, "Relationship")
+            for rel_id, rel_type, target, mode in self.added_rels:
+                mode_xml = f' TargetMode="{mode}"' if mode else ""
+                editor.append_to(
+                    editor._root(),
+                    f'<{tag} Id="{rel_id}" Type="{html.escape(rel_type)}" '
+                    f'Target="{html.escape(target)}"{mode_xml}/>',
+                )
+
+    def _add_parts(self):
+        editor = self.document["[Content_Types].xml"]
+        defaults = {
+            editor._get_attr(default, "Extension").lower(): editor._get_attr(
+                default, "ContentType"
+            )
+            for default in editor._iter_elements(_prefixed(editor, "Default"))
+        }
+        tag = _prefixed(editor, "Override")
+        for source, part, content_type in self.added_parts:
+            destination = self.document.unpacked_path / part
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(source, destination)
+            extension = posixpath.splitext(part)[1][1:].lower()
+            if defaults.get(extension) != content_type:
+                editor.append_to(
+                    editor._root(),
+                    f'<{tag} PartName="/{part}" '
+                    f'ContentType="{html.escape(content_type)}"/>',
+                )
+
+
+def _parse(path):
+    parser = lxml.etree.XMLParser(resolve_entities=False, no_network=True)
+    return lxml.etree.parse(str(path), parser).getroot()
+
+
+def _prefixed(editor, local_name):
+    """local_name with the prefix of editor's root element, if it has one."""
+    root_tag = editor._tag_name(editor._root())
+    return root_tag.split(":")[0] + ":" + local_name if ":" in root_tag else local_name
+
+
+def _part_name(target):
+    """Package part name (without leading slash) of a target in document.xml.rels."""
+    if target.startswith("/"):
+        return posixpath.normpath(target[1:])
+    return posixpath.normpath(posixpath.join("word", target))
+
+
+def _relative_target(part, original):
+    """Target for part, written in the same (absolute or relative) form as original."""
+    if original.startswith("/"):
+        return "/" + part
+    return posixpath.relpath(part, "word")
+
+
+def _flatten(runs):
+    """Concatenated run text and, per character, the index of its run."""
+    text = "".join(t for _, t in runs)
+    owner = [i for i, (_, t) in enumerate(runs) for _ in t]
+    return text, owner
+
+
+def _offsets(tokens):
+    offsets = [0]
+    for token in tokens:
+        offsets.append(offsets[-1] + len(token))
+    return offsets
+
+
+def _segments(runs, owner, text, start, end):
+    """Split text[start:end] at run boundaries into (run, text) pieces."""
+    while start < end:
+        index = owner[start]
+        stop = start
+        while stop < end and owner[stop] == index:
+            stop += 1
+        yield runs[index][0], text[start:stop]
+        start = stop
+
+
+def _make_run(template, text, keep_attributes, deleted=False):
+    """A w:r with template's properties holding text (tabs/breaks restored)."""
+    run = lxml.etree.Element(W + "r", nsmap={"w": W[1:-1]})
+    if keep_attributes:
+        for name, value in template.attrib.items():
+            if deleted and name == W + "rsidR":
+                name = W + "rsidDel"
+            run.set(name, value)
+    props = template.find(W + "rPr")
+    if props is not None:
+        run.append(copy.deepcopy(props))
+    text_tag = W + ("delText" if deleted else "t")
+    for piece in re.split(r"([\t\n])", text):
+        if piece == "\t":
+            lxml.etree.SubElement(run, W + "tab")
+        elif piece == "\n":
+            lxml.etree.SubElement(run, W + "br")
+        elif piece:
+            elem = lxml.etree.SubElement(run, text_tag)
+            elem.text = piece
+            elem.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
+    return run
+
+
+def _wrap_content(container, change):
+    """Wrap run-level content of container in w:ins/w:del, recursing into links."""
+    wrapper = None
+    for child in list(container):
+        if not isinstance(child.tag, str) or child.tag == W + "pPr":
+            wrapper = None
+            continue
+        if child.tag in _RUN_CONTAINERS:
+            _wrap_content(child, change)
+            wrapper = None
+            continue
+        if wrapper is None:
+            wrapper = lxml.etree.Element(W + change)
+            child.addprevious(wrapper)
+        wrapper.append(child)
+
+    if change == "del":
+        renames = {W + "t": W + "delText", W + "instrText": W + "delInstrText"}
+        for elem in container.iter(*renames):
+            elem.tag = renames[elem.tag]
+        for run in container.iter(W + "r"):
+            if run.get(W + "rsidR") is not None:
+                run.set(W + "rsidDel", run.attrib.pop(W + "rsidR"))
+
+
+def _mark(elem, props_tag, inner_tag, change):
+    """Add a w:ins/w:del marker to elem's properties (paragraph mark or row)."""
+    props = elem.find(props_tag)
+    if props is None:
+        props = lxml.etree.Element(props_tag)
+        # w:trPr follows w:tblPrEx; w:pPr comes first
+        index = 1 if len(elem) and elem[0].tag == W + "tblPrEx" else 0
+        elem.insert(index, props)
+    if inner_tag is not None:
+        inner = props.find(inner_tag)
+        if inner is None:
+            inner = lxml.etree.Element(inner_tag)
+            # w:rPr precedes w:sectPr and w:pPrChange in w:pPr
+            anchor = props.find(W + "sectPr")
+            if anchor is None:
+                anchor = props.find(W + "pPrChange")
+            if anchor is not None:
+                anchor.addprevious(inner)
+            else:
+                props.append(inner)
+        # Paragraph mark markers come first in w:rPr
+        inner.insert(0, lxml.etree.Element(W + change))
+    else:
+        # Row markers follow the other row properties
+        props.append(lxml.etree.Element(W + change))
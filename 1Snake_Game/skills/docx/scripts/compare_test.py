@@ -0,0 +1,96 @@
+import unittest
+import shutil
+import tempfile
+from pathlib import Path
+
+import lxml.etree
+
+from .compare import compare
+from .document import Document
+from .document_test import write_package
+from .revisions import W, accept_changes, reject_changes
+
+
+def paragraph(text):
+    return f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>"
+
+
+def table(text):
+    return (
+        '<w:tbl><w:tblPr><w:tblW w:w="0" w:type="auto"/></w:tblPr>'
+        '<w:tblGrid><w:gridCol w:w="4000"/></w:tblGrid>'
+        f"<w:tr><w:tc>{paragraph(text)}</w:tc></w:tr></w:tbl>"
+    )
+
+
+def paragraph_texts(unpacked_dir):
+    """Text of every paragraph in the part, in document order"""
+    root = lxml.etree.parse(str(Path(unpacked_dir) / "word/document.xml")).getroot()
+    return ["".join(p.itertext()) for p in root.iter(W + "p")]
+
+
+# Run from the docx directory: python -m pytest scripts/compare_test.py
+class TestCompare(unittest.TestCase):
+
+    def setUp(self):
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.old = Path(folder.name) / "old"
+        self.new = Path(folder.name) / "new"
+
+    def test_round_trip(self):
+        """Accepting the redline gives the new text, rejecting it the old one"""
+        write_package(self.old, "".join([
+            paragraph("The quick brown fox"),
+            paragraph("First unchanged"),
+            paragraph("To be removed"),
+            paragraph("Second unchanged"),
+            table("cell one"),
+            paragraph("Third unchanged"),
+            paragraph("Last unchanged"),
+        ]))
+        write_package(self.new, "".join([
+            paragraph("The quick red fox"),
+            paragraph("First unchanged"),
+            paragraph("Second unchanged"),
+            table("cell two"),
+            paragraph("Third unchanged"),
+            paragraph("Brand new"),
+            paragraph("Last unchanged"),
+        ]))
+        old_texts, new_texts = paragraph_texts(self.old), paragraph_texts(self.new)
+
+        doc = Document(self.old)
+        counts = compare(doc, self.new)
+        # A changed table is replaced whole: one deletion and one insertion
+        self.assertEqual(counts, {"modified": 1, "inserted": 2, "deleted": 2})
+        doc.save(validate=True)
+
+        rejected = self.old.with_name("rejected")
+        shutil.copytree(self.old, rejected)
+        accept_changes(self.old)
+        reject_changes(rejected)
+        self.assertEqual(paragraph_texts(self.old), new_texts)
+        self.assertEqual(paragraph_texts(rejected), old_texts)
+
+    def test_tracked_changes_are_rejected(self):
+        write_package(self.old, paragraph("plain"))
+        write_package(
+            self.new,
+            '<w:p><w:ins w:id="1" w:author="A" w:date="2025-01-01T00:00:00Z">'
+            "<w:r><w:t>tracked</w:t></w:r></w:ins></w:p>",
+        )
+        with self.assertRaisesRegex(ValueError, "without tracked changes"):
+            compare(Document(self.old), self.new)
+
+    def test_edited_document_is_rejected(self):
+        write_package(self.old, paragraph("thirty days"))
+        write_package(self.new, paragraph("sixty days"))
+        doc = Document(self.old)
+        doc["word/document.xml"].replace_text("thirty", "forty", tracked=False)
+        with self.assertRaisesRegex(ValueError, "must run before other edits"):
+            compare(doc, self.new)
+
+
+if __name__ == '__main__':
+    unittest.main()
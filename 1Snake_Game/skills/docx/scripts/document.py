@@ -27,7 +27,9 @@ Usage:
 """
 
 import html
+import os
 import random
+import re
 import shutil
 import tempfile
 from datetime import datetime, timezone
@@ -38,7 +40,8 @@ from ooxml.scripts.pack import pack_document
 from ooxml.scripts.validation.docx import DOCXSchemaValidator
 from ooxml.scripts.validation.redlining import RedliningValidator
 
-from .utilities import XMLEditor
+from .utilities import LxmlXMLEditor, XMLEditor
+from .windowed import WindowedPart
 
 # Path to template files
 TEMPLATE_DIR = Path(__file__).parent / "templates"
@@ -72,46 +75,32 @@ class DocxXMLEditor(XMLEditor):
         self.author = author
         self.initials = initials
 
+        # w14:paraId -> paragraph for node handles, built on first use and kept
+        # current by _node_changed; ids still missing after a full scan
+        self._para_id_index = None
+        self._para_id_misses = set()
+
     def _get_next_change_id(self):
-        """Get the next available change ID by checking all tracked change elements."""
-        max_id = -1
-        for tag in ("w:ins", "w:del"):
-            elements = self.dom.getElementsByTagName(tag)
-            for elem in elements:
-                change_id = elem.getAttribute("w:id")
-                if change_id:
-                    try:
-                        max_id = max(max_id, int(change_id))
-                    except ValueError:
-                        pass
-        return max_id + 1
+        """Allocate the next change ID shared by all tracked change elements."""
+        return self._allocate_id(("w:ins", "w:del"), "w:id")
 
     def _ensure_w16du_namespace(self):
         """Ensure w16du namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w16du"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w16du",
-                "http://schemas.microsoft.com/office/word/2023/wordml/word16du",
-            )
+        self._declare_namespace(
+            "w16du", "http://schemas.microsoft.com/office/word/2023/wordml/word16du"
+        )
 
     def _ensure_w16cex_namespace(self):
         """Ensure w16cex namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w16cex"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w16cex",
-                "http://schemas.microsoft.com/office/word/2018/wordml/cex",
-            )
+        self._declare_namespace(
+            "w16cex", "http://schemas.microsoft.com/office/word/2018/wordml/cex"
+        )
 
     def _ensure_w14_namespace(self):
         """Ensure w14 namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w14"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w14",
-                "http://schemas.microsoft.com/office/word/2010/wordml",
-            )
+        self._declare_namespace(
+            "w14", "http://schemas.microsoft.com/office/word/2010/wordml"
+        )
 
     def _inject_attributes_to_nodes(self, nodes):
         """Inject RSID, author, and date attributes into DOM nodes where applicable.
@@ -130,112 +119,96 @@ class DocxXMLEditor(XMLEditor):
         from datetime import datetime, timezone
 
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-        def is_inside_deletion(elem):
-            """Check if element is inside a w:del element."""
-            parent = elem.parentNode
-            while parent:
-                if parent.nodeType == parent.ELEMENT_NODE and parent.tagName == "w:del":
-                    return True
-                parent = parent.parentNode
-            return False
-
-        def add_rsid_to_p(elem):
-            if not elem.hasAttribute("w:rsidR"):
-                elem.setAttribute("w:rsidR", self.rsid)
-            if not elem.hasAttribute("w:rsidRDefault"):
-                elem.setAttribute("w:rsidRDefault", self.rsid)
-            if not elem.hasAttribute("w:rsidP"):
-                elem.setAttribute("w:rsidP", self.rsid)
+        declared = set()
+
+        def ensure_namespace(ensure):
+            # Namespace declarations are checked once per batch, not per element
+            if ensure not in declared:
+                ensure()
+                declared.add(ensure)
+
+        def set_default(elem, name, value):
+            if not self._has_attr(elem, name):
+                self._set_attr(elem, name, value)
+
+        def add_rsid_to_p(elem, inside_del):
+            set_default(elem, "w:rsidR", self.rsid)
+            set_default(elem, "w:rsidRDefault", self.rsid)
+            set_default(elem, "w:rsidP", self.rsid)
             # Add w14:paraId and w14:textId if not present
-            if not elem.hasAttribute("w14:paraId"):
-                self._ensure_w14_namespace()
-                elem.setAttribute("w14:paraId", _generate_hex_id())
-            if not elem.hasAttribute("w14:textId"):
-                self._ensure_w14_namespace()
-                elem.setAttribute("w14:textId", _generate_hex_id())
-
-        def add_rsid_to_r(elem):
+            for name in ("w14:paraId", "w14:textId"):
+                if not self._has_attr(elem, name):
+                    ensure_namespace(self._ensure_w14_namespace)
+                    self._set_attr(elem, name, _generate_hex_id())
+            self._index_paragraph(elem)
+
+        def add_rsid_to_r(elem, inside_del):
             # Use w:rsidDel for <w:r> inside <w:del>, otherwise w:rsidR
-            if is_inside_deletion(elem):
-                if not elem.hasAttribute("w:rsidDel"):
-                    elem.setAttribute("w:rsidDel", self.rsid)
-            else:
-                if not elem.hasAttribute("w:rsidR"):
-                    elem.setAttribute("w:rsidR", self.rsid)
+            set_default(elem, "w:rsidDel" if inside_del else "w:rsidR", self.rsid)
 
-        def add_tracked_change_attrs(elem):
+        def add_tracked_change_attrs(elem, inside_del):
             # Auto-assign w:id if not present
-            if not elem.hasAttribute("w:id"):
-                elem.setAttribute("w:id", str(self._get_next_change_id()))
-            if not elem.hasAttribute("w:author"):
-                elem.setAttribute("w:author", self.author)
-            if not elem.hasAttribute("w:date"):
-                elem.setAttribute("w:date", timestamp)
+            if not self._has_attr(elem, "w:id"):
+                self._set_attr(elem, "w:id", str(self._get_next_change_id()))
+            set_default(elem, "w:author", self.author)
+            set_default(elem, "w:date", timestamp)
             # Add w16du:dateUtc for tracked changes (same as w:date since we generate UTC timestamps)
-            if elem.tagName in ("w:ins", "w:del") and not elem.hasAttribute(
-                "w16du:dateUtc"
-            ):
-                self._ensure_w16du_namespace()
-                elem.setAttribute("w16du:dateUtc", timestamp)
-
-        def add_comment_attrs(elem):
-            if not elem.hasAttribute("w:author"):
-                elem.setAttribute("w:author", self.author)
-            if not elem.hasAttribute("w:date"):
-                elem.setAttribute("w:date", timestamp)
-            if not elem.hasAttribute("w:initials"):
-                elem.setAttribute("w:initials", self.initials)
-
-        def add_comment_extensible_date(elem):
+            if not self._has_attr(elem, "w16du:dateUtc"):
+                ensure_namespace(self._ensure_w16du_namespace)
+                self._set_attr(elem, "w16du:dateUtc", timestamp)
+
+        def add_comment_attrs(elem, inside_del):
+            set_default(elem, "w:author", self.author)
+            set_default(elem, "w:date", timestamp)
+            set_default(elem, "w:initials", self.initials)
+
+        def add_comment_extensible_date(elem, inside_del):
             # Add w16cex:dateUtc for comment extensible elements
-            if not elem.hasAttribute("w16cex:dateUtc"):
-                self._ensure_w16cex_namespace()
-                elem.setAttribute("w16cex:dateUtc", timestamp)
+            if not self._has_attr(elem, "w16cex:dateUtc"):
+                ensure_namespace(self._ensure_w16cex_namespace)
+                self._set_attr(elem, "w16cex:dateUtc", timestamp)
 
-        def add_xml_space_to_t(elem):
+        def add_xml_space_to_t(elem, inside_del):
             # Add xml:space="preserve" to w:t if text has leading/trailing whitespace
-            if (
-                elem.firstChild
-                and elem.firstChild.nodeType == elem.firstChild.TEXT_NODE
-            ):
-                text = elem.firstChild.data
-                if text and (text[0].isspace() or text[-1].isspace()):
-                    if not elem.hasAttribute("xml:space"):
-                        elem.setAttribute("xml:space", "preserve")
+            text = self._leading_text(elem)
+            if text and (text[0].isspace() or text[-1].isspace()):
+                set_default(elem, "xml:space", "preserve")
+
+        handlers = {
+            "w:p": add_rsid_to_p,
+            "w:r": add_rsid_to_r,
+            "w:t": add_xml_space_to_t,
+            "w:ins": add_tracked_change_attrs,
+            "w:del": add_tracked_change_attrs,
+            "w:comment": add_comment_attrs,
+            "w16cex:commentExtensible": add_comment_extensible_date,
+        }
 
         for node in nodes:
-            if node.nodeType != node.ELEMENT_NODE:
+            if not self._is_element(node):
                 continue
 
-            # Handle the node itself
-            if node.tagName == "w:p":
-                add_rsid_to_p(node)
-            elif node.tagName == "w:r":
-                add_rsid_to_r(node)
-            elif node.tagName == "w:t":
-                add_xml_space_to_t(node)
-            elif node.tagName in ("w:ins", "w:del"):
-                add_tracked_change_attrs(node)
-            elif node.tagName == "w:comment":
-                add_comment_attrs(node)
-            elif node.tagName == "w16cex:commentExtensible":
-                add_comment_extensible_date(node)
-
-            # Process descendants (getElementsByTagName doesn't return the element itself)
-            for elem in node.getElementsByTagName("w:p"):
-                add_rsid_to_p(elem)
-            for elem in node.getElementsByTagName("w:r"):
-                add_rsid_to_r(elem)
-            for elem in node.getElementsByTagName("w:t"):
-                add_xml_space_to_t(elem)
-            for tag in ("w:ins", "w:del"):
-                for elem in node.getElementsByTagName(tag):
-                    add_tracked_change_attrs(elem)
-            for elem in node.getElementsByTagName("w:comment"):
-                add_comment_attrs(elem)
-            for elem in node.getElementsByTagName("w16cex:commentExtensible"):
-                add_comment_extensible_date(elem)
+            # Only the inserted root looks at its ancestors; below it the
+            # "inside w:del" flag is carried down the traversal
+            inside_del = False
+            parent = self._parent(node)
+            while parent is not None:
+                if self._tag_name(parent) == "w:del":
+                    inside_del = True
+                    break
+                parent = self._parent(parent)
+
+            # Single depth-first pass in document order (keeps id allocation order)
+            stack = [(node, inside_del)]
+            while stack:
+                elem, inside_del = stack.pop()
+                tag = self._tag_name(elem)
+                handler = handlers.get(tag)
+                if handler is not None:
+                    handler(elem, inside_del)
+                inside_del = inside_del or tag == "w:del"
+                children = self._child_elements(elem)
+                stack.extend((child, inside_del) for child in reversed(children))
 
     def replace_node(self, elem, new_content):
         """Replace node with automatic attribute injection."""
@@ -261,10 +234,18 @@ class DocxXMLEditor(XMLEditor):
         self._inject_attributes_to_nodes(nodes)
         return nodes
 
+    def batch_insert(self, operations):
+        """Batch insertion with automatic attribute injection."""
+        results = super().batch_insert(operations)
+        self._inject_attributes_to_nodes([node for nodes in results for node in nodes])
+        return results
+
     def revert_insertion(self, elem):
         """Reject an insertion by wrapping its content in a deletion.
 
         Wraps all runs inside w:ins in w:del, converting w:t to w:delText.
+        An inserted paragraph mark or table row gets a w:del marker next to
+        its w:ins marker.
         Can process a single w:ins element or a container element with multiple w:ins.
 
         Args:
@@ -286,56 +267,27 @@ class DocxXMLEditor(XMLEditor):
             doc["word/document.xml"].revert_insertion(para)
         """
         # Collect insertions
+        tag = self._tag_name(elem)
         ins_elements = []
-        if elem.tagName == "w:ins":
+        if tag == "w:ins":
             ins_elements.append(elem)
         else:
-            ins_elements.extend(elem.getElementsByTagName("w:ins"))
+            ins_elements.extend(self._descendants(elem, "w:ins"))
 
         # Validate that there are insertions to reject
         if not ins_elements:
             raise ValueError(
                 f"revert_insertion requires w:ins elements. "
-                f"The provided element <{elem.tagName}> contains no insertions. "
+                f"The provided element <{tag}> contains no insertions. "
             )
 
         # Process all insertions - wrap all children in w:del
+        created = []
         for ins_elem in ins_elements:
-            runs = list(ins_elem.getElementsByTagName("w:r"))
-            if not runs:
-                continue
+            self._revert_insertion(ins_elem, created)
 
-            # Create deletion wrapper
-            del_wrapper = self.dom.createElement("w:del")
-
-            # Process each run
-            for run in runs:
-                # Convert w:t → w:delText and w:rsidR → w:rsidDel
-                if run.hasAttribute("w:rsidR"):
-                    run.setAttribute("w:rsidDel", run.getAttribute("w:rsidR"))
-                    run.removeAttribute("w:rsidR")
-                elif not run.hasAttribute("w:rsidDel"):
-                    run.setAttribute("w:rsidDel", self.rsid)
-
-                for t_elem in list(run.getElementsByTagName("w:t")):
-                    del_text = self.dom.createElement("w:delText")
-                    # Copy ALL child nodes (not just firstChild) to handle entities
-                    while t_elem.firstChild:
-                        del_text.appendChild(t_elem.firstChild)
-                    for i in range(t_elem.attributes.length):
-                        attr = t_elem.attributes.item(i)
-                        del_text.setAttribute(attr.name, attr.value)
-                    t_elem.parentNode.replaceChild(del_text, t_elem)
-
-            # Move all children from ins to del wrapper
-            while ins_elem.firstChild:
-                del_wrapper.appendChild(ins_elem.firstChild)
-
-            # Add del wrapper back to ins
-            ins_elem.appendChild(del_wrapper)
-
-            # Inject attributes to the deletion wrapper
-            self._inject_attributes_to_nodes([del_wrapper])
+        # Inject attributes to the deletion wrappers
+        self._inject_attributes_to_nodes(created)
 
         return [elem]
 
@@ -343,7 +295,8 @@ class DocxXMLEditor(XMLEditor):
         """Reject a deletion by re-inserting the deleted content.
 
         Creates w:ins elements after each w:del, copying deleted content and
-        converting w:delText back to w:t.
+        converting w:delText back to w:t. Deleted paragraph marks and table
+        rows hold no runs and are left as they are (see revert_all).
         Can process a single w:del element or a container element with multiple w:del.
 
         Args:
@@ -366,66 +319,38 @@ class DocxXMLEditor(XMLEditor):
         """
         # Collect deletions FIRST - before we modify the DOM
         del_elements = []
-        is_single_del = elem.tagName == "w:del"
+        tag = self._tag_name(elem)
+        is_single_del = tag == "w:del"
 
         if is_single_del:
             del_elements.append(elem)
         else:
-            del_elements.extend(elem.getElementsByTagName("w:del"))
+            del_elements.extend(self._descendants(elem, "w:del"))
 
         # Validate that there are deletions to reject
         if not del_elements:
             raise ValueError(
                 f"revert_deletion requires w:del elements. "
-                f"The provided element <{elem.tagName}> contains no deletions. "
+                f"The provided element <{tag}> contains no deletions. "
             )
 
         # Track created insertion (only relevant if elem is a single w:del)
         created_insertion = None
 
         # Process all deletions - create insertions that copy the deleted content
+        created = []
         for del_elem in del_elements:
-            # Clone the deleted runs and convert them to insertions
-            runs = list(del_elem.getElementsByTagName("w:r"))
-            if not runs:
-                continue
-
-            # Create insertion wrapper
-            ins_elem = self.dom.createElement("w:ins")
-
-            for run in runs:
-                # Clone the run
-                new_run = run.cloneNode(True)
-
-                # Convert w:delText → w:t
-                for del_text in list(new_run.getElementsByTagName("w:delText")):
-                    t_elem = self.dom.createElement("w:t")
-                    # Copy ALL child nodes (not just firstChild) to handle entities
-                    while del_text.firstChild:
-                        t_elem.appendChild(del_text.firstChild)
-                    for i in range(del_text.attributes.length):
-                        attr = del_text.attributes.item(i)
-                        t_elem.setAttribute(attr.name, attr.value)
-                    del_text.parentNode.replaceChild(t_elem, del_text)
-
-                # Update run attributes: w:rsidDel → w:rsidR
-                if new_run.hasAttribute("w:rsidDel"):
-                    new_run.setAttribute("w:rsidR", new_run.getAttribute("w:rsidDel"))
-                    new_run.removeAttribute("w:rsidDel")
-                elif not new_run.hasAttribute("w:rsidR"):
-                    new_run.setAttribute("w:rsidR", self.rsid)
-
-                ins_elem.appendChild(new_run)
-
-            # Insert the new insertion after the deletion
-            nodes = self.insert_after(del_elem, ins_elem.toxml())
+            ins_elem = self._revert_deletion(del_elem, created)
 
             # If processing a single w:del, track the created insertion
-            if is_single_del and nodes:
-                created_insertion = nodes[0]
+            if is_single_del:
+                created_insertion = ins_elem
+
+        # Inject attributes to the new insertions
+        self._inject_attributes_to_nodes(created)
 
         # Return based on input type
-        if is_single_del and created_insertion:
+        if is_single_del and created_insertion is not None:
             return [elem, created_insertion]
         else:
             return [elem]
@@ -495,102 +420,573 @@ class DocxXMLEditor(XMLEditor):
         Raises:
             ValueError: If element has existing tracked changes or invalid structure
         """
-        if elem.nodeName == "w:r":
-            # Check for existing w:delText
-            if elem.getElementsByTagName("w:delText"):
+        created = []
+        result = self._suggest_deletion(elem, created)
+
+        # Inject attributes to the deletion wrapper
+        self._inject_attributes_to_nodes(created)
+
+        return result
+
+    def suggest_deletions(self, elems):
+        """Mark many w:r or w:p elements as deleted (see suggest_deletion).
+
+        All elements are checked before any is changed, and attributes are
+        injected into the new deletion wrappers in one pass.
+
+        Args:
+            elems: Iterable of w:r or w:p elements without existing tracked changes
+
+        Returns:
+            list: The modified element for each input, as suggest_deletion returns
+
+        Raises:
+            ValueError: If any element has existing tracked changes or invalid structure
+
+        Example:
+            editor = doc["word/document.xml"]
+            runs = [editor.get_node(tag="w:r", contains=t) for t in ("draft", "TBD")]
+            editor.suggest_deletions(runs)
+        """
+        elems = list(elems)
+        for elem in elems:
+            self._check_deletable(elem)
+
+        created = []
+        results = [self._suggest_deletion(elem, created) for elem in elems]
+        self._inject_attributes_to_nodes(created)
+        return results
+
+    def insert_runs(self, anchor_pairs):
+        """Insert many runs as tracked insertions after their anchors.
+
+        Each run XML is wrapped in <w:ins> and placed after its anchor. All
+        fragments are parsed together and attributes are injected once.
+
+        Args:
+            anchor_pairs: Iterable of (anchor_element, run_xml) pairs, where
+                run_xml holds one or more <w:r> elements
+
+        Returns:
+            list: The new w:ins element for each pair
+
+        Example:
+            del_node = doc["word/document.xml"].suggest_deletion(run)
+            doc["word/document.xml"].insert_runs(
+                [(del_node, "<w:r><w:t>replacement</w:t></w:r>")]
+            )
+        """
+        operations = [
+            ("insert_after", anchor, f"<w:ins>{run_xml}</w:ins>")
+            for anchor, run_xml in anchor_pairs
+        ]
+        return [nodes[0] for nodes in self.batch_insert(operations)]
+
+    def revert_all(self, author=None):
+        """Reject every tracked change, optionally only those by one author.
+
+        Insertions are wrapped in w:del and deletions are re-inserted as w:ins,
+        exactly as revert_insertion and revert_deletion do, after a single
+        traversal that collects the changes. Deletions nested inside a rejected
+        insertion are left alone since their content is removed with it.
+        Inserted paragraph marks and table rows get a w:del marker next to
+        their w:ins marker. Deleted ones (a w:del marker in w:pPr/w:rPr or
+        w:trPr) are skipped: restoring them cannot be recorded as a further
+        tracked change, so they stay deleted.
+
+        Args:
+            author: Only reject changes whose w:author matches (default: all authors)
+
+        Returns:
+            list: The new w:del and w:ins elements
+
+        Example:
+            doc["word/document.xml"].revert_all(author="Claude")
+        """
+        ins_elements = []
+        del_elements = []
+        stack = [(self._root(), False)]
+        while stack:
+            elem, inside_ins = stack.pop()
+            tag = self._tag_name(elem)
+            selected = tag in ("w:ins", "w:del") and (
+                author is None or self._get_attr(elem, "w:author") == author
+            )
+            if selected and tag == "w:ins":
+                ins_elements.append(elem)
+                inside_ins = True
+            elif selected and tag == "w:del" and not inside_ins and not self._is_marker(elem):
+                del_elements.append(elem)
+            children = self._child_elements(elem)
+            stack.extend((child, inside_ins) for child in reversed(children))
+
+        created = []
+        for del_elem in del_elements:
+            self._revert_deletion(del_elem, created)
+        for ins_elem in ins_elements:
+            self._revert_insertion(ins_elem, created)
+
+        self._inject_attributes_to_nodes(created)
+        return created
+
+    def replace_text(self, pattern, replacement, regex=False, tracked=True):
+        """Replace text everywhere in the part, even where it spans several runs.
+
+        Each paragraph (and each hyperlink or similar container inside it) is
+        read as sequences of plain text runs, concatenated with a map from
+        character offsets back to runs. All matches are found before anything
+        changes; runs are then split at match boundaries so formatting around
+        each match is untouched. Runs holding anything besides w:rPr and one
+        w:t (tabs, breaks, fields, drawings) and existing tracked changes end
+        a sequence, so matches never cross them.
+
+        Args:
+            pattern: Text to find, or a regular expression if regex is True
+            replacement: Replacement text; with regex, backreferences such as
+                \\1 or \\g<name> are expanded as in re.sub
+            regex: Treat pattern as a regular expression (default: literal)
+            tracked: Record each replacement as a tracked deletion of the
+                matched runs followed by a tracked insertion with the first
+                run's formatting (default). If False, edit the text in place.
+
+        Returns:
+            int: Number of replacements made
+
+        Example:
+            editor = doc["word/document.xml"]
+            editor.replace_text("30 days", "60 days")
+            editor.replace_text(r"Section (\\d+)", r"Clause \\1", regex=True)
+        """
+        compiled = re.compile(pattern if regex else re.escape(pattern))
+
+        # Find every match before changing anything
+        found = []
+        for paragraph in self._iter_elements("w:p"):
+            for runs in self._text_run_sequences(paragraph):
+                texts = [self._text_content(self._child_elements(r)[-1]) for r in runs]
+                matches = [
+                    m for m in compiled.finditer("".join(texts)) if m.end() > m.start()
+                ]
+                if matches:
+                    found.append((runs, texts, matches))
+
+        created = []
+        for runs, texts, matches in found:
+            pieces = self._split_runs(runs, texts, matches)
+            for match in matches:
+                text = match.expand(replacement) if regex else replacement
+                matched = [
+                    run for start, end, run in pieces
+                    if start >= match.start() and end <= match.end()
+                ]
+                if tracked:
+                    self._replace_runs_tracked(matched, text, created)
+                else:
+                    self._replace_runs(matched, text)
+
+        self._inject_attributes_to_nodes(created)
+        return sum(len(matches) for _, _, matches in found)
+
+    def get_handle(self, elem):
+        """Get a stable string handle for an element (see XMLEditor.get_handle).
+
+        Handles are anchored on the w14:paraId of the nearest paragraph. A
+        paragraph without one is given a new paraId when the handle is issued
+        (declaring the w14 namespace if needed), so issuing a handle edits the
+        part: it becomes dirty and save() writes the paraId, which is what
+        lets the handle resolve after reloading.
+        """
+        return super().get_handle(elem)
+
+    def invalidate_text_cache(self):
+        super().invalidate_text_cache()
+        self._para_id_index = None
+
+    def _node_changed(self, parent, inserted=(), removed=()):
+        super()._node_changed(parent, inserted, removed)
+        if self._para_id_index is None:
+            return
+        for node in removed:
+            for elem in self._subtree_elements(node):
+                if self._tag_name(elem) != "w:p":
+                    continue
+                key = (self._get_attr(elem, "w14:paraId") or "").upper()
+                if self._para_id_index.get(key) is elem:
+                    del self._para_id_index[key]
+        for node in inserted:
+            for elem in self._subtree_elements(node):
+                if self._tag_name(elem) == "w:p":
+                    self._index_paragraph(elem)
+
+    # ==================== Private: node handles ====================
+    # Handles are anchored on the w14:paraId of the nearest paragraph, which
+    # is stored in the part itself, so they survive save() and reloading.
+
+    def _make_handle(self, elem):
+        """Handle "PARAID", "PARAID/w:r[2]" (inside it) or "PARAID^n" (n levels up)."""
+        steps = []
+        node = elem
+        while self._tag_name(node) != "w:p":
+            parent = self._parent(node)
+            if parent is None:
+                break
+            steps.append(self._path_step(node))
+            node = parent
+        else:
+            return self._ensure_para_id(node) + "".join(
+                f"/{step}" for step in reversed(steps)
+            )
+
+        # Not inside a paragraph (e.g. a table): go up from its first paragraph
+        paragraphs = self._descendants(elem, "w:p")
+        if not paragraphs:
+            return super()._make_handle(elem)
+        levels = 0
+        node = paragraphs[0]
+        while node is not elem:
+            node = self._parent(node)
+            levels += 1
+        return f"{self._ensure_para_id(paragraphs[0])}^{levels}"
+
+    def _locate_handle(self, handle):
+        match = _HANDLE_PATTERN.fullmatch(handle)
+        if match is None:
+            return super()._locate_handle(handle)
+        para_id, path, levels = match.groups()
+        elem = self._paragraph_with_id(para_id)
+        if elem is None:
+            return None
+        for _ in range(int(levels or 0)):
+            elem = self._parent(elem)
+            if elem is None:
+                return None
+        return self._follow_path(elem, path)
+
+    def _retarget_handle(self, old, nodes):
+        # A paragraph replaced by a new one keeps its paraId, so the handle
+        # still resolves after the part is saved and reloaded
+        handle = self._handle_of.get(old)
+        if handle is not None and _HANDLE_PATTERN.fullmatch(handle) and len(handle) == 8:
+            new_paragraph = next((n for n in nodes if self._is_element(n)), None)
+            if (
+                new_paragraph is not None
+                and self._tag_name(new_paragraph) == "w:p"
+                and not self._has_attr(new_paragraph, "w14:paraId")
+            ):
+                self._set_attr(new_paragraph, "w14:paraId", handle)
+        super()._retarget_handle(old, nodes)
+
+    def _ensure_para_id(self, paragraph):
+        """The paragraph's w14:paraId, assigning an unused one if it has none."""
+        if not self._has_attr(paragraph, "w14:paraId"):
+            index = self._para_ids()
+            para_id = _generate_hex_id()
+            while para_id in index:
+                para_id = _generate_hex_id()
+            self._ensure_w14_namespace()
+            self._set_attr(paragraph, "w14:paraId", para_id)
+            self._index_paragraph(paragraph)
+        return self._get_attr(paragraph, "w14:paraId")
+
+    def _para_ids(self):
+        """The paraId index, built by one scan on first use."""
+        if self._para_id_index is None:
+            self._para_id_index = {}
+            self._para_id_misses = set()
+            for paragraph in self._iter_elements("w:p"):
+                self._index_paragraph(paragraph)
+        return self._para_id_index
+
+    def _index_paragraph(self, paragraph):
+        """Index a paragraph by paraId unless an attached paragraph holds the id."""
+        value = self._get_attr(paragraph, "w14:paraId")
+        if not value or self._para_id_index is None:
+            return
+        key = value.upper()
+        current = self._para_id_index.get(key)
+        if current is None or not self._is_attached(current):
+            self._para_id_index[key] = paragraph
+            self._para_id_misses.discard(key)
+
+    def _paragraph_with_id(self, para_id):
+        """
+        Paragraph with the given w14:paraId, or None.
+
+        The index follows edits made through the editor. A miss rescans the
+        part once, for paraIds set by direct edits, and is then remembered.
+        """
+        self._check_handed_out()
+        para_id = para_id.upper()
+        paragraph = self._para_ids().get(para_id)
+        if paragraph is not None and self._is_attached(paragraph):
+            if (self._get_attr(paragraph, "w14:paraId") or "").upper() == para_id:
+                return paragraph
+        if para_id in self._para_id_misses:
+            return None
+
+        self._para_id_index = None
+        paragraph = self._para_ids().get(para_id)
+        if paragraph is None:
+            self._para_id_misses.add(para_id)
+        return paragraph
+
+    # ==================== Private: text replacement helpers ====================
+
+    def _text_run_sequences(self, container):
+        """Lists of consecutive plain text runs (w:rPr plus one w:t) in container.
+
+        Markers that carry no text (bookmarks, comment ranges, proofing marks)
+        do not interrupt a sequence. Hyperlinks, smart tags and custom XML are
+        searched as sequences of their own; anything else ends the sequence.
+        """
+        sequences = [[]]
+        for child in self._child_elements(container):
+            tag = self._tag_name(child)
+            if tag == "w:r":
+                children = [self._tag_name(c) for c in self._child_elements(child)]
+                if children in (["w:t"], ["w:rPr", "w:t"]):
+                    sequences[-1].append(child)
+                    continue
+            elif tag in _TRANSPARENT_RUN_SIBLINGS:
+                continue
+            elif tag in _RUN_CONTAINERS:
+                sequences.extend(self._text_run_sequences(child))
+            sequences.append([])
+        return [runs for runs in sequences if runs]
+
+    def _split_runs(self, runs, texts, matches):
+        """Split runs at match boundaries.
+
+        Returns:
+            list: (start, end, run) for every resulting run, with offsets into
+            the concatenated text of runs
+        """
+        cuts = sorted({m.start() for m in matches} | {m.end() for m in matches})
+        pieces = []
+        offset = 0
+        for run, text in zip(runs, texts):
+            start, end = offset, offset + len(text)
+            offset = end
+            bounds = [start] + [c for c in cuts if start < c < end] + [end]
+            segments = list(zip(bounds, bounds[1:]))
+            clones = [self._clone(run) for _ in segments[1:]]
+            for piece, (seg_start, seg_end) in zip([run] + clones, segments):
+                self._set_run_text(piece, text[seg_start - start:seg_end - start])
+                pieces.append((seg_start, seg_end, piece))
+            if clones:
+                self._place_after(run, clones)
+        return pieces
+
+    def _set_run_text(self, run, text):
+        """Set the text of a plain text run's w:t, preserving edge whitespace."""
+        t_elem = self._child_elements(run)[-1]
+        self._set_text(t_elem, text)
+        if text and (text[0].isspace() or text[-1].isspace()):
+            self._set_attr(t_elem, "xml:space", "preserve")
+
+    def _replace_runs_tracked(self, runs, text, created):
+        """Delete runs and insert text after them, collecting new wrappers."""
+        if text:
+            # The insertion takes the formatting of the first matched run
+            new_run = self._clone(runs[0])
+            self._set_run_text(new_run, text)
+            self._set_attr(new_run, "w:rsidR", self.rsid)
+            if self._has_attr(new_run, "w:rsidRPr"):
+                self._remove_attr(new_run, "w:rsidRPr")
+
+        for run in runs:
+            last = self._suggest_deletion(run, created)
+
+        if text:
+            ins_elem = self._create_element("w:ins")
+            self._append_child(ins_elem, new_run)
+            self._place_after(last, [ins_elem])
+            created.append(ins_elem)
+
+    def _replace_runs(self, runs, text):
+        """Put text in the first run and remove the rest (untracked)."""
+        if text:
+            self._set_run_text(runs[0], text)
+            runs = runs[1:]
+        for run in runs:
+            self._place_replace(run, [])
+
+    # ==================== Private: tracked change helpers ====================
+    # These change one element without injecting attributes; new wrappers are
+    # appended to `created` so callers can inject them in one pass.
+
+    def _mark_run_deleted(self, run):
+        """Convert a run's w:rsidR to w:rsidDel (or add w:rsidDel)."""
+        if self._has_attr(run, "w:rsidR"):
+            self._set_attr(run, "w:rsidDel", self._get_attr(run, "w:rsidR"))
+            self._remove_attr(run, "w:rsidR")
+        elif not self._has_attr(run, "w:rsidDel"):
+            self._set_attr(run, "w:rsidDel", self.rsid)
+
+    def _check_deletable(self, elem):
+        """Raise ValueError if suggest_deletion cannot be applied to elem."""
+        tag = self._tag_name(elem)
+        if tag == "w:r":
+            if self._descendants(elem, "w:delText"):
                 raise ValueError("w:r element already contains w:delText")
+        elif tag == "w:p":
+            if self._descendants(elem, "w:ins") or self._descendants(elem, "w:del"):
+                raise ValueError("w:p element already contains tracked changes")
+        else:
+            raise ValueError(f"Element must be w:r or w:p, got {tag}")
 
-            # Convert w:t → w:delText
-            for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
-                # Copy ALL child nodes (not just firstChild) to handle entities
-                while t_elem.firstChild:
-                    del_text.appendChild(t_elem.firstChild)
-                # Preserve attributes like xml:space
-                for i in range(t_elem.attributes.length):
-                    attr = t_elem.attributes.item(i)
-                    del_text.setAttribute(attr.name, attr.value)
-                t_elem.parentNode.replaceChild(del_text, t_elem)
+    def _suggest_deletion(self, elem, created):
+        """Apply suggest_deletion to elem, collecting the new w:del wrapper."""
+        self._check_deletable(elem)
+        tag = self._tag_name(elem)
+        if tag == "w:r":
+            # Convert w:t → w:delText (attributes like xml:space are preserved)
+            for t_elem in list(self._descendants(elem, "w:t")):
+                self._rename_element(t_elem, "w:delText")
 
             # Update run attributes: w:rsidR → w:rsidDel
-            if elem.hasAttribute("w:rsidR"):
-                elem.setAttribute("w:rsidDel", elem.getAttribute("w:rsidR"))
-                elem.removeAttribute("w:rsidR")
-            elif not elem.hasAttribute("w:rsidDel"):
-                elem.setAttribute("w:rsidDel", self.rsid)
+            self._mark_run_deleted(elem)
 
             # Wrap in w:del
-            del_wrapper = self.dom.createElement("w:del")
-            parent = elem.parentNode
-            parent.insertBefore(del_wrapper, elem)
-            parent.removeChild(elem)
-            del_wrapper.appendChild(elem)
-
-            # Inject attributes to the deletion wrapper
-            self._inject_attributes_to_nodes([del_wrapper])
+            del_wrapper = self._wrap(elem, "w:del")
+            self._node_changed(self._parent(del_wrapper), inserted=[del_wrapper])
+            created.append(del_wrapper)
 
             return del_wrapper
 
-        elif elem.nodeName == "w:p":
-            # Check for existing tracked changes
-            if elem.getElementsByTagName("w:ins") or elem.getElementsByTagName("w:del"):
-                raise ValueError("w:p element already contains tracked changes")
+        # Check if it's a numbered list item
+        pPr_list = self._descendants(elem, "w:pPr")
+        is_numbered = pPr_list and self._descendants(pPr_list[0], "w:numPr")
 
-            # Check if it's a numbered list item
-            pPr_list = elem.getElementsByTagName("w:pPr")
-            is_numbered = pPr_list and pPr_list[0].getElementsByTagName("w:numPr")
+        if is_numbered:
+            # Add <w:del/> to w:rPr in w:pPr
+            pPr = pPr_list[0]
+            rPr_list = self._descendants(pPr, "w:rPr")
 
-            if is_numbered:
-                # Add <w:del/> to w:rPr in w:pPr
-                pPr = pPr_list[0]
-                rPr_list = pPr.getElementsByTagName("w:rPr")
+            if not rPr_list:
+                rPr = self._create_element("w:rPr")
+                self._append_child(pPr, rPr)
+            else:
+                rPr = rPr_list[0]
+
+            # Add <w:del/> marker
+            self._prepend_child(rPr, self._create_element("w:del"))
+
+        # Convert w:t → w:delText in all runs
+        for t_elem in list(self._descendants(elem, "w:t")):
+            self._rename_element(t_elem, "w:delText")
+
+        # Update run attributes: w:rsidR → w:rsidDel
+        for run in self._descendants(elem, "w:r"):
+            self._mark_run_deleted(run)
+
+        # Wrap all non-pPr children in <w:del>
+        del_wrapper = self._wrap_children(elem, "w:del", skip=("w:pPr",))
+        self._node_changed(elem, inserted=[del_wrapper])
+        created.append(del_wrapper)
+
+        return elem
+
+    def _is_marker(self, change):
+        """Check whether a w:ins/w:del marks a paragraph mark or table row."""
+        parent = self._parent(change)
+        return parent is not None and self._tag_name(parent) in _MARKER_PARENTS
+
+    def _revert_insertion(self, ins_elem, created):
+        """Wrap the content of one w:ins in w:del, collecting the wrapper."""
+        if self._is_marker(ins_elem):
+            # An inserted paragraph mark or row is rejected by a deletion marker
+            siblings = self._child_elements(self._parent(ins_elem))
+            following = siblings[siblings.index(ins_elem) + 1 :]
+            if following and self._tag_name(following[0]) == "w:del":
+                return None
+            del_marker = self._create_element("w:del")
+            self._place_after(ins_elem, [del_marker])
+            created.append(del_marker)
+            return del_marker
+
+        runs = list(self._descendants(ins_elem, "w:r"))
+        if not runs:
+            return None
+
+        # Convert w:t → w:delText and w:rsidR → w:rsidDel
+        for run in runs:
+            self._mark_run_deleted(run)
+            for t_elem in list(self._descendants(run, "w:t")):
+                self._rename_element(t_elem, "w:delText")
+
+        # Move all children from ins into a deletion wrapper
+        del_wrapper = self._wrap_children(ins_elem, "w:del")
+        self._node_changed(ins_elem, inserted=[del_wrapper])
+        created.append(del_wrapper)
+        return del_wrapper
+
+    def _revert_deletion(self, del_elem, created):
+        """Place a w:ins copying one w:del's runs after it, collecting it."""
+        # Clone the deleted runs and convert them to insertions
+        runs = list(self._descendants(del_elem, "w:r"))
+        if not runs:
+            return None
+
+        # Create insertion wrapper
+        ins_elem = self._create_element("w:ins")
+
+        for run in runs:
+            # Clone the run
+            new_run = self._clone(run)
+
+            # Convert w:delText → w:t
+            for del_text in list(self._descendants(new_run, "w:delText")):
+                self._rename_element(del_text, "w:t")
+
+            # Update run attributes: w:rsidDel → w:rsidR
+            if self._has_attr(new_run, "w:rsidDel"):
+                self._set_attr(new_run, "w:rsidR", self._get_attr(new_run, "w:rsidDel"))
+                self._remove_attr(new_run, "w:rsidDel")
+            elif not self._has_attr(new_run, "w:rsidR"):
+                self._set_attr(new_run, "w:rsidR", self.rsid)
+
+            self._append_child(ins_elem, new_run)
+
+        # Insert the new insertion after the deletion
+        self._place_after(del_elem, [ins_elem])
+        created.append(ins_elem)
+        return ins_elem
+
+
+class LxmlDocxXMLEditor(DocxXMLEditor, LxmlXMLEditor):
+    """DocxXMLEditor running on the lxml backend.
+
+    Provides the same tracked-change and attribute-injection behavior as
+    DocxXMLEditor with lxml elements, for parts too large to hold as a
+    minidom DOM comfortably.
 
-                if not rPr_list:
-                    rPr = self.dom.createElement("w:rPr")
-                    pPr.appendChild(rPr)
-                else:
-                    rPr = rPr_list[0]
-
-                # Add <w:del/> marker
-                del_marker = self.dom.createElement("w:del")
-                rPr.insertBefore(
-                    del_marker, rPr.firstChild
-                ) if rPr.firstChild else rPr.appendChild(del_marker)
-
-            # Convert w:t → w:delText in all runs
-            for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
-                # Copy ALL child nodes (not just firstChild) to handle entities
-                while t_elem.firstChild:
-                    del_text.appendChild(t_elem.firstChild)
-                # Preserve attributes like xml:space
-                for i in range(t_elem.attributes.length):
-                    attr = t_elem.attributes.item(i)
-                    del_text.setAttribute(attr.name, attr.value)
-                t_elem.parentNode.replaceChild(del_text, t_elem)
+    Attributes:
+        tree (lxml.etree._ElementTree): The parsed document
+        root (lxml.etree._Element): Root element of tree
+    """
 
-            # Update run attributes: w:rsidR → w:rsidDel
-            for run in elem.getElementsByTagName("w:r"):
-                if run.hasAttribute("w:rsidR"):
-                    run.setAttribute("w:rsidDel", run.getAttribute("w:rsidR"))
-                    run.removeAttribute("w:rsidR")
-                elif not run.hasAttribute("w:rsidDel"):
-                    run.setAttribute("w:rsidDel", self.rsid)
 
-            # Wrap all non-pPr children in <w:del>
-            del_wrapper = self.dom.createElement("w:del")
-            for child in [c for c in elem.childNodes if c.nodeName != "w:pPr"]:
-                elem.removeChild(child)
-                del_wrapper.appendChild(child)
-            elem.appendChild(del_wrapper)
+# Node handle: paraId, then a child path below it or a number of levels above it
+_HANDLE_PATTERN = re.compile(r"([0-9A-Fa-f]{8})((?:/[^/\[\]^]+\[\d+\])*)(?:\^(\d+))?")
 
-            # Inject attributes to the deletion wrapper
-            self._inject_attributes_to_nodes([del_wrapper])
+# Paragraph children that hold no text and may sit between the runs of a match
+_TRANSPARENT_RUN_SIBLINGS = {
+    "w:proofErr",
+    "w:bookmarkStart",
+    "w:bookmarkEnd",
+    "w:commentRangeStart",
+    "w:commentRangeEnd",
+    "w:permStart",
+    "w:permEnd",
+}
 
-            return elem
+# Paragraph children whose runs replace_text searches separately
+_RUN_CONTAINERS = {"w:hyperlink", "w:smartTag", "w:customXml"}
 
-        else:
-            raise ValueError(f"Element must be w:r or w:p, got {elem.nodeName}")
+# Property elements whose w:ins/w:del mark an inserted or deleted paragraph
+# mark (w:pPr/w:rPr) or table row (w:trPr)
+_MARKER_PARENTS = {"w:rPr", "w:trPr"}
 
 
 def _generate_hex_id() -> str:
@@ -604,6 +1000,23 @@ def _generate_hex_id() -> str:
     return f"{random.randint(1, 0x7FFFFFFE):08X}"
 
 
+def _generate_hex_ids(count) -> list[str]:
+    """Generate count distinct IDs in the range _generate_hex_id uses."""
+    return [f"{value:08X}" for value in random.sample(range(1, 0x7FFFFFFF), count)]
+
+
+def _link_tree(src, dst):
+    """Mirror directory src at dst using hard links, copying where linking fails."""
+
+    def link_or_copy(src_file, dst_file):
+        try:
+            os.link(src_file, dst_file)
+        except OSError:
+            shutil.copy2(src_file, dst_file)
+
+    shutil.copytree(src, dst, copy_function=link_or_copy)
+
+
 def _generate_rsid() -> str:
     """Generate random 8-character hex RSID."""
     return "".join(random.choices("0123456789ABCDEF", k=8))
@@ -619,31 +1032,48 @@ class Document:
         track_revisions=False,
         author="Claude",
         initials="C",
+        original_docx=None,
+        lxml_parts=(),
+        windowed=False,
     ):
         """
         Initialize with path to unpacked Word document directory.
         Automatically sets up comment infrastructure (people.xml, RSIDs).
 
+        The working copy hard-links the original files (falling back to a
+        copy where links are unsupported); edited parts are written as new
+        files, so the original directory is only changed by save().
+
         Args:
             unpacked_dir: Path to unpacked DOCX directory (must contain word/ subdirectory)
             rsid: Optional RSID to use for all comment elements. If not provided, one will be generated.
             track_revisions: If True, enables track revisions in settings.xml (default: False)
             author: Default author name for comments (default: "Claude")
             initials: Default author initials for comments (default: "C")
+            original_docx: Optional path to the source .docx, used as the validation
+                baseline instead of packing unpacked_dir on first validation
+            lxml_parts: Parts to edit with LxmlDocxXMLEditor instead of DocxXMLEditor,
+                e.g. ["word/document.xml"] for very large documents. Any part may
+                be listed; Document's own bookkeeping works with either backend
+            windowed: If True, word/document.xml is never parsed whole; edit it
+                through window() instead of doc["word/document.xml"]
         """
         self.original_path = Path(unpacked_dir)
 
         if not self.original_path.exists() or not self.original_path.is_dir():
             raise ValueError(f"Directory not found: {unpacked_dir}")
 
+        if original_docx is not None and not Path(original_docx).is_file():
+            raise ValueError(f"File not found: {original_docx}")
+
         # Create temporary directory with subdirectories for unpacked content and baseline
         self.temp_dir = tempfile.mkdtemp(prefix="docx_")
         self.unpacked_path = Path(self.temp_dir) / "unpacked"
-        shutil.copytree(self.original_path, self.unpacked_path)
+        _link_tree(self.original_path, self.unpacked_path)
 
-        # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
-        self.original_docx = Path(self.temp_dir) / "original.docx"
-        pack_document(self.original_path, self.original_docx, validate=False)
+        # Validation baseline, packed from the original directory on first use
+        # (outside unpacked dir) unless the source .docx was given
+        self._original_docx = Path(original_docx) if original_docx else None
 
         self.word_path = self.unpacked_path / "word"
 
@@ -657,6 +1087,7 @@ class Document:
 
         # Cache for lazy-loaded editors
         self._editors = {}
+        self._lxml_parts = set(lxml_parts)
 
         # Comment file paths
         self.comments_path = self.word_path / "comments.xml"
@@ -668,8 +1099,18 @@ class Document:
         self.existing_comments = self._load_existing_comments()
         self.next_comment_id = self._get_next_comment_id()
 
-        # Convenient access to document.xml editor (semi-private)
-        self._document = self["word/document.xml"]
+        # Convenient access to document.xml editor (semi-private); in windowed
+        # mode only the blocks opened with window() are parsed
+        self._windows = None
+        self._document = None
+        if windowed:
+            self._windows = WindowedPart(
+                self.word_path / "document.xml",
+                lambda path: self._create_editor("word/document.xml", path),
+                work_dir=Path(self.temp_dir) / "windows",
+            )
+        else:
+            self._document = self["word/document.xml"]
 
         # Setup tracked changes infrastructure
         self._setup_tracking(track_revisions=track_revisions)
@@ -700,16 +1141,53 @@ class Document:
             # Get node from comments.xml
             comment = doc["word/comments.xml"].get_node(tag="w:comment", attrs={"w:id": "0"})
         """
+        if xml_path == "word/document.xml" and self._windows is not None:
+            raise ValueError(
+                "word/document.xml is opened in windowed mode; use doc.window(...)"
+            )
         if xml_path not in self._editors:
             file_path = self.unpacked_path / xml_path
             if not file_path.exists():
                 raise ValueError(f"XML file not found: {xml_path}")
-            # Use DocxXMLEditor with RSID, author, and initials for all editors
-            self._editors[xml_path] = DocxXMLEditor(
-                file_path, rsid=self.rsid, author=self.author, initials=self.initials
-            )
+            self._editors[xml_path] = self._create_editor(xml_path, file_path)
         return self._editors[xml_path]
 
+    def window(self, line_range=None, para_id=None, contains=None) -> DocxXMLEditor:
+        """
+        Get an editor for part of word/document.xml (windowed mode only).
+
+        The body's top-level blocks (paragraphs, tables, sectPr) are indexed
+        by byte offset when the document is opened. A window holds the
+        smallest run of blocks covering every block that matches all given
+        filters; nothing else of the part is parsed. save() splices edited
+        windows back into the part.
+
+        Args:
+            line_range: (start, end) line numbers in word/document.xml
+            para_id: w14:paraId of a paragraph (blocks such as tables that
+                contain it are loaded whole)
+            contains: Text the block contains, even across run boundaries
+
+        Returns:
+            DocxXMLEditor for the window. Its line numbers match the file, and
+            an open window that already holds the blocks is returned again.
+
+        Raises:
+            ValueError: If the document is not windowed, nothing matches, or
+                the blocks overlap an open window without being inside it
+
+        Example:
+            doc = Document('unpacked', windowed=True)
+            editor = doc.window(contains="Termination for convenience")
+            para = editor.get_node(tag="w:p", contains="Termination for convenience")
+            doc.add_comment(start=para, end=para, text="Check notice period")
+        """
+        if self._windows is None:
+            raise ValueError("window() requires Document(..., windowed=True)")
+        return self._windows.window(
+            line_range=line_range, para_id=para_id, contains=contains
+        )
+
     def add_comment(self, start, end, text: str) -> int:
         """
         Add a comment spanning from one element to another.
@@ -727,40 +1205,55 @@ class Document:
             end_node = cm.get_document_node(tag="w:ins", id="2")
             cm.add_comment(start=start_node, end=end_node, text="Explanation")
         """
-        comment_id = self.next_comment_id
-        para_id = _generate_hex_id()
-        durable_id = _generate_hex_id()
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-        # Add comment ranges to document.xml immediately
-        self._document.insert_before(start, self._comment_range_start_xml(comment_id))
+        return self.add_comments([(start, end, text)])[0]
 
-        # If end node is a paragraph, append comment markup inside it
-        # Otherwise insert after it (for run-level anchors)
-        if end.tagName == "w:p":
-            self._document.append_to(end, self._comment_range_end_xml(comment_id))
-        else:
-            self._document.insert_after(end, self._comment_range_end_xml(comment_id))
-
-        # Add to comments.xml immediately
-        self._add_to_comments_xml(
-            comment_id, para_id, text, self.author, self.initials, timestamp
-        )
-
-        # Add to commentsExtended.xml immediately
-        self._add_to_comments_extended_xml(para_id, parent_para_id=None)
+    def add_comments(self, comments) -> list[int]:
+        """
+        Add many comments at once (see add_comment).
 
-        # Add to commentsIds.xml immediately
-        self._add_to_comments_ids_xml(para_id, durable_id)
+        Range markers for all comments are parsed and inserted into
+        document.xml in one batch, and each comment part (comments.xml,
+        commentsExtended.xml, commentsIds.xml, commentsExtensible.xml) gets a
+        single fragment holding every new entry.
 
-        # Add to commentsExtensible.xml immediately
-        self._add_to_comments_extensible_xml(durable_id)
+        Args:
+            comments: Iterable of (start, end, text) tuples, as add_comment takes
 
-        # Update existing_comments so replies work
-        self.existing_comments[comment_id] = {"para_id": para_id}
+        Returns:
+            List of the comment IDs created, in input order
 
-        self.next_comment_id += 1
-        return comment_id
+        Example:
+            editor = doc["word/document.xml"]
+            paras = [editor.get_node(tag="w:p", contains=t) for t in ("draft", "TBD")]
+            doc.add_comments([(p, p, "Resolve before sign-off") for p in paras])
+        """
+        comments = list(comments)
+        comment_ids = [self.next_comment_id + i for i in range(len(comments))]
+
+        # Operations per editor (windowed documents may span several windows)
+        operations = {}
+        for comment_id, (start, end, _) in zip(comment_ids, comments):
+            editor = self._document_editor_for(start, end)
+            editor_operations = operations.setdefault(editor, [])
+            editor_operations.append(
+                ("insert_before", start, self._comment_range_start_xml(comment_id))
+            )
+            # If end node is a paragraph, append comment markup inside it
+            # Otherwise insert after it (for run-level anchors)
+            method = "append_to" if editor._tag_name(end) == "w:p" else "insert_after"
+            editor_operations.append(
+                (method, end, self._comment_range_end_xml(comment_id))
+            )
+        for editor, editor_operations in operations.items():
+            editor.batch_insert(editor_operations)
+
+        self._add_comment_entries(
+            [
+                (comment_id, text, None)
+                for comment_id, (_, _, text) in zip(comment_ids, comments)
+            ]
+        )
+        return comment_ids
 
     def reply_to_comment(
         self,
@@ -780,61 +1273,133 @@ class Document:
         Example:
             cm.reply_to_comment(parent_comment_id=0, text="I agree with this change")
         """
-        if parent_comment_id not in self.existing_comments:
-            raise ValueError(f"Parent comment with id={parent_comment_id} not found")
+        return self.reply_to_comments([(parent_comment_id, text)])[0]
 
-        parent_info = self.existing_comments[parent_comment_id]
-        comment_id = self.next_comment_id
-        para_id = _generate_hex_id()
-        durable_id = _generate_hex_id()
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-        # Add comment ranges to document.xml immediately
-        parent_start_elem = self._document.get_node(
-            tag="w:commentRangeStart", attrs={"w:id": str(parent_comment_id)}
-        )
-        parent_ref_elem = self._document.get_node(
-            tag="w:commentReference", attrs={"w:id": str(parent_comment_id)}
-        )
-
-        self._document.insert_after(
-            parent_start_elem, self._comment_range_start_xml(comment_id)
-        )
-        parent_ref_run = parent_ref_elem.parentNode
-        self._document.insert_after(
-            parent_ref_run, f'<w:commentRangeEnd w:id="{comment_id}"/>'
-        )
-        self._document.insert_after(
-            parent_ref_run, self._comment_ref_run_xml(comment_id)
-        )
+    def reply_to_comments(self, replies) -> list[int]:
+        """
+        Add many replies at once (see reply_to_comment).
 
-        # Add to comments.xml immediately
-        self._add_to_comments_xml(
-            comment_id, para_id, text, self.author, self.initials, timestamp
-        )
+        The parents' range markers are located in one pass over document.xml,
+        and the new markers and comment part entries are inserted in batches
+        as add_comments does.
 
-        # Add to commentsExtended.xml immediately (with parent)
-        self._add_to_comments_extended_xml(
-            para_id, parent_para_id=parent_info["para_id"]
-        )
+        Args:
+            replies: Iterable of (parent_comment_id, text) tuples; parents must
+                exist before the call
 
-        # Add to commentsIds.xml immediately
-        self._add_to_comments_ids_xml(para_id, durable_id)
+        Returns:
+            List of the comment IDs created for the replies, in input order
 
-        # Add to commentsExtensible.xml immediately
-        self._add_to_comments_extensible_xml(durable_id)
+        Raises:
+            ValueError: If a parent comment or its range markers are not found
 
-        # Update existing_comments so replies work
-        self.existing_comments[comment_id] = {"para_id": para_id}
+        Example:
+            cm.reply_to_comments([(0, "Agreed"), (3, "Fixed in section 2")])
+        """
+        replies = list(replies)
+        for parent_comment_id, _ in replies:
+            if parent_comment_id not in self.existing_comments:
+                raise ValueError(
+                    f"Parent comment with id={parent_comment_id} not found"
+                )
 
-        self.next_comment_id += 1
-        return comment_id
+        # Locate every parent's range start and reference run in one pass
+        wanted = {str(parent_comment_id) for parent_comment_id, _ in replies}
+        markers = {}
+        for editor in self._document_editors():
+            for tag in ("w:commentRangeStart", "w:commentReference"):
+                for elem in editor._iter_elements(tag):
+                    key = (tag, editor._get_attr(elem, "w:id"))
+                    if key[1] in wanted:
+                        markers.setdefault(key, elem)
+
+        comment_ids = [self.next_comment_id + i for i in range(len(replies))]
+        operations = {}
+        for comment_id, (parent_comment_id, _) in zip(comment_ids, replies):
+            parent_start_elem = markers.get(
+                ("w:commentRangeStart", str(parent_comment_id))
+            )
+            parent_ref_elem = markers.get(
+                ("w:commentReference", str(parent_comment_id))
+            )
+            if parent_start_elem is None or parent_ref_elem is None:
+                raise ValueError(
+                    f"Range markers of comment id={parent_comment_id} not found"
+                )
+            editor = self._document_editor_for(parent_start_elem, parent_ref_elem)
+            parent_ref_run = editor._parent(parent_ref_elem)
+            operations.setdefault(editor, []).extend(
+                [
+                    (
+                        "insert_after",
+                        parent_start_elem,
+                        self._comment_range_start_xml(comment_id),
+                    ),
+                    (
+                        "insert_after",
+                        parent_ref_run,
+                        f'<w:commentRangeEnd w:id="{comment_id}"/>',
+                    ),
+                    (
+                        "insert_after",
+                        parent_ref_run,
+                        self._comment_ref_run_xml(comment_id),
+                    ),
+                ]
+            )
+        for editor, editor_operations in operations.items():
+            editor.batch_insert(editor_operations)
+
+        self._add_comment_entries(
+            [
+                (comment_id, text, self.existing_comments[parent_comment_id]["para_id"])
+                for comment_id, (parent_comment_id, text) in zip(comment_ids, replies)
+            ]
+        )
+        return comment_ids
+
+    def _document_editors(self):
+        """Editors holding word/document.xml content: the whole part or its windows."""
+        if self._windows is None:
+            return [self._document]
+        return self._windows.editors
+
+    def _document_editor_for(self, *elems):
+        """The document.xml editor (or window) holding all of elems."""
+        if self._windows is None:
+            return self._document
+        for editor in self._windows.editors:
+            if all(editor._is_attached(elem) for elem in elems):
+                return editor
+        raise ValueError("Elements must be in one open window of word/document.xml")
+
+    def _create_editor(self, xml_path, file_path):
+        """DocxXMLEditor (or its lxml variant) for file_path with RSID and author."""
+        editor_class = (
+            LxmlDocxXMLEditor if xml_path in self._lxml_parts else DocxXMLEditor
+        )
+        return editor_class(
+            file_path, rsid=self.rsid, author=self.author, initials=self.initials
+        )
 
     def __del__(self):
         """Clean up temporary directory on deletion."""
         if hasattr(self, "temp_dir") and Path(self.temp_dir).exists():
             shutil.rmtree(self.temp_dir)
 
+    @property
+    def original_docx(self) -> Path:
+        """Path to the unmodified .docx used as the validation baseline."""
+        return self._ensure_baseline()
+
+    def _ensure_baseline(self) -> Path:
+        """Pack the original directory as the validation baseline on first use."""
+        if self._original_docx is None:
+            baseline = Path(self.temp_dir) / "original.docx"
+            pack_document(self.original_path, baseline, validate=False)
+            self._original_docx = baseline
+        return self._original_docx
+
     def validate(self) -> None:
         """
         Validate the document against XSD schema and redlining rules.
@@ -856,32 +1421,71 @@ class Document:
         if not redlining_validator.validate():
             raise ValueError("Redlining validation failed")
 
-    def save(self, destination=None, validate=True) -> None:
+    def save(self, destination=None, validate=True) -> list[str]:
         """
         Save all modified XML files to disk and copy to destination directory.
 
         This persists all changes made via add_comment() and reply_to_comment().
+        Only editors that were modified are serialized, and only files that
+        differ from the destination are copied.
 
         Args:
             destination: Optional path to save to. If None, saves back to original directory.
             validate: If True, validates document before saving (default: True).
+
+        Returns:
+            list[str]: Relative paths of the parts written to the destination
         """
         # Only ensure comment relationships and content types if comment files exist
         if self.comments_path.exists():
             self._ensure_comment_relationships()
             self._ensure_comment_content_types()
 
-        # Save all modified XML files in temp directory
+        # Serialize only the XML files that were modified
         for editor in self._editors.values():
-            editor.save()
+            if editor.dirty:
+                editor.save()
+        if self._windows is not None:
+            self._windows.save()
 
         # Validate by default
         if validate:
             self.validate()
 
-        # Copy contents from temp directory to destination (or original directory)
+        # Copy changed contents from temp directory to destination (or original directory)
         target_path = Path(destination) if destination else self.original_path
-        shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
+        if target_path.resolve() == self.original_path.resolve():
+            # The baseline must be packed before the original directory changes
+            self._ensure_baseline()
+        return self._copy_changed_files(target_path)
+
+    def _copy_changed_files(self, target_path):
+        """Copy files that are missing or differ (size or mtime) in target_path.
+
+        Files are copied with their metadata, so unchanged parts keep matching
+        their destination copy on later saves.
+
+        Returns:
+            list[str]: Relative paths of the copied files
+        """
+        written = []
+        for src in sorted(self.unpacked_path.rglob("*")):
+            if not src.is_file():
+                continue
+            relative = src.relative_to(self.unpacked_path)
+            dst = target_path / relative
+            src_stat = src.stat()
+            if dst.exists():
+                dst_stat = dst.stat()
+                if (dst_stat.st_size, dst_stat.st_mtime_ns) == (
+                    src_stat.st_size,
+                    src_stat.st_mtime_ns,
+                ):
+                    continue
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(src, dst)
+            written.append(relative.as_posix())
+        return written
 
     # ==================== Private: Initialization ====================
 
@@ -890,16 +1494,7 @@ class Document:
         if not self.comments_path.exists():
             return 0
 
-        editor = self["word/comments.xml"]
-        max_id = -1
-        for comment_elem in editor.dom.getElementsByTagName("w:comment"):
-            comment_id = comment_elem.getAttribute("w:id")
-            if comment_id:
-                try:
-                    max_id = max(max_id, int(comment_id))
-                except ValueError:
-                    pass
-        return max_id + 1
+        return self["word/comments.xml"]._peek_id(("w:comment",), "w:id")
 
     def _load_existing_comments(self):
         """Load existing comments from files to enable replies."""
@@ -909,15 +1504,15 @@ class Document:
         editor = self["word/comments.xml"]
         existing = {}
 
-        for comment_elem in editor.dom.getElementsByTagName("w:comment"):
-            comment_id = comment_elem.getAttribute("w:id")
+        for comment_elem in editor._iter_elements("w:comment"):
+            comment_id = editor._get_attr(comment_elem, "w:id")
             if not comment_id:
                 continue
 
             # Find para_id from the w:p element within the comment
             para_id = None
-            for p_elem in comment_elem.getElementsByTagName("w:p"):
-                para_id = p_elem.getAttribute("w14:paraId")
+            for p_elem in editor._descendants(comment_elem, "w:p"):
+                para_id = editor._get_attr(p_elem, "w14:paraId")
                 if para_id:
                     break
 
@@ -965,8 +1560,9 @@ class Document:
             return
 
         # Add Override element
-        root = editor.dom.documentElement
-        override_xml = '<Override PartName="/word/people.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.people+xml"/>'
+        root = editor._root()
+        prefix = self._root_prefix(editor)
+        override_xml = f'<{prefix}Override PartName="/word/people.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.people+xml"/>'
         editor.append_to(root, override_xml)
 
     def _add_relationship_for_people(self, path):
@@ -976,9 +1572,8 @@ class Document:
         if self._has_relationship(editor, "people.xml"):
             return
 
-        root = editor.dom.documentElement
-        root_tag = root.tagName  # type: ignore
-        prefix = root_tag.split(":")[0] + ":" if ":" in root_tag else ""
+        root = editor._root()
+        prefix = self._root_prefix(editor)
         next_rid = editor.get_next_rid()
 
         # Create the relationship entry
@@ -997,35 +1592,31 @@ class Document:
         - rsids: late (after compat)
         """
         editor = self["word/settings.xml"]
-        root = editor.get_node(tag="w:settings")
-        prefix = root.tagName.split(":")[0] if ":" in root.tagName else "w"
+        root = editor._root()
+        prefix = self._root_prefix(editor)[:-1] or "w"
 
         # Conditionally add trackRevisions if requested
         if track_revisions:
-            track_revisions_exists = any(
-                elem.tagName == f"{prefix}:trackRevisions"
-                for elem in editor.dom.getElementsByTagName(f"{prefix}:trackRevisions")
-            )
-
-            if not track_revisions_exists:
+            if not editor._iter_elements(f"{prefix}:trackRevisions"):
                 track_rev_xml = f"<{prefix}:trackRevisions/>"
                 # Try to insert before documentProtection, defaultTabStop, or at start
                 inserted = False
                 for tag in [f"{prefix}:documentProtection", f"{prefix}:defaultTabStop"]:
-                    elements = editor.dom.getElementsByTagName(tag)
+                    elements = editor._iter_elements(tag)
                     if elements:
                         editor.insert_before(elements[0], track_rev_xml)
                         inserted = True
                         break
                 if not inserted:
                     # Insert as first child of settings
-                    if root.firstChild:
-                        editor.insert_before(root.firstChild, track_rev_xml)
+                    children = editor._child_elements(root)
+                    if children:
+                        editor.insert_before(children[0], track_rev_xml)
                     else:
                         editor.append_to(root, track_rev_xml)
 
         # Always check if rsids section exists
-        rsids_elements = editor.dom.getElementsByTagName(f"{prefix}:rsids")
+        rsids_elements = editor._iter_elements(f"{prefix}:rsids")
 
         if not rsids_elements:
             # Add new rsids section
@@ -1036,15 +1627,13 @@ class Document:
 
             # Try to insert after compat, before clrSchemeMapping, or before closing tag
             inserted = False
-            compat_elements = editor.dom.getElementsByTagName(f"{prefix}:compat")
+            compat_elements = editor._iter_elements(f"{prefix}:compat")
             if compat_elements:
                 editor.insert_after(compat_elements[0], rsids_xml)
                 inserted = True
 
             if not inserted:
-                clr_elements = editor.dom.getElementsByTagName(
-                    f"{prefix}:clrSchemeMapping"
-                )
+                clr_elements = editor._iter_elements(f"{prefix}:clrSchemeMapping")
                 if clr_elements:
                     editor.insert_before(clr_elements[0], rsids_xml)
                     inserted = True
@@ -1055,8 +1644,8 @@ class Document:
             # Check if this rsid already exists
             rsids_elem = rsids_elements[0]
             rsid_exists = any(
-                elem.getAttribute(f"{prefix}:val") == self.rsid
-                for elem in rsids_elem.getElementsByTagName(f"{prefix}:rsid")
+                editor._get_attr(elem, f"{prefix}:val") == self.rsid
+                for elem in editor._descendants(rsids_elem, f"{prefix}:rsid")
             )
 
             if not rsid_exists:
@@ -1065,67 +1654,109 @@ class Document:
 
     # ==================== Private: XML File Creation ====================
 
-    def _add_to_comments_xml(
-        self, comment_id, para_id, text, author, initials, timestamp
-    ):
-        """Add a single comment to comments.xml."""
+    def _add_comment_entries(self, entries):
+        """Add comments to all four comment parts, one fragment per part.
+
+        Args:
+            entries: List of (comment_id, text, parent_para_id) tuples, where
+                parent_para_id is None for top-level comments
+        """
+        if not entries:
+            return
+
+        para_ids = _generate_hex_ids(len(entries))
+        durable_ids = _generate_hex_ids(len(entries))
+
+        self._add_to_comments_xml(
+            [
+                (comment_id, para_id, text)
+                for (comment_id, text, _), para_id in zip(entries, para_ids)
+            ]
+        )
+        self._add_to_comments_extended_xml(
+            [
+                (para_id, parent_para_id)
+                for (_, _, parent_para_id), para_id in zip(entries, para_ids)
+            ]
+        )
+        self._add_to_comments_ids_xml(list(zip(para_ids, durable_ids)))
+        self._add_to_comments_extensible_xml(durable_ids)
+
+        # Update existing_comments so replies work
+        for (comment_id, _, _), para_id in zip(entries, para_ids):
+            self.existing_comments[comment_id] = {"para_id": para_id}
+
+        self.next_comment_id += len(entries)
+
+    def _add_to_comments_xml(self, comments):
+        """Add (comment_id, para_id, text) comments to comments.xml."""
         if not self.comments_path.exists():
             shutil.copy(TEMPLATE_DIR / "comments.xml", self.comments_path)
 
         editor = self["word/comments.xml"]
-        root = editor.get_node(tag="w:comments")
+        root = editor._root()
 
-        escaped_text = (
-            text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-        )
         # Note: w:rsidR, w:rsidRDefault, w:rsidP on w:p, w:rsidR on w:r,
         # and w:author, w:date, w:initials on w:comment are automatically added by DocxXMLEditor
-        comment_xml = f'''<w:comment w:id="{comment_id}">
+        xml = "".join(
+            f'''<w:comment w:id="{comment_id}">
   <w:p w14:paraId="{para_id}" w14:textId="77777777">
     <w:r><w:rPr><w:rStyle w:val="CommentReference"/></w:rPr><w:annotationRef/></w:r>
-    <w:r><w:rPr><w:color w:val="000000"/><w:sz w:val="20"/><w:szCs w:val="20"/></w:rPr><w:t>{escaped_text}</w:t></w:r>
+    <w:r><w:rPr><w:color w:val="000000"/><w:sz w:val="20"/><w:szCs w:val="20"/></w:rPr><w:t>{html.escape(text, quote=False)}</w:t></w:r>
   </w:p>
 </w:comment>'''
-        editor.append_to(root, comment_xml)
+            for comment_id, para_id, text in comments
+        )
+        editor.append_to(root, xml)
 
-    def _add_to_comments_extended_xml(self, para_id, parent_para_id):
-        """Add a single comment to commentsExtended.xml."""
+    def _add_to_comments_extended_xml(self, comments):
+        """Add (para_id, parent_para_id) entries to commentsExtended.xml."""
         if not self.comments_extended_path.exists():
             shutil.copy(
                 TEMPLATE_DIR / "commentsExtended.xml", self.comments_extended_path
             )
 
         editor = self["word/commentsExtended.xml"]
-        root = editor.get_node(tag="w15:commentsEx")
+        root = editor._root()
 
-        if parent_para_id:
-            xml = f'<w15:commentEx w15:paraId="{para_id}" w15:paraIdParent="{parent_para_id}" w15:done="0"/>'
-        else:
-            xml = f'<w15:commentEx w15:paraId="{para_id}" w15:done="0"/>'
-        editor.append_to(root, xml)
+        parts = []
+        for para_id, parent_para_id in comments:
+            if parent_para_id:
+                parts.append(
+                    f'<w15:commentEx w15:paraId="{para_id}" w15:paraIdParent="{parent_para_id}" w15:done="0"/>'
+                )
+            else:
+                parts.append(f'<w15:commentEx w15:paraId="{para_id}" w15:done="0"/>')
+        editor.append_to(root, "".join(parts))
 
-    def _add_to_comments_ids_xml(self, para_id, durable_id):
-        """Add a single comment to commentsIds.xml."""
+    def _add_to_comments_ids_xml(self, comments):
+        """Add (para_id, durable_id) entries to commentsIds.xml."""
         if not self.comments_ids_path.exists():
             shutil.copy(TEMPLATE_DIR / "commentsIds.xml", self.comments_ids_path)
 
         editor = self["word/commentsIds.xml"]
-        root = editor.get_node(tag="w16cid:commentsIds")
+        root = editor._root()
 
-        xml = f'<w16cid:commentId w16cid:paraId="{para_id}" w16cid:durableId="{durable_id}"/>'
+        xml = "".join(
+            f'<w16cid:commentId w16cid:paraId="{para_id}" w16cid:durableId="{durable_id}"/>'
+            for para_id, durable_id in comments
+        )
         editor.append_to(root, xml)
 
-    def _add_to_comments_extensible_xml(self, durable_id):
-        """Add a single comment to commentsExtensible.xml."""
+    def _add_to_comments_extensible_xml(self, durable_ids):
+        """Add entries for durable_ids to commentsExtensible.xml."""
         if not self.comments_extensible_path.exists():
             shutil.copy(
                 TEMPLATE_DIR / "commentsExtensible.xml", self.comments_extensible_path
             )
 
         editor = self["word/commentsExtensible.xml"]
-        root = editor.get_node(tag="w16cex:commentsExtensible")
+        root = editor._root()
 
-        xml = f'<w16cex:commentExtensible w16cex:durableId="{durable_id}"/>'
+        xml = "".join(
+            f'<w16cex:commentExtensible w16cex:durableId="{durable_id}"/>'
+            for durable_id in durable_ids
+        )
         editor.append_to(root, xml)
 
     # ==================== Private: XML Fragments ====================
@@ -1157,24 +1788,32 @@ class Document:
 
     # ==================== Private: Metadata Updates ====================
 
+    @staticmethod
+    def _root_prefix(editor):
+        """Prefix of the part's root element followed by ":", or "" if unprefixed."""
+        root_tag = editor._tag_name(editor._root())
+        return root_tag.split(":")[0] + ":" if ":" in root_tag else ""
+
     def _has_relationship(self, editor, target):
         """Check if a relationship with given target exists."""
-        for rel_elem in editor.dom.getElementsByTagName("Relationship"):
-            if rel_elem.getAttribute("Target") == target:
+        tag = self._root_prefix(editor) + "Relationship"
+        for rel_elem in editor._iter_elements(tag):
+            if editor._get_attr(rel_elem, "Target") == target:
                 return True
         return False
 
     def _has_override(self, editor, part_name):
         """Check if an override with given part name exists."""
-        for override_elem in editor.dom.getElementsByTagName("Override"):
-            if override_elem.getAttribute("PartName") == part_name:
+        tag = self._root_prefix(editor) + "Override"
+        for override_elem in editor._iter_elements(tag):
+            if editor._get_attr(override_elem, "PartName") == part_name:
                 return True
         return False
 
     def _has_author(self, editor, author):
         """Check if an author already exists in people.xml."""
-        for person_elem in editor.dom.getElementsByTagName("w15:person"):
-            if person_elem.getAttribute("w15:author") == author:
+        for person_elem in editor._iter_elements("w15:person"):
+            if editor._get_attr(person_elem, "w15:author") == author:
                 return True
         return False
 
@@ -1187,7 +1826,7 @@ class Document:
             raise ValueError("people.xml should exist after _setup_tracking")
 
         editor = self["word/people.xml"]
-        root = editor.get_node(tag="w15:people")
+        root = editor._root()
 
         # Check if author already exists
         if self._has_author(editor, author):
@@ -1207,9 +1846,8 @@ class Document:
         if self._has_relationship(editor, "comments.xml"):
             return
 
-        root = editor.dom.documentElement
-        root_tag = root.tagName  # type: ignore
-        prefix = root_tag.split(":")[0] + ":" if ":" in root_tag else ""
+        root = editor._root()
+        prefix = self._root_prefix(editor)
         next_rid_num = int(editor.get_next_rid()[3:])
 
         # Add relationship elements
@@ -1247,7 +1885,8 @@ class Document:
         if self._has_override(editor, "/word/comments.xml"):
             return
 
-        root = editor.dom.documentElement
+        root = editor._root()
+        prefix = self._root_prefix(editor)
 
         # Add Override elements
         overrides = [
@@ -1271,6 +1910,6 @@ class Document:
 
         for part_name, content_type in overrides:
             override_xml = (
-                f'<Override PartName="{part_name}" ContentType="{content_type}"/>'
+                f'<{prefix}Override PartName="{part_name}" ContentType="{content_type}"/>'
             )
             editor.append_to(root, override_xml)
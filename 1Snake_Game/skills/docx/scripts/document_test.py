@@ -0,0 +1,167 @@
+import unittest
+import tempfile
+from pathlib import Path
+
+from .document import Document
+
+
+WORD_NAMESPACES = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:w14="http://schemas.microsoft.com/office/word/2010/wordml" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+)
+
+PACKAGE_PARTS = {
+    "[Content_Types].xml": (
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        '<Override PartName="/word/settings.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.settings+xml"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>'
+        "</Relationships>"
+    ),
+    "word/_rels/document.xml.rels": (
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/settings" Target="settings.xml"/>'
+        "</Relationships>"
+    ),
+    "word/settings.xml": (
+        '<w:settings xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        '<w:zoom w:percent="100"/><w:defaultTabStop w:val="720"/><w:compat/>'
+        "</w:settings>"
+    ),
+}
+
+
+def write_package(folder, body):
+    """Write a minimal unpacked .docx whose w:body holds body"""
+    folder = Path(folder)
+    parts = dict(PACKAGE_PARTS)
+    parts["word/document.xml"] = (
+        f"<w:document {WORD_NAMESPACES}><w:body>{body}<w:sectPr/></w:body></w:document>"
+    )
+    for name, content in parts.items():
+        path = folder / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n' + content,
+            encoding="utf-8",
+        )
+    return folder
+
+
+# Run from the docx directory: python -m pytest scripts/document_test.py
+class TestDocument(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+        self.path = write_package(
+            self.folder.name, "<w:p><w:r><w:t>alpha</w:t></w:r></w:p>"
+        )
+
+    def test_metadata_parts_with_the_lxml_backend(self):
+        """Settings, rels, content types and comment parts work with lxml editors"""
+        parts = [
+            "[Content_Types].xml",
+            "word/_rels/document.xml.rels",
+            "word/settings.xml",
+            "word/people.xml",
+            "word/comments.xml",
+            "word/commentsExtended.xml",
+            "word/commentsIds.xml",
+            "word/commentsExtensible.xml",
+        ]
+        doc = Document(self.path, lxml_parts=parts, track_revisions=True)
+        para = doc["word/document.xml"].get_node(tag="w:p", contains="alpha")
+        comment_id = doc.add_comment(para, para, "note")
+        doc.reply_to_comment(comment_id, "reply")
+        doc.save()
+
+        reopened = Document(self.path, lxml_parts=parts)
+        self.assertEqual(sorted(reopened.existing_comments), [0, 1])
+        settings = (self.path / "word/settings.xml").read_text(encoding="utf-8")
+        self.assertIn("<w:trackRevisions/>", settings)
+        self.assertEqual(settings.count("<w:rsids>"), 1)
+
+    def test_save_writes_only_edited_parts(self):
+        """A part that was only read is not rewritten"""
+        doc = Document(self.path)
+        doc["word/document.xml"].get_node(tag="w:p", contains="alpha")
+        self.assertNotIn("word/document.xml", doc.save())
+
+        doc = Document(self.path)
+        t_elem = doc["word/document.xml"].get_node(tag="w:t", contains="alpha")
+        t_elem.firstChild.data = "beta"
+        self.assertIn("word/document.xml", doc.save())
+
+    def test_revert_all_rejects_every_change_by_one_author(self):
+        """The bulk path rejects runs and inserted marks, and skips deleted marks"""
+        change = 'w:id="{}" w:author="{}" w:date="2025-01-01T00:00:00Z"'
+        paragraphs = []
+        for i in range(0, 600, 3):
+            paragraphs.append(
+                f"<w:p><w:ins {change.format(i, 'Bob')}><w:r><w:t>new {i}</w:t></w:r></w:ins>"
+                f"<w:del {change.format(i + 1, 'Bob')}><w:r><w:delText>old {i}</w:delText></w:r></w:del>"
+                f"<w:ins {change.format(i + 2, 'Alice')}><w:r><w:t>hers {i}</w:t></w:r></w:ins></w:p>"
+            )
+        paragraphs.append(
+            f"<w:p><w:pPr><w:rPr><w:ins {change.format(700, 'Bob')}/></w:rPr></w:pPr>"
+            "<w:r><w:t>inserted mark</w:t></w:r></w:p>"
+        )
+        paragraphs.append(
+            f"<w:p><w:pPr><w:rPr><w:del {change.format(701, 'Bob')}/></w:rPr></w:pPr>"
+            "<w:r><w:t>deleted mark</w:t></w:r></w:p>"
+        )
+        path = write_package(self.folder.name, "".join(paragraphs))
+        doc = Document(path)
+        editor = doc["word/document.xml"]
+
+        created = editor.revert_all(author="Bob")
+        self.assertEqual(len(created), 401)
+        marks = editor._iter_elements("w:pPr")
+        self.assertEqual(
+            [[editor._tag_name(c) for c in editor._descendants(m, "*")] for m in marks],
+            [["w:rPr", "w:ins", "w:del"], ["w:rPr", "w:del"]],
+        )
+        self.assertEqual(len(editor._iter_elements("w:delText")), 400)
+        # Alice's runs, the re-inserted runs and the two marked paragraphs
+        self.assertEqual(len(editor._iter_elements("w:t")), 402)
+        doc.save()
+
+    def test_handles_survive_replace_node_save_and_reload(self):
+        path = write_package(
+            self.folder.name,
+            "<w:p><w:r><w:t>alpha</w:t></w:r></w:p>"
+            '<w:p w14:paraId="0000000B"><w:r><w:t>beta</w:t></w:r></w:p>',
+        )
+        doc = Document(path)
+        editor = doc["word/document.xml"]
+        beta = editor.get_node(tag="w:p", contains="beta")
+        self.assertEqual(editor.get_handle(beta), "0000000B")
+        self.assertFalse(editor.dirty)
+
+        # Issuing a handle below a paragraph without a paraId gives it one
+        run_handle = editor.get_handle(editor.get_node(tag="w:r", contains="alpha"))
+        self.assertRegex(run_handle, r"^[0-9A-F]{8}/w:r\[1\]$")
+        self.assertTrue(editor.dirty)
+
+        editor.replace_node(beta, "<w:p><w:r><w:t>gamma</w:t></w:r></w:p>")
+        self.assertIs(editor.resolve("0000000B"), editor.get_node(tag="w:p", contains="gamma"))
+        doc.save()
+
+        editor = Document(path)["word/document.xml"]
+        self.assertIs(editor.resolve("0000000B"), editor.get_node(tag="w:p", contains="gamma"))
+        self.assertIs(editor.resolve(run_handle), editor.get_node(tag="w:r", contains="alpha"))
+        with self.assertRaises(ValueError):
+            editor.resolve("0000000C")
+        self.assertIn("0000000C", editor._para_id_misses)
+
+
+if __name__ == '__main__':
+    unittest.main()
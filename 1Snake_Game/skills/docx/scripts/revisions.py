@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Accept or reject tracked changes across an unpacked Word document.
+
+Each part that can hold revisions (document body, headers, footers, footnotes,
+endnotes, comments) is read with lxml.etree.iterparse and written back one
+block (paragraph, table, note) at a time, so memory stays bounded by the
+largest block rather than the whole part.
+
+Usage:
+    from skills.docx.scripts.revisions import accept_changes, reject_changes
+
+    # Accept every revision
+    accept_changes('workspace/unpacked')
+
+    # Reject one author's revisions, or only some kinds within a date range
+    reject_changes('workspace/unpacked', author="Claude")
+    accept_changes(
+        'workspace/unpacked',
+        kinds=["w:rPrChange", "w:pPrChange"],
+        since="2025-01-01",
+        until="2025-02-01T00:00:00Z",
+    )
+
+Run this on the unpacked directory before opening it with Document, or on
+the directory Document.save() wrote; open editors do not see the changes.
+"""
+
+import os
+import re
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+
+import lxml.etree
+from ooxml.scripts.validation.redlining import (
+    WORD_NAMESPACE,
+    convert_deleted_text,
+    unwrap_element,
+)
+
+W = f"{{{WORD_NAMESPACE}}}"
+
+# Parts that may contain tracked changes, relative to the unpacked directory
+REVISION_PARTS = (
+    "word/document.xml",
+    "word/header*.xml",
+    "word/footer*.xml",
+    "word/footnotes.xml",
+    "word/endnotes.xml",
+    "word/comments.xml",
+)
+
+INSERTIONS = {W + "ins", W + "moveTo"}
+DELETIONS = {W + "del", W + "moveFrom"}
+PROPERTY_CHANGES = {
+    W + tag
+    for tag in (
+        "rPrChange",
+        "pPrChange",
+        "sectPrChange",
+        "tblPrChange",
+        "tblPrExChange",
+        "tblGridChange",
+        "trPrChange",
+        "tcPrChange",
+    )
+}
+# Move range markers, mapped to the kind of move they delimit
+RANGE_STARTS = {
+    W + "moveFromRangeStart": W + "moveFrom",
+    W + "moveToRangeStart": W + "moveTo",
+}
+RANGE_ENDS = {
+    W + "moveFromRangeEnd": W + "moveFrom",
+    W + "moveToRangeEnd": W + "moveTo",
+}
+# Children kept in place when a property change is rejected: those the
+# *PrChange base types cannot record (revision marks, the paragraph mark's
+# rPr, a paragraph's sectPr, header/footer references and other changes)
+HEADER_FOOTER_REFERENCES = {W + "headerReference", W + "footerReference"}
+KEPT_PROPERTIES = (
+    INSERTIONS
+    | DELETIONS
+    | PROPERTY_CHANGES
+    | HEADER_FOOTER_REFERENCES
+    | {W + "rPr", W + "sectPr"}
+)
+
+# A namespace declaration in a serialized start tag. Quotes inside attribute
+# values are escaped, so this cannot match within a value.
+_DECLARATION = re.compile(rb' xmlns(?::[^=\s]+)?="[^"]*"')
+
+
+def accept_changes(unpacked_dir, author=None, since=None, until=None, kinds=None):
+    """
+    Accept tracked changes: keep insertions, drop deletions, keep new formatting.
+
+    Args:
+        unpacked_dir: Path to unpacked DOCX directory
+        author: Only accept changes by this author (default: all authors)
+        since: Only accept changes dated at or after this datetime or ISO string
+        until: Only accept changes dated at or before this datetime or ISO string
+        kinds: Only accept these change types, e.g. ["w:ins", "w:rPrChange"]
+            (default: all of w:ins, w:del, w:moveFrom, w:moveTo and *PrChange)
+
+    Returns:
+        Counter: Number of changes accepted per type (e.g. {"w:ins": 3})
+    """
+    return resolve_changes(unpacked_dir, True, author, since, until, kinds)
+
+
+def reject_changes(unpacked_dir, author=None, since=None, until=None, kinds=None):
+    """
+    Reject tracked changes: drop insertions, restore deletions and old formatting.
+
+    Takes the same filters as accept_changes().
+
+    Returns:
+        Counter: Number of changes rejected per type
+    """
+    return resolve_changes(unpacked_dir, False, author, since, until, kinds)
+
+
+def resolve_changes(
+    unpacked_dir, accept, author=None, since=None, until=None, kinds=None
+):
+    """Accept (accept=True) or reject matching changes in every revision part."""
+    unpacked_dir = Path(unpacked_dir)
+    if not unpacked_dir.is_dir():
+        raise ValueError(f"Directory not found: {unpacked_dir}")
+
+    resolver = _Resolver(accept, author, since, until, kinds)
+    for pattern in REVISION_PARTS:
+        for part in sorted(unpacked_dir.glob(pattern)):
+            resolver.stream_part(part)
+    return resolver.counts
+
+
+def _parse_date(value):
+    """Parse an OOXML w:date (or a caller's bound) into an aware datetime."""
+    if value is None or isinstance(value, datetime):
+        parsed = value
+    else:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed is not None and parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _kind_name(tag):
+    """Prefixed kind name ("w:ins") for a Clark tag."""
+    return "w:" + tag[len(W) :]
+
+
+class _Resolver:
+    """Applies one accept/reject decision to revisions, block by block."""
+
+    def __init__(self, accept, author, since, until, kinds):
+        self.accept = accept
+        self.author = author
+        self.since = _parse_date(since)
+        self.until = _parse_date(until)
+        self.kinds = None if kinds is None else {W + k.split(":")[-1] for k in kinds}
+        self.counts = Counter()
+        # Paragraphs whose paragraph mark was removed (merge into next paragraph)
+        self._merged = set()
+        # Ids of resolved move ranges, so their end markers are dropped too
+        self._ranges = set()
+
+    # ==================== Filtering ====================
+
+    def _matches(self, elem, kind):
+        """Check whether a change element passes the author/date/kind filters."""
+        if self.kinds is not None and kind not in self.kinds:
+            return False
+        if self.author is not None and elem.get(W + "author") != self.author:
+            return False
+        if self.since is not None or self.until is not None:
+            date = elem.get(W + "date")
+            if not date:
+                return False
+            date = _parse_date(date)
+            if self.since is not None and date < self.since:
+                return False
+            if self.until is not None and date > self.until:
+                return False
+        return True
+
+    def _resolve_marker(self, parent, marker_parent_tag):
+        """
+        Resolve the ins/del marker on a paragraph mark or table row.
+
+        Returns:
+            bool: True if the marked paragraph mark or row is removed
+        """
+        props = parent.find(marker_parent_tag)
+        if props is None:
+            return False
+        if parent.tag == W + "p":
+            props = props.find(W + "rPr")
+            if props is None:
+                return False
+        for marker in list(props):
+            if marker.tag in INSERTIONS | DELETIONS and self._matches(
+                marker, marker.tag
+            ):
+                props.remove(marker)
+                self.counts[_kind_name(marker.tag)] += 1
+                return (marker.tag in INSERTIONS) != self.accept
+        return False
+
+    # ==================== Resolution ====================
+
+    def resolve_block(self, elem):
+        """
+        Resolve revisions in and on elem.
+
+        Returns:
+            list: Elements that replace elem (empty if it was removed)
+        """
+        tag = elem.tag
+        if tag in INSERTIONS or tag in DELETIONS:
+            if not self._matches(elem, tag):
+                self._resolve_children(elem)
+                return [elem]
+            self.counts[_kind_name(tag)] += 1
+            keep_content = (tag in INSERTIONS) == self.accept
+            if not keep_content:
+                return []
+            if tag in DELETIONS:
+                convert_deleted_text(elem)
+            self._resolve_children(elem)
+            return list(elem)
+
+        if tag in RANGE_STARTS:
+            if not self._matches(elem, RANGE_STARTS[tag]):
+                return [elem]
+            self._ranges.add((RANGE_STARTS[tag], elem.get(W + "id")))
+            return []
+        if tag in RANGE_ENDS:
+            if (RANGE_ENDS[tag], elem.get(W + "id")) in self._ranges:
+                return []
+            return [elem]
+
+        if tag in PROPERTY_CHANGES:
+            if not self._matches(elem, tag):
+                return [elem]
+            self.counts[_kind_name(tag)] += 1
+            if not self.accept:
+                self._restore_properties(elem)
+            return []
+
+        if tag == W + "p" and self._resolve_marker(elem, W + "pPr"):
+            self._merged.add(elem)
+        elif tag == W + "tr" and self._resolve_marker(elem, W + "trPr"):
+            return []
+
+        self._resolve_children(elem)
+        if tag == W + "tbl" and elem.find(W + "tr") is None:
+            # A table whose rows were all removed is removed with them
+            return []
+        return [elem]
+
+    def _resolve_children(self, parent):
+        """Resolve every child of parent in place, then merge marked paragraphs."""
+        for child in list(parent):
+            if not isinstance(child.tag, str):
+                continue
+            replacement = self.resolve_block(child)
+            if replacement == [child]:
+                continue
+            if replacement and replacement[0] is not child:
+                # Unwrapped change: its content takes its place
+                unwrap_element(parent, child)
+            else:
+                parent.remove(child)
+
+        if self._merged:
+            for child in list(parent):
+                if child in self._merged:
+                    self._merged.discard(child)
+                    following = child.getnext()
+                    if following is not None and following.tag == W + "p":
+                        _merge_paragraph(child, following)
+                        parent.remove(child)
+
+    def _restore_properties(self, change):
+        """Replace a properties element's children with those recorded in change."""
+        props = change.getparent()
+        old = list(change[0]) if len(change) else []
+        for child in list(props):
+            if child is not change and child.tag not in KEPT_PROPERTIES:
+                props.remove(child)
+        if props.tag == W + "rPr":
+            props.extend(old)
+        else:
+            # Restored properties go first, after any header/footer references
+            start = 0
+            while start < len(props) and props[start].tag in HEADER_FOOTER_REFERENCES:
+                start += 1
+            for index, child in enumerate(old):
+                props.insert(start + index, child)
+
+    # ==================== Streaming ====================
+
+    def stream_part(self, part):
+        """Rewrite one XML part with matching revisions resolved."""
+        with open(part, "rb") as f:
+            header = f.read(200).decode("utf-8", errors="ignore")
+        standalone = 'standalone="yes"' in header
+
+        tmp_path = part.with_name(part.name + ".tmp")
+        with open(part, "rb") as source, open(tmp_path, "wb") as out:
+            out.write(
+                b'<?xml version="1.0" encoding="UTF-8"'
+                + (b' standalone="yes"' if standalone else b"")
+                + b"?>\n"
+            )
+            self._stream(source, out)
+        # Written through a new file so hard links to the original are not modified
+        os.replace(tmp_path, part)
+
+    def _stream(self, source, out):
+        """Copy source to out, resolving revisions in each top-level block."""
+        events = lxml.etree.iterparse(
+            source,
+            events=("start", "end"),
+            resolve_entities=False,
+            no_network=True,
+            huge_tree=False,
+        )
+        # Containers are written as bare start/end tags; their element
+        # children are the blocks resolved and written one at a time
+        containers = []
+        pending = None  # Paragraph whose mark was removed, to merge forward
+        for event, elem in events:
+            parent = elem.getparent()
+            is_container = parent is None or (
+                parent is containers[0] and elem.tag == W + "body"
+            )
+            if event == "start":
+                if is_container:
+                    inherited = parent.nsmap if parent is not None else {}
+                    out.write(_start_tag(elem, inherited))
+                    containers.append(elem)
+                continue
+
+            if elem is containers[-1]:
+                if pending is not None:
+                    out.write(serialize_element(pending, elem.nsmap))
+                    pending = None
+                out.write(f"</{_qualified_name(elem)}>".encode())
+                containers.pop()
+                continue
+            if parent is not containers[-1]:
+                continue
+
+            for block in self.resolve_block(elem):
+                if pending is not None:
+                    if block.tag == W + "p":
+                        _merge_paragraph(pending, block)
+                    else:
+                        out.write(serialize_element(pending, parent.nsmap))
+                    pending = None
+                if block in self._merged:
+                    self._merged.discard(block)
+                    pending = block
+                else:
+                    out.write(serialize_element(block, parent.nsmap))
+            parent.remove(elem)
+
+
+def _merge_paragraph(paragraph, following):
+    """Move paragraph's content to the start of the following paragraph."""
+    content = [c for c in paragraph if c.tag != W + "pPr"]
+    index = 1 if len(following) and following[0].tag == W + "pPr" else 0
+    for child in reversed(content):
+        following.insert(index, child)
+
+
+def _qualified_name(elem):
+    local = lxml.etree.QName(elem).localname
+    return f"{elem.prefix}:{local}" if elem.prefix else local
+
+
+def _declarations(nsmap):
+    """Serialized xmlns attributes for an nsmap, as lxml writes them."""
+    for prefix, uri in nsmap.items():
+        escaped = uri.replace("&", "&amp;").replace('"', "&quot;")
+        name = f"xmlns:{prefix}" if prefix else "xmlns"
+        yield f' {name}="{escaped}"'.encode()
+
+
+def serialize_element(elem, inherited):
+    """Serialize elem without re-declaring namespaces its container declares."""
+    data = lxml.etree.tostring(elem, encoding="utf-8", with_tail=False)
+    end = data.index(b">")
+    nsmap = elem.nsmap
+    own = {k: v for k, v in nsmap.items() if inherited.get(k) != v}
+    if not own:
+        return _DECLARATION.sub(b"", data[:end]) + data[end:]
+
+    head = data[:end]
+    own = set(_declarations(own))
+    for declaration in _declarations(nsmap):
+        if declaration not in own:
+            head = head.replace(declaration, b"", 1)
+    return head + data[end:]
+
+
+def _start_tag(elem, inherited):
+    """Start tag of a container element with its attributes and own namespaces."""
+    shell = lxml.etree.Element(elem.tag, attrib=dict(elem.attrib), nsmap=elem.nsmap)
+    shell.text = ""
+    data = serialize_element(shell, inherited)
+    return data[: data.rindex(b"</")]
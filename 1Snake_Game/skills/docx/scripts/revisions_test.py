@@ -0,0 +1,96 @@
+import unittest
+import tempfile
+from pathlib import Path
+
+import lxml.etree
+
+from .revisions import W, accept_changes, reject_changes
+
+
+NAMESPACES = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+)
+
+
+R = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+
+
+# Run from the docx directory: python -m pytest scripts/revisions_test.py
+class TestResolveChanges(unittest.TestCase):
+
+    def resolve(self, body, accept):
+        """Write body into word/document.xml, resolve it and return the w:body"""
+        with tempfile.TemporaryDirectory() as unpacked:
+            part = Path(unpacked) / "word" / "document.xml"
+            part.parent.mkdir()
+            part.write_text(
+                f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                f"<w:document {NAMESPACES}><w:body>{body}</w:body></w:document>",
+                encoding="utf-8",
+            )
+            resolve = accept_changes if accept else reject_changes
+            counts = resolve(unpacked)
+            root = lxml.etree.parse(str(part)).getroot()
+        return counts, root.find(W + "body")
+
+    def local_names(self, elem):
+        return [lxml.etree.QName(child).localname for child in elem]
+
+    SECTION = (
+        "<w:p><w:r><w:t>text</w:t></w:r></w:p>"
+        "<w:sectPr>"
+        '<w:headerReference w:type="default" r:id="rId8"/>'
+        '<w:footerReference w:type="default" r:id="rId9"/>'
+        '<w:pgSz w:w="15840" w:h="12240" w:orient="landscape"/>'
+        '<w:sectPrChange w:id="1" w:author="Claude" w:date="2025-01-01T00:00:00Z">'
+        '<w:sectPr><w:pgSz w:w="12240" w:h="15840"/><w:pgMar w:top="1440"/></w:sectPr>'
+        "</w:sectPrChange>"
+        "</w:sectPr>"
+    )
+
+    def test_reject_section_change_keeps_header_and_footer_references(self):
+        """Rejecting a sectPrChange restores the old properties, not the references"""
+        counts, body = self.resolve(self.SECTION, accept=False)
+        self.assertEqual(counts["w:sectPrChange"], 1)
+        sect_pr = body.find(W + "sectPr")
+        self.assertEqual(
+            self.local_names(sect_pr),
+            ["headerReference", "footerReference", "pgSz", "pgMar"],
+        )
+        header = sect_pr.find(W + "headerReference")
+        self.assertEqual(header.get(R + "id"), "rId8")
+        self.assertEqual(sect_pr.find(W + "pgSz").get(W + "w"), "12240")
+
+    def test_accept_section_change_keeps_new_properties(self):
+        """Accepting a sectPrChange only drops the recorded change"""
+        counts, body = self.resolve(self.SECTION, accept=True)
+        self.assertEqual(counts["w:sectPrChange"], 1)
+        sect_pr = body.find(W + "sectPr")
+        self.assertEqual(
+            self.local_names(sect_pr), ["headerReference", "footerReference", "pgSz"]
+        )
+        self.assertEqual(sect_pr.find(W + "pgSz").get(W + "orient"), "landscape")
+
+    def test_reject_paragraph_change_keeps_mark_properties(self):
+        """Rejecting a pPrChange keeps the paragraph mark's rPr and sectPr"""
+        body = (
+            "<w:p><w:pPr>"
+            '<w:jc w:val="center"/>'
+            "<w:rPr><w:b/></w:rPr>"
+            '<w:sectPr><w:headerReference w:type="first" r:id="rId3"/></w:sectPr>'
+            '<w:pPrChange w:id="2" w:author="Claude" w:date="2025-01-01T00:00:00Z">'
+            '<w:pPr><w:jc w:val="left"/></w:pPr>'
+            "</w:pPrChange>"
+            "</w:pPr><w:r><w:t>text</w:t></w:r></w:p>"
+        )
+        counts, body = self.resolve(body, accept=False)
+        self.assertEqual(counts["w:pPrChange"], 1)
+        p_pr = body.find(f"{W}p/{W}pPr")
+        self.assertEqual(self.local_names(p_pr), ["jc", "rPr", "sectPr"])
+        self.assertEqual(p_pr.find(W + "jc").get(W + "val"), "left")
+        self.assertIsNotNone(p_pr.find(f"{W}sectPr/{W}headerReference"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,10 @@ This module provides XMLEditor, a tool for manipulating XML files with support f
 line-number-based node finding and DOM manipulation. Each element is automatically
 annotated with its original line and column position during parsing.
 
+LxmlXMLEditor offers the same API on top of lxml, using the parser's native
+source line numbers instead of a DOM annotated through SAX callbacks. It parses
+large parts much faster and with a fraction of the memory.
+
 Example usage:
     editor = XMLEditor("document.xml")
 
@@ -15,6 +19,8 @@ Example usage:
 
     # Find node by text content
     elem = editor.get_node(tag="w:p", contains="specific text")
+    elem = editor.get_node(tag="w:p", contains=["first", "second"])
+    elem = editor.get_node(tag="w:p", pattern=r"Section \d+\.\d+")
 
     # Find node by attributes
     elem = editor.get_node(tag="w:r", attrs={"w:id": "target"})
@@ -28,14 +34,30 @@ Example usage:
 
     # Save changes
     editor.save()
+
+    # Same API on the lxml backend
+    editor = LxmlXMLEditor("document.xml")
 """
 
+import copy
+import hashlib
 import html
+import os
+import re
+from collections import OrderedDict, defaultdict
 from pathlib import Path
 from typing import Optional, Union
 
 import defusedxml.minidom
 import defusedxml.sax
+import lxml.etree
+
+# Namespace bound to the reserved "xml" prefix (xml:space, xml:lang)
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+
+# Parsed fragments up to this size are kept as templates for reuse
+_FRAGMENT_TEMPLATE_MAX_CHARS = 4096
+_FRAGMENT_TEMPLATE_LIMIT = 512
 
 
 class XMLEditor:
@@ -50,6 +72,7 @@ class XMLEditor:
         xml_path: Path to the XML file being edited
         encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
         dom: Parsed DOM tree with parse_position attributes on elements
+        dirty: True while the document may differ from xml_path (see the dirty property)
     """
 
     def __init__(self, xml_path):
@@ -70,15 +93,84 @@ class XMLEditor:
             header = f.read(200).decode("utf-8", errors="ignore")
         self.encoding = "ascii" if 'encoding="ascii"' in header else "utf-8"
 
+        self._parse_file()
+        self._dirty = False
+        self._baseline = None
+
+        # Nodes handed to the caller (get_node, resolve) may be edited directly.
+        # _unchecked maps those handed out since the last lookup to their
+        # placement, and the next lookup re-reads them once. _exposed keeps the
+        # outermost handed-out elements, re-read only when a lookup hits stale
+        # text or finds nothing. dom access drops the cache.
+        self._handed_out = False
+        self._exposed = {}
+        self._unchecked = {}
+        self._dom_exposed = False
+
+        # Cached text projection per element and n-gram indexes per tag,
+        # built lazily by contains/pattern lookups and kept current on mutation
+        self._text_cache = {}
+        self._text_indexes = {}
+
+        # Namespace prelude for fragment wrappers and parsed fragment templates,
+        # both invalidated when the root's namespace declarations change
+        self._ns_prelude = None
+        self._fragment_templates = OrderedDict()
+
+        # Next free numeric id per (tags, attribute, prefix), seeded by one scan
+        # on first use and advanced as elements are inserted. Shared keys count
+        # ids beyond this document too (see WindowedPart), so a reset only
+        # raises them by a rescan instead of dropping them.
+        self._id_counters = {}
+        self._shared_id_keys = frozenset()
+
+        # Handles issued by get_handle, in both directions
+        self._handles = {}
+        self._handle_of = {}
+
+    @property
+    def dom(self):
+        """
+        Parsed DOM tree, for edits the editor methods do not cover.
+
+        Edit it freely: once it was accessed the next contains/pattern lookup
+        re-reads the text, and dirty compares the document with its state at
+        the time of access.
+        """
+        self._hand_out_all()
+        return self._dom
+
+    @property
+    def dirty(self):
+        """
+        True while the document may differ from xml_path.
+
+        Set by edits through the editor and cleared by save(). Nodes handed
+        out (get_node, resolve or dom) can be changed directly, so while the
+        editor made no edits of its own the document is compared with a
+        digest taken when the first of them was handed out.
+        """
+        if not self._dirty and self._baseline is not None:
+            self._dirty = self._digest() != self._baseline
+        return self._dirty
+
+    @dirty.setter
+    def dirty(self, value):
+        self._dirty = value
+        self._baseline = None
+
+    def _parse_file(self):
+        """Parse xml_path into a DOM annotated with element positions."""
         parser = _create_line_tracking_parser()
-        self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
+        self._dom = defusedxml.minidom.parse(str(self.xml_path), parser)
 
     def get_node(
         self,
         tag: str,
         attrs: Optional[dict[str, str]] = None,
         line_number: Optional[Union[int, range]] = None,
-        contains: Optional[str] = None,
+        contains: Optional[Union[str, list[str]]] = None,
+        pattern: Optional[Union[str, re.Pattern]] = None,
     ):
         """
         Get a DOM element by tag and identifier.
@@ -92,9 +184,12 @@ class XMLEditor:
             line_number: Line number (int) or line range (range) in original XML file (1-indexed)
             contains: Text string that must appear in any text node within the element.
                       Supports both entity notation (&#8220;) and Unicode characters (\u201c).
+                      A list of strings requires every term to appear.
+            pattern: Regular expression (str or compiled) searched in the element's text
 
         Returns:
-            defusedxml.minidom.Element: The matching DOM element
+            The matching element (defusedxml.minidom.Element, or
+            lxml.etree._Element for LxmlXMLEditor)
 
         Raises:
             ValueError: If node not found or multiple matches found
@@ -108,41 +203,27 @@ class XMLEditor:
             elem = editor.get_node(tag="w:p", contains="specific text")
             elem = editor.get_node(tag="w:t", contains="&#8220;Agreement")  # Entity notation
             elem = editor.get_node(tag="w:t", contains="\u201cAgreement")   # Unicode character
+            elem = editor.get_node(tag="w:p", contains=["Term", "Renewal"])
+            elem = editor.get_node(tag="w:p", pattern=r"\$\d+(\.\d\d)?")
         """
-        matches = []
-        for elem in self.dom.getElementsByTagName(tag):
-            # Check line_number filter
-            if line_number is not None:
-                parse_pos = getattr(elem, "parse_position", (None,))
-                elem_line = parse_pos[0]
-
-                # Handle both single line number and range
-                if isinstance(line_number, range):
-                    if elem_line not in line_number:
-                        continue
-                else:
-                    if elem_line != line_number:
-                        continue
-
-            # Check attrs filter
-            if attrs is not None:
-                if not all(
-                    elem.getAttribute(attr_name) == attr_value
-                    for attr_name, attr_value in attrs.items()
-                ):
-                    continue
-
-            # Check contains filter
-            if contains is not None:
-                elem_text = self._get_element_text(elem)
-                # Normalize the search string: convert HTML entities to Unicode characters
-                # This allows searching for both "&#8220;Rowan" and ""Rowan"
-                normalized_contains = html.unescape(contains)
-                if normalized_contains not in elem_text:
-                    continue
-
-            # If all applicable filters passed, this is a match
-            matches.append(elem)
+        terms = None
+        if contains is not None:
+            # Normalize the search strings: convert HTML entities to Unicode characters
+            # This allows searching for both "&#8220;Rowan" and ""Rowan"
+            raw_terms = [contains] if isinstance(contains, str) else list(contains)
+            terms = [html.unescape(term) for term in raw_terms]
+        regex = re.compile(pattern) if isinstance(pattern, str) else pattern
+
+        text_filter = terms is not None or regex is not None
+        if text_filter:
+            self._check_handed_out()
+        matches = self._filter_nodes(tag, attrs, line_number, terms, regex)
+        if text_filter and self._exposed and (
+            not matches or any([self._revalidate_subtree(m) for m in matches])
+        ):
+            # A handed-out node was edited after the lookup that checked it
+            self._check_handed_out(everything=True)
+            matches = self._filter_nodes(tag, attrs, line_number, terms, regex)
 
         if not matches:
             # Build descriptive error message
@@ -158,12 +239,14 @@ class XMLEditor:
                 filters.append(f"with attributes {attrs}")
             if contains is not None:
                 filters.append(f"containing '{contains}'")
+            if pattern is not None:
+                filters.append(f"matching /{getattr(pattern, 'pattern', pattern)}/")
 
             filter_desc = " ".join(filters) if filters else ""
             base_msg = f"Node not found: <{tag}> {filter_desc}".strip()
 
             # Add helpful hint based on filters used
-            if contains:
+            if contains or pattern:
                 hint = "Text may be split across elements or use different wording."
             elif line_number:
                 hint = "Line numbers may have changed if document was modified."
@@ -178,14 +261,60 @@ class XMLEditor:
                 f"Multiple nodes found: <{tag}>. "
                 f"Add more filters (attrs, line_number, or contains) to narrow the search."
             )
+        self._hand_out(matches[0])
         return matches[0]
 
+    def _filter_nodes(self, tag, attrs, line_number, terms, regex):
+        """Elements with the tag that pass every given get_node filter."""
+        if terms is not None or regex is not None:
+            # Text filters are answered from the index without walking the DOM
+            candidates = self._get_text_index(tag).candidates(terms or [])
+        else:
+            candidates = self._iter_elements(tag)
+
+        matches = []
+        for elem in candidates:
+            # Check line_number filter
+            if line_number is not None:
+                elem_line = self._line_number(elem)
+
+                # Handle both single line number and range
+                if isinstance(line_number, range):
+                    if elem_line not in line_number:
+                        continue
+                else:
+                    if elem_line != line_number:
+                        continue
+
+            # Check attrs filter
+            if attrs is not None:
+                if not all(
+                    self._get_attr(elem, attr_name) == attr_value
+                    for attr_name, attr_value in attrs.items()
+                ):
+                    continue
+
+            # Check contains and pattern filters
+            if terms is not None or regex is not None:
+                elem_text = self._get_element_text(elem)
+                if terms is not None and not all(term in elem_text for term in terms):
+                    continue
+                if regex is not None and not regex.search(elem_text):
+                    continue
+
+            # If all applicable filters passed, this is a match
+            matches.append(elem)
+
+        return matches
+
     def _get_element_text(self, elem):
         """
         Recursively extract all text content from an element.
 
         Skips text nodes that contain only whitespace (spaces, tabs, newlines),
         which typically represent XML formatting rather than document content.
+        Results are cached per element, so repeated lookups reuse the text of
+        unchanged subtrees.
 
         Args:
             elem: defusedxml.minidom.Element to extract text from
@@ -193,6 +322,22 @@ class XMLEditor:
         Returns:
             str: Concatenated text from all non-whitespace text nodes within the element
         """
+        cached = self._text_cache.get(elem)
+        if cached is not None:
+            return cached
+
+        text = self._extract_text(elem)
+        self._text_cache[elem] = text
+        return text
+
+    def _extract_text(self, elem, child_text=None):
+        """
+        Join the element's own text with the text of its children.
+
+        child_text gives a child element's text and defaults to the cached
+        _get_element_text.
+        """
+        child_text = child_text or self._get_element_text
         text_parts = []
         for node in elem.childNodes:
             if node.nodeType == node.TEXT_NODE:
@@ -200,9 +345,307 @@ class XMLEditor:
                 if node.data.strip():
                     text_parts.append(node.data)
             elif node.nodeType == node.ELEMENT_NODE:
-                text_parts.append(self._get_element_text(node))
+                text_parts.append(child_text(node))
         return "".join(text_parts)
 
+    def _get_text_index(self, tag):
+        """Get the n-gram index for a tag, building it on first use."""
+        if tag not in self._text_indexes:
+            index = _TextIndex(self, tag)
+            for elem in self._iter_elements(tag):
+                index.add(elem)
+            self._text_indexes[tag] = index
+        return self._text_indexes[tag]
+
+    def get_handle(self, elem):
+        """
+        Get a stable string handle for an element, to find it again with resolve().
+
+        Within a session the handle follows the element through edits, and
+        replace_node moves it to the first replacement element. Handles are
+        plain strings, so they can be stored and resolved after save() and
+        reloading the file, without searching by text or line number again.
+        This editor uses an XPath-like location path from the root (e.g.
+        "/w:document[1]/w:body[1]/w:sectPr[1]"), which holds as long as no
+        earlier sibling with the same tag on the path is inserted or removed.
+
+        Args:
+            elem: Element in this editor's document
+
+        Returns:
+            str: The handle
+
+        Example:
+            handle = editor.get_handle(editor.get_node(tag="w:p", line_number=42))
+            ...  # edits, save(), reload
+            para = editor.resolve(handle)
+        """
+        handle = self._handle_of.get(elem)
+        if handle is None:
+            handle = self._make_handle(elem)
+            self._remember_handle(handle, elem)
+        return handle
+
+    def resolve(self, handle):
+        """
+        Get the element for a handle from get_handle().
+
+        Args:
+            handle: Handle string, possibly issued before a save and reload
+
+        Returns:
+            The element
+
+        Raises:
+            ValueError: If no element matches the handle
+        """
+        elem = self._handles.get(handle)
+        if elem is None or not self._is_attached(elem):
+            elem = self._locate_handle(handle)
+            if elem is None:
+                raise ValueError(f"No element found for handle {handle!r}")
+            self._remember_handle(handle, elem)
+        self._hand_out(elem)
+        return elem
+
+    def _make_handle(self, elem):
+        """Location path from the root, e.g. "/w:document[1]/w:body[1]"."""
+        steps = []
+        node = elem
+        while node is not None:
+            steps.append(self._path_step(node))
+            node = self._parent(node)
+        return "/" + "/".join(reversed(steps))
+
+    def _locate_handle(self, handle):
+        """Element at a location path handle, or None."""
+        steps = handle.split("/")
+        if steps[0] or len(steps) < 2 or self._path_step(self._root()) != steps[1]:
+            return None
+        return self._follow_path(self._root(), "/".join(steps[2:]))
+
+    def _follow_path(self, elem, path):
+        """Descend from elem along "tag[n]/tag[n]" steps (None if any is missing)."""
+        for step in filter(None, path.split("/")):
+            match = _PATH_STEP.fullmatch(step)
+            if match is None:
+                return None
+            tag, position = match.group(1), int(match.group(2))
+            same_tag = [
+                child
+                for child in self._child_elements(elem)
+                if self._tag_name(child) == tag
+            ]
+            if not 1 <= position <= len(same_tag):
+                return None
+            elem = same_tag[position - 1]
+        return elem
+
+    def _path_step(self, elem):
+        """Location step "tag[n]": elem is the n-th child with its tag (1-based)."""
+        tag = self._tag_name(elem)
+        parent = self._parent(elem)
+        if parent is None:
+            return f"{tag}[1]"
+        position = 1
+        for sibling in self._child_elements(parent):
+            if sibling is elem:
+                break
+            if self._tag_name(sibling) == tag:
+                position += 1
+        return f"{tag}[{position}]"
+
+    def _remember_handle(self, handle, elem):
+        stale = self._handles.get(handle)
+        if stale is not None:
+            self._handle_of.pop(stale, None)
+        self._handles[handle] = elem
+        self._handle_of[elem] = handle
+
+    def _retarget_handle(self, old, nodes):
+        """Move the handle of a replaced element to the first new element."""
+        handle = self._handle_of.pop(old, None)
+        if handle is None:
+            return
+        del self._handles[handle]
+        for node in nodes:
+            if self._is_element(node):
+                self._remember_handle(handle, node)
+                return
+
+    def mark_dirty(self):
+        """
+        Record that the document was changed outside the editor methods.
+
+        Direct edits already count for dirty (see there). The next lookup
+        re-reads the nodes handed out since the previous one, and a lookup
+        that hits stale text or finds nothing re-reads all of them. Call this
+        after direct edits to nodes kept from earlier lookups, so that new
+        ids and new duplicate matches are seen too.
+        """
+        self.dirty = True
+        self._unchecked.clear()
+        self.invalidate_text_cache()
+        self._reset_id_counters()
+
+    def invalidate_text_cache(self):
+        """Drop all cached element text and search indexes."""
+        self._text_cache.clear()
+        self._text_indexes.clear()
+
+    def _hand_out(self, elem):
+        """Record that elem was returned to the caller, who may edit it directly."""
+        self._take_baseline()
+        self._handed_out = True
+        placement = self._placement(elem)
+        self._unchecked[elem] = placement
+        if not self._covered(elem, self._exposed):
+            for other in [e for e in self._exposed if self._covered(e, (elem,))]:
+                del self._exposed[other]
+            self._exposed[elem] = placement
+
+    def _hand_out_all(self):
+        """Record that the whole document was handed out (dom access)."""
+        self._take_baseline()
+        self._handed_out = True
+        self._dom_exposed = True
+
+    def _take_baseline(self):
+        """Digest the document before the caller can edit it directly (see dirty)."""
+        if not self._dirty and self._baseline is None:
+            self._baseline = self._digest()
+
+    def _digest(self, content=None):
+        """Digest of the serialized document (or of content from _serialize)."""
+        return hashlib.sha256(self._serialize() if content is None else content).digest()
+
+    def _covered(self, elem, roots):
+        """Check whether a proper ancestor of elem is one of roots."""
+        ancestor = self._parent(elem)
+        while ancestor is not None:
+            if ancestor in roots:
+                return True
+            ancestor = self._parent(ancestor)
+        return False
+
+    def _check_handed_out(self, everything=False):
+        """
+        Bring the text cache, indexes and id counters in line with direct edits.
+
+        After dom access everything is dropped. Otherwise the elements handed
+        out since the last check (all of _exposed with everything=True) are
+        checked: a change to an element's placement (see _placement)
+        invalidates its parent, and the subtrees not covered by another
+        checked element are re-read and compared with the cache.
+        """
+        if self._dom_exposed:
+            self._dom_exposed = False
+            self._unchecked.clear()
+            self.invalidate_text_cache()
+            self._reset_id_counters()
+            for elem in list(self._exposed):
+                if self._is_attached(elem):
+                    self._exposed[elem] = self._placement(elem)
+                else:
+                    del self._exposed[elem]
+            return
+
+        roots = dict(self._exposed) if everything else {}
+        roots.update(self._unchecked)
+        self._unchecked = {}
+        attached = set()
+        for elem, placement in roots.items():
+            current = self._placement(elem) if self._is_attached(elem) else None
+            if current != placement:
+                old_parent = placement[0]
+                if old_parent is not None and self._is_attached(old_parent):
+                    self._node_changed(old_parent, inserted=self._child_elements(old_parent))
+                if current is None:
+                    self._node_changed(None, removed=[elem])
+                elif current[0] is not old_parent:
+                    self._node_changed(current[0], inserted=[elem])
+            if current is None:
+                self._exposed.pop(elem, None)
+                continue
+            attached.add(elem)
+            if elem in self._exposed:
+                self._exposed[elem] = current
+
+        for elem in attached:
+            if not self._covered(elem, attached):
+                self._revalidate_subtree(elem)
+
+    def _revalidate_subtree(self, elem):
+        """
+        Re-read the text under elem, marking elements whose text changed.
+
+        Returns:
+            bool: True if any element's text differed from the cache or index
+        """
+        changed = False
+
+        def fresh_text(node):
+            nonlocal changed
+            text = self._extract_text(node, fresh_text)
+            index = self._text_indexes.get(self._tag_name(node))
+            if self._text_cache.get(node, text) != text or (
+                index is not None and node not in index.texts
+            ):
+                changed = True
+                self._text_cache[node] = text
+                if index is not None:
+                    index.mark_stale(node)
+            if self._id_counters:
+                self._observe_ids(node)
+            return text
+
+        cached = self._text_cache.get(elem)
+        if fresh_text(elem) != cached and cached is not None:
+            self._node_changed(self._parent(elem))
+        return changed
+
+    def _node_changed(self, parent, inserted=(), removed=()):
+        """
+        Keep the text cache and search indexes in step with a DOM mutation.
+
+        Args:
+            parent: Element whose children changed; it and its ancestors are re-read
+            inserted: Nodes newly placed under parent (or moved there)
+            removed: Nodes detached from the document
+        """
+        self.dirty = True
+        for node in removed:
+            for elem in self._subtree_elements(node):
+                self._text_cache.pop(elem, None)
+                index = self._text_indexes.get(self._tag_name(elem))
+                if index is not None:
+                    index.discard(elem)
+
+        for node in inserted:
+            for elem in self._subtree_elements(node):
+                self._text_cache.pop(elem, None)
+                index = self._text_indexes.get(self._tag_name(elem))
+                if index is not None:
+                    index.mark_stale(elem)
+                if self._id_counters:
+                    self._observe_ids(elem)
+
+        ancestor = parent if parent is not None and self._is_element(parent) else None
+        while ancestor is not None:
+            self._text_cache.pop(ancestor, None)
+            index = self._text_indexes.get(self._tag_name(ancestor))
+            if index is not None:
+                index.mark_stale(ancestor)
+            ancestor = self._parent(ancestor)
+
+        for handed_out in (self._exposed, self._unchecked):
+            # Placements changed by the editor itself are not direct edits
+            for node in removed:
+                handed_out.pop(node, None)
+            for elem, placement in handed_out.items():
+                if placement[0] is parent or elem in inserted:
+                    handed_out[elem] = self._placement(elem)
+
     def replace_node(self, elem, new_content):
         """
         Replace a DOM element with new XML content.
@@ -217,11 +660,8 @@ class XMLEditor:
         Example:
             new_nodes = editor.replace_node(old_elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
         nodes = self._parse_fragment(new_content)
-        for node in nodes:
-            parent.insertBefore(node, elem)
-        parent.removeChild(elem)
+        self._place_replace(elem, nodes)
         return nodes
 
     def insert_after(self, elem, xml_content):
@@ -238,14 +678,8 @@ class XMLEditor:
         Example:
             new_nodes = editor.insert_after(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
-        next_sibling = elem.nextSibling
         nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            if next_sibling:
-                parent.insertBefore(node, next_sibling)
-            else:
-                parent.appendChild(node)
+        self._place_after(elem, nodes)
         return nodes
 
     def insert_before(self, elem, xml_content):
@@ -262,10 +696,8 @@ class XMLEditor:
         Example:
             new_nodes = editor.insert_before(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
         nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            parent.insertBefore(node, elem)
+        self._place_before(elem, nodes)
         return nodes
 
     def append_to(self, elem, xml_content):
@@ -283,21 +715,133 @@ class XMLEditor:
             new_nodes = editor.append_to(elem, "<w:r><w:t>text</w:t></w:r>")
         """
         nodes = self._parse_fragment(xml_content)
+        self._place_append(elem, nodes)
+        return nodes
+
+    def batch_insert(self, operations):
+        """
+        Apply many insertions, parsing all of their fragments in one parser call.
+
+        Args:
+            operations: Iterable of (method, elem, xml_content) tuples, where method
+                is "replace_node", "insert_before", "insert_after" or "append_to".
+                Operations are applied in order.
+
+        Returns:
+            List[List[Node]]: The inserted nodes of each operation
+
+        Example:
+            results = editor.batch_insert([
+                ("insert_before", start, '<w:commentRangeStart w:id="0"/>'),
+                ("insert_after", end, '<w:commentRangeEnd w:id="0"/>'),
+            ])
+        """
+        operations = list(operations)
+        placements = {
+            "replace_node": self._place_replace,
+            "insert_before": self._place_before,
+            "insert_after": self._place_after,
+            "append_to": self._place_append,
+        }
+        for method, _, _ in operations:
+            if method not in placements:
+                raise ValueError(f"Unknown batch_insert method: {method}")
+
+        fragments = self._parse_fragments([xml for _, _, xml in operations])
+        for (method, elem, _), nodes in zip(operations, fragments):
+            placements[method](elem, nodes)
+        return fragments
+
+    def _place_replace(self, elem, nodes):
+        parent = elem.parentNode
+        for node in nodes:
+            parent.insertBefore(node, elem)
+        parent.removeChild(elem)
+        if self._handle_of:
+            self._retarget_handle(elem, nodes)
+        self._node_changed(parent, inserted=nodes, removed=[elem])
+
+    def _place_after(self, elem, nodes):
+        parent = elem.parentNode
+        next_sibling = elem.nextSibling
+        for node in nodes:
+            if next_sibling:
+                parent.insertBefore(node, next_sibling)
+            else:
+                parent.appendChild(node)
+        self._node_changed(parent, inserted=nodes)
+
+    def _place_before(self, elem, nodes):
+        parent = elem.parentNode
+        for node in nodes:
+            parent.insertBefore(node, elem)
+        self._node_changed(parent, inserted=nodes)
+
+    def _place_append(self, elem, nodes):
         for node in nodes:
             elem.appendChild(node)
-        return nodes
+        self._node_changed(elem, inserted=nodes)
 
     def get_next_rid(self):
         """Get the next available rId for relationships files."""
-        max_id = 0
-        for rel_elem in self.dom.getElementsByTagName("Relationship"):
-            rel_id = rel_elem.getAttribute("Id")
-            if rel_id.startswith("rId"):
-                try:
-                    max_id = max(max_id, int(rel_id[3:]))
-                except ValueError:
-                    pass
-        return f"rId{max_id + 1}"
+        return f"rId{self._peek_id(('Relationship',), 'Id', prefix='rId', first=1)}"
+
+    def _peek_id(self, tags, attr, prefix="", first=0):
+        """
+        Next free numeric id for attr on elements with the given tags.
+
+        The document is scanned once per (tags, attr, prefix); afterwards the
+        counter is advanced by _allocate_id and by ids seen on inserted nodes,
+        so repeated lookups are O(1).
+
+        Args:
+            tags: Tuple of tag names sharing one id space (e.g. ("w:ins", "w:del"))
+            attr: Attribute holding the id (e.g. "w:id")
+            prefix: Literal prefix before the number (e.g. "rId")
+            first: Lowest id to hand out
+
+        Returns:
+            int: Number one above the largest id in use (at least first)
+        """
+        self._check_handed_out()
+        key = (tags, attr, prefix)
+        if key not in self._id_counters:
+            self._id_counters[key] = self._scan_ids(tags, attr, prefix, first)
+        return self._id_counters[key]
+
+    def _scan_ids(self, tags, attr, prefix="", first=0):
+        """Number one above the largest id in the document (at least first)."""
+        next_id = first
+        for tag in tags:
+            for elem in self._iter_elements(tag):
+                value = _parse_id(self._get_attr(elem, attr), prefix)
+                if value is not None and value >= next_id:
+                    next_id = value + 1
+        return next_id
+
+    def _reset_id_counters(self):
+        """Forget counters after direct edits; shared ones are raised by a rescan."""
+        for key in list(self._id_counters):
+            if key in self._shared_id_keys:
+                self._id_counters[key] = max(self._id_counters[key], self._scan_ids(*key))
+            else:
+                del self._id_counters[key]
+
+    def _allocate_id(self, tags, attr, prefix="", first=0):
+        """Reserve and return the next free id (see _peek_id)."""
+        next_id = self._peek_id(tags, attr, prefix, first)
+        self._id_counters[(tags, attr, prefix)] = next_id + 1
+        return next_id
+
+    def _observe_ids(self, elem):
+        """Advance seeded id counters past an id carried by an inserted element."""
+        tag = self._tag_name(elem)
+        for key, next_id in self._id_counters.items():
+            tags, attr, prefix = key
+            if tag in tags:
+                value = _parse_id(self._get_attr(elem, attr), prefix)
+                if value is not None and value >= next_id:
+                    self._id_counters[key] = value + 1
 
     def save(self):
         """
@@ -306,8 +850,222 @@ class XMLEditor:
         Serializes the DOM tree and writes it back to the original file path,
         preserving the original encoding (ascii or utf-8).
         """
-        content = self.dom.toxml(encoding=self.encoding)
-        self.xml_path.write_bytes(content)
+        content = self._serialize()
+        self._write(content)
+        self.dirty = False
+        if self._handed_out:
+            # Nodes still held by the caller are compared with what was written
+            self._baseline = self._digest(content)
+
+    def _serialize(self):
+        """The document as written by save()."""
+        return self._dom.toxml(encoding=self.encoding)
+
+    def _write(self, content):
+        """
+        Replace xml_path with content through a new file.
+
+        The file is never rewritten in place, so a hard link to the original
+        document (see Document) is detached rather than modified.
+        """
+        tmp_path = self.xml_path.with_name(self.xml_path.name + ".tmp")
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, self.xml_path)
+
+    # ==================== Backend primitives ====================
+    # Tracked-change and index code is written against these helpers so that
+    # LxmlXMLEditor only has to reimplement them for lxml elements.
+
+    def _iter_elements(self, tag):
+        """All elements in the document with the given prefixed tag name."""
+        return self._dom.getElementsByTagName(tag)
+
+    def _descendants(self, elem, tag):
+        """Descendant elements of elem (excluding elem) with the given tag."""
+        return elem.getElementsByTagName(tag)
+
+    def _subtree_elements(self, node):
+        """Node (if an element) followed by all of its descendant elements."""
+        if node.nodeType != node.ELEMENT_NODE:
+            return []
+        return [node, *node.getElementsByTagName("*")]
+
+    def _child_elements(self, elem):
+        """Direct element children of elem, in document order."""
+        return [c for c in elem.childNodes if c.nodeType == c.ELEMENT_NODE]
+
+    def _is_element(self, node):
+        return node.nodeType == node.ELEMENT_NODE
+
+    def _is_attached(self, elem):
+        """Check whether an element is still connected to the document."""
+        node = elem
+        while node.parentNode is not None:
+            node = node.parentNode
+        return node is self._dom
+
+    def _tag_name(self, elem):
+        return elem.tagName
+
+    def _parent(self, elem):
+        """Parent element, or None at the document element."""
+        parent = elem.parentNode
+        if parent is None or parent.nodeType != parent.ELEMENT_NODE:
+            return None
+        return parent
+
+    def _placement(self, elem):
+        """Parent element, its child count and elem's next sibling.
+
+        Direct edits next to elem (through parentNode) change at least one of them.
+        """
+        parent = self._parent(elem)
+        if parent is None:
+            return None, None, None
+        return parent, len(parent.childNodes), elem.nextSibling
+
+    def _line_number(self, elem):
+        return getattr(elem, "parse_position", (None,))[0]
+
+    def _root(self):
+        return self._dom.documentElement
+
+    def _has_attr(self, elem, name):
+        return elem.hasAttribute(name)
+
+    def _get_attr(self, elem, name):
+        return elem.getAttribute(name)
+
+    def _set_attr(self, elem, name, value):
+        elem.setAttribute(name, value)
+        self.dirty = True
+
+    def _remove_attr(self, elem, name):
+        elem.removeAttribute(name)
+        self.dirty = True
+
+    def _leading_text(self, elem):
+        """Text before the element's first child, or None."""
+        first = elem.firstChild
+        if first is not None and first.nodeType == first.TEXT_NODE:
+            return first.data
+        return None
+
+    def _text_content(self, elem):
+        """Concatenated text directly inside elem, including whitespace."""
+        return "".join(
+            node.data for node in elem.childNodes if node.nodeType == node.TEXT_NODE
+        )
+
+    def _set_text(self, elem, text):
+        """Replace the text directly inside elem (e.g. a w:t) with text."""
+        for node in [c for c in elem.childNodes if c.nodeType == c.TEXT_NODE]:
+            elem.removeChild(node)
+        if text:
+            self._prepend_child(elem, self._dom.createTextNode(text))
+        self._node_changed(elem)
+
+    def _declare_namespace(self, prefix, uri):
+        """Declare a namespace prefix on the root element if missing."""
+        root = self._root()
+        if not root.hasAttribute(f"xmlns:{prefix}"):
+            root.setAttribute(f"xmlns:{prefix}", uri)
+            self.dirty = True
+            self._namespaces_changed()
+
+    def _create_element(self, tag):
+        return self._dom.createElement(tag)
+
+    def _rename_element(self, elem, tag):
+        """Give elem a new tag name, keeping attributes and children.
+
+        Returns the element now in elem's place.
+        """
+        renamed = self._dom.createElement(tag)
+        # Copy ALL child nodes (not just firstChild) to handle entities
+        while elem.firstChild:
+            renamed.appendChild(elem.firstChild)
+        for i in range(elem.attributes.length):
+            attr = elem.attributes.item(i)
+            renamed.setAttribute(attr.name, attr.value)
+        elem.parentNode.replaceChild(renamed, elem)
+        return renamed
+
+    def _wrap(self, elem, tag):
+        """Wrap elem in a new element with the given tag and return the wrapper."""
+        wrapper = self._dom.createElement(tag)
+        parent = elem.parentNode
+        parent.insertBefore(wrapper, elem)
+        parent.removeChild(elem)
+        wrapper.appendChild(elem)
+        return wrapper
+
+    def _wrap_children(self, elem, tag, skip=()):
+        """Move elem's children (except tags in skip) into a new trailing child."""
+        wrapper = self._dom.createElement(tag)
+        for child in [c for c in elem.childNodes if c.nodeName not in skip]:
+            elem.removeChild(child)
+            wrapper.appendChild(child)
+        elem.appendChild(wrapper)
+        return wrapper
+
+    def _append_child(self, parent, child):
+        parent.appendChild(child)
+
+    def _prepend_child(self, parent, child):
+        if parent.firstChild:
+            parent.insertBefore(child, parent.firstChild)
+        else:
+            parent.appendChild(child)
+
+    def _clone(self, elem):
+        return elem.cloneNode(True)
+
+    def _to_xml(self, node):
+        return node.toxml()
+
+    def _root_namespaces(self):
+        """(prefix, uri) pairs declared on the root; prefix is None for xmlns."""
+        root_elem = self._dom.documentElement
+        namespaces = []
+        if root_elem and root_elem.attributes:
+            for i in range(root_elem.attributes.length):
+                attr = root_elem.attributes.item(i)
+                if attr.name.startswith("xmlns"):  # type: ignore
+                    _, _, prefix = attr.name.partition(":")  # type: ignore
+                    namespaces.append((prefix or None, attr.value))  # type: ignore
+        return namespaces
+
+    def _parse_wrapper(self, wrapper):
+        """Parse a wrapper document and return the children of each holder.
+
+        Every child of the wrapper's root holds one fragment.
+        """
+        fragment_doc = defusedxml.minidom.parseString(wrapper)
+        return [
+            list(holder.childNodes)
+            for holder in fragment_doc.documentElement.childNodes  # type: ignore
+        ]
+
+    def _instantiate(self, template):
+        """Copy template nodes into this document."""
+        return [self._dom.importNode(child, deep=True) for child in template]
+
+    # ==================== Fragment parsing ====================
+
+    def _namespace_prelude(self):
+        """The root's xmlns declarations as an attribute string (cached)."""
+        if self._ns_prelude is None:
+            self._ns_prelude = " ".join(
+                f'xmlns:{prefix}="{uri}"' if prefix else f'xmlns="{uri}"'
+                for prefix, uri in self._root_namespaces()
+            )
+        return self._ns_prelude
+
+    def _namespaces_changed(self):
+        """Drop state derived from the root's namespace declarations."""
+        self._ns_prelude = None
+        self._fragment_templates.clear()
 
     def _parse_fragment(self, xml_content):
         """
@@ -317,31 +1075,433 @@ class XMLEditor:
             xml_content: String containing XML fragment
 
         Returns:
-            List of defusedxml.minidom.Node objects imported into this document
+            List of nodes imported into this document
 
         Raises:
             AssertionError: If fragment contains no element nodes
         """
-        # Extract namespace declarations from the root document element
-        root_elem = self.dom.documentElement
-        namespaces = []
-        if root_elem and root_elem.attributes:
-            for i in range(root_elem.attributes.length):
-                attr = root_elem.attributes.item(i)
-                if attr.name.startswith("xmlns"):  # type: ignore
-                    namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
+        return self._parse_fragments([xml_content])[0]
 
-        ns_decl = " ".join(namespaces)
-        wrapper = f"<root {ns_decl}>{xml_content}</root>"
-        fragment_doc = defusedxml.minidom.parseString(wrapper)
-        nodes = [
-            self.dom.importNode(child, deep=True)
-            for child in fragment_doc.documentElement.childNodes  # type: ignore
+    def _parse_fragments(self, xml_contents):
+        """
+        Parse several XML fragments with at most one parser call.
+
+        Short fragments are memoized as parsed templates, so repeated snippets
+        (comment markers, reference runs) are only copied, never re-parsed.
+
+        Args:
+            xml_contents: List of strings containing XML fragments
+
+        Returns:
+            List of node lists, one per fragment, imported into this document
+
+        Raises:
+            AssertionError: If any fragment contains no element nodes
+        """
+        templates = self._fragment_templates
+        pending = [
+            content for content in dict.fromkeys(xml_contents) if content not in templates
         ]
-        elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
-        assert elements, "Fragment must contain at least one element"
+
+        parsed = {}
+        if pending:
+            # Each fragment gets its own holder element inside one wrapper document
+            body = "".join(f"<fragment>{content}</fragment>" for content in pending)
+            wrapper = f"<root {self._namespace_prelude()}>{body}</root>"
+            for content, template in zip(pending, self._parse_wrapper(wrapper)):
+                parsed[content] = template
+                if len(content) <= _FRAGMENT_TEMPLATE_MAX_CHARS:
+                    templates[content] = template
+                    if len(templates) > _FRAGMENT_TEMPLATE_LIMIT:
+                        templates.popitem(last=False)
+
+        results = []
+        for content in xml_contents:
+            template = parsed.get(content)
+            if template is None:
+                template = templates[content]
+                templates.move_to_end(content)
+            nodes = self._instantiate(template)
+            elements = [n for n in nodes if self._is_element(n)]
+            assert elements, "Fragment must contain at least one element"
+            results.append(nodes)
+        return results
+
+
+class LxmlXMLEditor(XMLEditor):
+    """
+    XMLEditor backed by lxml.
+
+    Exposes the same API as XMLEditor (get_node, replace_node, insert_before,
+    insert_after, append_to, get_next_rid, save), but elements are
+    lxml.etree._Element objects and line numbers come from the parser's native
+    sourceline. Tag and attribute names are given with prefixes ("w:p",
+    "w:id") and resolved against the namespaces declared in the document.
+
+    The parser never resolves external entities, loads DTDs or touches the
+    network.
+
+    Attributes:
+        xml_path: Path to the XML file being edited
+        encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
+        tree: Parsed lxml.etree._ElementTree
+        root: Root element of tree
+        dirty: True while the document may differ from xml_path (see XMLEditor.dirty)
+    """
+
+    @property
+    def tree(self):
+        """Parsed tree; like XMLEditor.dom, accessing it hands out the document."""
+        self._hand_out_all()
+        return self._tree
+
+    @property
+    def root(self):
+        """Root element of tree; accessing it hands out the document."""
+        self._hand_out_all()
+        return self._root_element
+
+    def _parse_file(self):
+        """Parse xml_path with a hardened lxml parser."""
+        self._tree = lxml.etree.parse(str(self.xml_path), _secure_lxml_parser())
+        self._root_element = self._tree.getroot()
+        self._refresh_namespaces()
+
+    def _refresh_namespaces(self):
+        """Rebuild the prefix <-> URI maps from the root element's declarations."""
+        self._namespaces = {"xml": XML_NAMESPACE}
+        self._namespaces.update(
+            {prefix: uri for prefix, uri in self._root_element.nsmap.items() if prefix}
+        )
+        self._default_namespace = self._root_element.nsmap.get(None)
+        self._prefixes = {uri: prefix for prefix, uri in self._namespaces.items()}
+
+    def _clark(self, name, is_attribute=False, context=None):
+        """
+        Convert a prefixed name ("w:p") to lxml's {uri}local notation.
+
+        Prefixes are resolved against the root element, then against the
+        declarations in scope at context. Returns None if the prefix is not
+        declared, in which case no element or attribute can carry that name.
+        """
+        prefix, _, local = name.rpartition(":")
+        if not prefix:
+            if is_attribute or not self._default_namespace:
+                return name
+            return f"{{{self._default_namespace}}}{name}"
+        uri = self._namespaces.get(prefix)
+        if uri is None and context is not None:
+            uri = context.nsmap.get(prefix)
+        return f"{{{uri}}}{local}" if uri else None
+
+    def _prefixed(self, elem):
+        """The element's tag in the document's prefixed form ("w:p")."""
+        tag = elem.tag
+        if not tag.startswith("{"):
+            return tag
+        uri, local = tag[1:].split("}", 1)
+        prefix = self._prefixes.get(uri, elem.prefix)
+        return f"{prefix}:{local}" if prefix else local
+
+    def _find_prefixed(self, elements, tag):
+        """Filter elements by a tag whose prefix is only declared below the root."""
+        return [elem for elem in elements if self._tag_name(elem) == tag]
+
+    def _place_replace(self, elem, nodes):
+        parent = elem.getparent()
+        for node in nodes:
+            elem.addprevious(node)
+        if nodes:
+            nodes[-1].tail = elem.tail
+        parent.remove(elem)
+        if self._handle_of:
+            self._retarget_handle(elem, nodes)
+        self._node_changed(parent, inserted=nodes, removed=[elem])
+
+    def _place_after(self, elem, nodes):
+        anchor = elem
+        for node in nodes:
+            anchor.addnext(node)
+            anchor = node
+        self._node_changed(elem.getparent(), inserted=nodes)
+
+    def _place_before(self, elem, nodes):
+        for node in nodes:
+            elem.addprevious(node)
+        self._node_changed(elem.getparent(), inserted=nodes)
+
+    def _place_append(self, elem, nodes):
+        for node in nodes:
+            elem.append(node)
+        self._node_changed(elem, inserted=nodes)
+
+    def _serialize(self):
+        return lxml.etree.tostring(
+            self._tree,
+            xml_declaration=True,
+            encoding=self.encoding,
+            standalone=self._tree.docinfo.standalone or None,
+        )
+
+    def _root_namespaces(self):
+        return list(self._root_element.nsmap.items())
+
+    def _parse_wrapper(self, wrapper):
+        root = lxml.etree.fromstring(wrapper, _secure_lxml_parser())
+        return [list(holder) for holder in root]
+
+    def _instantiate(self, template):
+        nodes = [copy.deepcopy(child) for child in template]
+        for node in nodes:
+            if self._is_element(node):
+                # Fragment line numbers say nothing about the edited file
+                for elem in node.iter(lxml.etree.Element):
+                    elem.sourceline = 0
         return nodes
 
+    def _extract_text(self, elem, child_text=None):
+        """Join the element's own text with the text of its children."""
+        child_text = child_text or self._get_element_text
+        text_parts = []
+        if elem.text and elem.text.strip():
+            text_parts.append(elem.text)
+        for child in elem:
+            if self._is_element(child):
+                text_parts.append(child_text(child))
+            if child.tail and child.tail.strip():
+                text_parts.append(child.tail)
+        return "".join(text_parts)
+
+    # ==================== Backend primitives ====================
+
+    def _iter_elements(self, tag):
+        clark = self._clark(tag)
+        if clark is None:
+            return self._find_prefixed(self._root_element.iter(lxml.etree.Element), tag)
+        return list(self._root_element.iter(clark))
+
+    def _descendants(self, elem, tag):
+        clark = self._clark(tag)
+        if clark is None:
+            return self._find_prefixed(elem.iterdescendants(lxml.etree.Element), tag)
+        return list(elem.iterdescendants(clark))
+
+    def _subtree_elements(self, node):
+        if not self._is_element(node):
+            return []
+        return list(node.iter(lxml.etree.Element))
+
+    def _child_elements(self, elem):
+        return list(elem.iterchildren(lxml.etree.Element))
+
+    def _is_element(self, node):
+        return isinstance(node.tag, str)
+
+    def _is_attached(self, elem):
+        return elem.getroottree().getroot() is self._root_element
+
+    def _tag_name(self, elem):
+        return self._prefixed(elem)
+
+    def _parent(self, elem):
+        return elem.getparent()
+
+    def _placement(self, elem):
+        # The tail is text of the parent, but editable through elem
+        parent = elem.getparent()
+        if parent is None:
+            return None, None, None, None
+        return parent, len(parent), elem.getnext(), elem.tail
+
+    def _line_number(self, elem):
+        return elem.sourceline
+
+    def _root(self):
+        return self._root_element
+
+    def _has_attr(self, elem, name):
+        clark = self._clark(name, is_attribute=True, context=elem)
+        return clark is not None and clark in elem.attrib
+
+    def _get_attr(self, elem, name):
+        clark = self._clark(name, is_attribute=True, context=elem)
+        return elem.get(clark, "") if clark else ""
+
+    def _set_attr(self, elem, name, value):
+        clark = self._clark(name, is_attribute=True, context=elem)
+        if clark is None:
+            raise ValueError(f"Namespace prefix of {name} is not declared")
+        elem.set(clark, value)
+        self.dirty = True
+
+    def _remove_attr(self, elem, name):
+        if self._has_attr(elem, name):
+            del elem.attrib[self._clark(name, is_attribute=True, context=elem)]
+            self.dirty = True
+
+    def _leading_text(self, elem):
+        return elem.text
+
+    def _text_content(self, elem):
+        return "".join(
+            [elem.text or ""] + [child.tail or "" for child in elem]
+        )
+
+    def _set_text(self, elem, text):
+        elem.text = text or None
+        for child in elem:
+            child.tail = None
+        self._node_changed(elem)
+
+    def _declare_namespace(self, prefix, uri):
+        if self._root_element.nsmap.get(prefix) == uri:
+            return
+        # lxml cannot add declarations to an existing element directly;
+        # cleanup_namespaces declares it on the root and keeps every prefix
+        keep = [p for p in self._root_element.nsmap if p] + [prefix]
+        lxml.etree.cleanup_namespaces(
+            self._root_element, top_nsmap={prefix: uri}, keep_ns_prefixes=keep
+        )
+        self.dirty = True
+        self._refresh_namespaces()
+        self._namespaces_changed()
+
+    def _create_element(self, tag):
+        clark = self._clark(tag)
+        if clark is None:
+            raise ValueError(f"Namespace prefix of {tag} is not declared")
+        return self._root_element.makeelement(clark)
+
+    def _rename_element(self, elem, tag):
+        elem.tag = self._create_element(tag).tag
+        return elem
+
+    def _wrap(self, elem, tag):
+        wrapper = self._create_element(tag)
+        elem.addprevious(wrapper)
+        wrapper.tail, elem.tail = elem.tail, None
+        wrapper.append(elem)
+        return wrapper
+
+    def _wrap_children(self, elem, tag, skip=()):
+        wrapper = self._create_element(tag)
+        for child in list(elem):
+            if self._is_element(child) and self._tag_name(child) in skip:
+                continue
+            wrapper.append(child)
+        elem.append(wrapper)
+        return wrapper
+
+    def _append_child(self, parent, child):
+        parent.append(child)
+
+    def _prepend_child(self, parent, child):
+        parent.insert(0, child)
+
+    def _clone(self, elem):
+        return copy.deepcopy(elem)
+
+    def _to_xml(self, node):
+        return lxml.etree.tostring(node, encoding="unicode", with_tail=False)
+
+
+class _TextIndex:
+    """
+    Trigram index over the text projection of all elements with one tag.
+
+    Maps every 3-character substring of an element's text to the set of
+    elements containing it, so a contains lookup only has to verify the
+    intersection of the query's trigram postings. Elements whose text may have
+    changed are marked stale and re-indexed on the next lookup.
+    """
+
+    N = 3
+
+    def __init__(self, editor, tag):
+        self.editor = editor
+        self.tag = tag
+        self.texts = {}
+        self.grams = defaultdict(set)
+        self.stale = set()
+
+    def add(self, elem):
+        """Index an element under its current text."""
+        self.discard(elem)
+        text = self.editor._get_element_text(elem)
+        self.texts[elem] = text
+        for gram in self._grams(text):
+            self.grams[gram].add(elem)
+
+    def discard(self, elem):
+        """Remove an element from the index if present."""
+        self.stale.discard(elem)
+        text = self.texts.pop(elem, None)
+        if text is None:
+            return
+        for gram in self._grams(text):
+            postings = self.grams.get(gram)
+            if postings is not None:
+                postings.discard(elem)
+                if not postings:
+                    del self.grams[gram]
+
+    def mark_stale(self, elem):
+        """Schedule an element for re-indexing on the next lookup."""
+        self.stale.add(elem)
+
+    def candidates(self, terms):
+        """
+        Return elements that may contain every term.
+
+        Terms shorter than the n-gram size cannot be pruned and match every
+        indexed element; callers still verify each candidate's text.
+        """
+        self._refresh()
+        result = None
+        for term in terms:
+            if len(term) < self.N:
+                continue
+            for gram in sorted(self._grams(term), key=lambda g: len(self.grams.get(g, ()))):
+                postings = self.grams.get(gram, set())
+                result = set(postings) if result is None else result & postings
+                if not result:
+                    return []
+
+        candidates = []
+        for elem in list(self.texts) if result is None else result:
+            # Elements detached or renamed by direct DOM manipulation may still be indexed
+            if self.editor._is_attached(elem) and self.editor._tag_name(elem) == self.tag:
+                candidates.append(elem)
+            else:
+                self.discard(elem)
+        return candidates
+
+    def _refresh(self):
+        """Re-index stale elements, dropping those no longer in the document."""
+        for elem in list(self.stale):
+            if self.editor._is_attached(elem) and self.editor._tag_name(elem) == self.tag:
+                self.add(elem)
+            else:
+                self.discard(elem)
+        self.stale.clear()
+
+    def _grams(self, text):
+        return {text[i : i + self.N] for i in range(len(text) - self.N + 1)}
+
+
+# One step of a node handle's location path, e.g. "w:p[3]"
+_PATH_STEP = re.compile(r"([^/\[\]]+)\[(\d+)\]")
+
+
+def _parse_id(value, prefix=""):
+    """Numeric part of an id attribute such as "12" or "rId12", or None."""
+    if not value or not value.startswith(prefix):
+        return None
+    try:
+        return int(value[len(prefix):])
+    except ValueError:
+        return None
+
 
 def _create_line_tracking_parser():
     """
@@ -372,3 +1532,19 @@ def _create_line_tracking_parser():
     orig_set_content_handler = parser.setContentHandler
     parser.setContentHandler = set_content_handler  # type: ignore
     return parser
+
+
+def _secure_lxml_parser():
+    """
+    Create an lxml parser that is safe for untrusted documents.
+
+    Entities are left unresolved, DTDs are neither loaded nor validated, and
+    network access is disabled, which rules out XXE and billion-laughs inputs.
+    """
+    return lxml.etree.XMLParser(
+        resolve_entities=False,
+        load_dtd=False,
+        dtd_validation=False,
+        no_network=True,
+        huge_tree=False,
+    )
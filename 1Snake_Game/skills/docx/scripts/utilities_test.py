@@ -0,0 +1,105 @@
+import unittest
+import tempfile
+from pathlib import Path
+
+from .utilities import LxmlXMLEditor, XMLEditor
+
+
+DOCUMENT = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    "<w:body>"
+    "<w:p><w:r><w:t>alpha one</w:t></w:r></w:p>"
+    "<w:p><w:r><w:t>beta two</w:t></w:r></w:p>"
+    "</w:body></w:document>"
+)
+
+
+# Run from the docx directory: python -m pytest scripts/utilities_test.py
+class TestDirectEdits(unittest.TestCase):
+
+    def editors(self):
+        """Yield a fresh editor of each backend on a copy of DOCUMENT"""
+        for editor_class in (XMLEditor, LxmlXMLEditor):
+            with tempfile.TemporaryDirectory() as folder:
+                path = Path(folder) / "document.xml"
+                path.write_text(DOCUMENT, encoding="utf-8")
+                with self.subTest(editor=editor_class.__name__):
+                    yield editor_class(path)
+
+    def set_text(self, t_elem, text):
+        if hasattr(t_elem, "firstChild"):
+            t_elem.firstChild.data = text
+        else:
+            t_elem.text = text
+
+    def test_edited_node_is_saved(self):
+        """A direct edit to a node from get_node reaches the file"""
+        for editor in self.editors():
+            self.assertFalse(editor.dirty)
+            self.set_text(editor.get_node(tag="w:t", contains="alpha"), "GAMMA")
+            self.assertTrue(editor.dirty)
+            editor.save()
+            self.assertIn("GAMMA", editor.xml_path.read_text(encoding="utf-8"))
+
+    def test_read_only_lookup_keeps_document_clean(self):
+        """Handing out nodes alone does not make the document dirty"""
+        for editor in self.editors():
+            t_elem = editor.get_node(tag="w:t", contains="alpha")
+            editor.get_node(tag="w:p", contains="beta")
+            self.assertFalse(editor.dirty)
+            self.set_text(t_elem, "GAMMA")
+            self.assertTrue(editor.dirty)
+            editor.save()
+            self.assertFalse(editor.dirty)
+            # Still held after save, so later edits count again
+            self.set_text(t_elem, "DELTA")
+            self.assertTrue(editor.dirty)
+
+    def test_lookup_sees_edited_text(self):
+        """contains lookups after a direct edit answer from the new text"""
+        for editor in self.editors():
+            # Build the index before the edit
+            para = editor.get_node(tag="w:p", contains="alpha")
+            self.set_text(editor.get_node(tag="w:t", contains="alpha"), "GAMMA")
+            self.assertIs(editor.get_node(tag="w:p", contains="GAMMA"), para)
+            with self.assertRaises(ValueError):
+                editor.get_node(tag="w:p", contains="alpha")
+
+    def test_lookup_sees_moved_node(self):
+        """Moving a handed-out node through its parent updates the parent's text"""
+        for editor in self.editors():
+            editor.get_node(tag="w:body", contains="alpha onebeta two")
+            para = editor.get_node(tag="w:p", contains="alpha")
+            if isinstance(editor, LxmlXMLEditor):
+                body = para.getparent()
+                body.remove(para)
+                body.append(para)
+            else:
+                body = para.parentNode
+                body.removeChild(para)
+                body.appendChild(para)
+            editor.get_node(tag="w:body", contains="beta twoalpha one")
+
+    def test_lookup_sees_edit_to_a_node_kept_from_earlier(self):
+        """Edits after later lookups are found through stale hits and misses"""
+        for editor in self.editors():
+            alpha = editor.get_node(tag="w:p", contains="alpha")
+            editor.get_node(tag="w:p", contains="beta")  # checks alpha once
+            self.set_text(editor._descendants(alpha, "w:t")[0], "GAMMA")
+            with self.assertRaises(ValueError):
+                editor.get_node(tag="w:p", contains="alpha")
+            self.assertIs(editor.get_node(tag="w:p", contains="GAMMA"), alpha)
+
+    def test_only_outermost_handed_out_nodes_are_kept(self):
+        """Handing out an ancestor replaces the nodes it covers"""
+        for editor in self.editors():
+            editor.get_node(tag="w:t", contains="alpha")
+            editor.get_node(tag="w:p", contains="beta")
+            body = editor.get_node(tag="w:body")
+            editor.get_node(tag="w:p", contains="alpha")
+            self.assertEqual(list(editor._exposed), [body])
+
+
+if __name__ == '__main__':
+    unittest.main()
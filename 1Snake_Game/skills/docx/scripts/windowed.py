@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Windowed editing of very large Word document parts.
+
+A WindowedPart indexes the top-level blocks of a part's w:body (paragraphs,
+tables, sectPr, ...) by byte offset in one pass over a memory map, without
+parsing the part. Callers open windows over a contiguous run of blocks chosen
+by line range, w14:paraId or text; each window is an ordinary editor holding
+only those blocks. save() splices the edited windows back into the part.
+
+Usage:
+    from skills.docx.scripts.document import Document
+
+    doc = Document('workspace/unpacked', windowed=True)
+    editor = doc.window(contains="Termination for convenience")
+    editor.replace_text("thirty (30)", "sixty (60)")
+    doc.save()
+
+Line numbers in a window match the part on disk when the window was opened,
+so get_node(line_number=...) works with line numbers read from the file.
+"""
+
+import bisect
+import html
+import itertools
+import mmap
+import os
+import re
+import tempfile
+from pathlib import Path
+
+# Any markup: element tags, comments, CDATA sections and processing instructions
+_MARKUP = re.compile(
+    rb"<(/?)([^\s/>!?]+)[^>]*?(/?)>|<!--.*?-->|<!\[CDATA\[.*?\]\]>|<\?.*?\?>",
+    re.DOTALL,
+)
+_ROOT_START = re.compile(rb"<(?![?!])([^\s/>]+)[^>]*>")
+_BODY_START = re.compile(rb"<w:body\b[^>]*?(/?)>")
+_PARA_ID = re.compile(rb'\sw14:paraId="([0-9A-Fa-f]+)"')
+_CHANGE_ID = re.compile(rb'\sw:id="(\d+)"')
+_TEXT = re.compile(rb"<w:t(?:\s[^>]*)?>([^<]*)</w:t>")
+_NAMESPACE = re.compile(rb'\sxmlns(?::([\w.-]+))?="([^"]*)"')
+
+# Key of the tracked change id counter shared by all window editors
+_CHANGE_ID_KEY = (("w:ins", "w:del"), "w:id", "")
+
+
+class Block:
+    """One top-level element of w:body.
+
+    Attributes:
+        tag (str): Element name, e.g. "w:p", "w:tbl", "w:sectPr"
+        start (int): Byte offset of the start tag
+        end (int): Byte offset just past the end tag
+        line (int): Line of the start tag (1-based)
+        end_line (int): Line of the end tag
+    """
+
+    __slots__ = ("tag", "start", "end", "line", "end_line")
+
+    def __init__(self, tag, start, end, line, end_line):
+        self.tag = tag
+        self.start = start
+        self.end = end
+        self.line = line
+        self.end_line = end_line
+
+    def __repr__(self):
+        return f"Block({self.tag!r}, lines {self.line}-{self.end_line})"
+
+
+class WindowedPart:
+    """Index of a part's body blocks with editors for windows onto them.
+
+    Attributes:
+        xml_path (Path): The part being edited
+        blocks (list[Block]): Top-level body blocks in document order
+    """
+
+    def __init__(self, xml_path, editor_factory, work_dir=None):
+        """
+        Args:
+            xml_path: Path to the part (e.g. unpacked/word/document.xml)
+            editor_factory: Callable taking a path and returning an XMLEditor
+                (e.g. a DocxXMLEditor bound to the document's rsid and author)
+            work_dir: Directory for the window files (default: a new temporary
+                directory); keep it outside the unpacked document
+        """
+        self.xml_path = Path(xml_path)
+        if not self.xml_path.exists():
+            raise ValueError(f"XML file not found: {xml_path}")
+        self._editor_factory = editor_factory
+        self._work_dir = Path(work_dir or tempfile.mkdtemp(prefix="docx_window_"))
+        self._work_dir.mkdir(parents=True, exist_ok=True)
+        self._window_numbers = itertools.count()
+        self._windows = []  # [start, end, path, editor], by start offset
+        self._id_counters = {}  # shared by all window editors
+        self._reindex()
+
+    @property
+    def editors(self):
+        """Editors of the open windows, in document order."""
+        return [editor for _, _, _, editor in self._windows]
+
+    def find_blocks(self, line_range=None, para_id=None, contains=None):
+        """
+        Indexes of the blocks matching every given filter.
+
+        Args:
+            line_range: (start, end) lines; blocks overlapping the range match
+            para_id: w14:paraId of a paragraph in the block (nested ones included)
+            contains: Text the block contains, even across run boundaries
+
+        Returns:
+            list[int]: Matching indexes into blocks, ascending
+        """
+        selected = range(len(self.blocks))
+        if line_range is not None:
+            first_line, last_line = line_range
+            selected = [
+                i
+                for i in selected
+                if self.blocks[i].line <= last_line
+                and self.blocks[i].end_line >= first_line
+            ]
+        if para_id is not None:
+            index = self._para_ids.get(para_id.upper())
+            selected = [i for i in selected if i == index]
+        if contains is not None:
+            hits = self._blocks_containing(contains)
+            selected = [i for i in selected if i in hits]
+        return list(selected)
+
+    def window(self, line_range=None, para_id=None, contains=None, blocks=None):
+        """
+        Editor for the smallest run of blocks covering every matching block.
+
+        Args:
+            line_range, para_id, contains: Filters as in find_blocks
+            blocks: (first, last) block indexes, inclusive, instead of filters
+
+        Returns:
+            XMLEditor: Editor whose w:body holds only the selected blocks. An
+            already open window containing them is returned as is.
+
+        Raises:
+            ValueError: If nothing matches, or the blocks overlap an open
+                window without being inside it
+        """
+        if blocks is None:
+            matches = self.find_blocks(line_range, para_id, contains)
+            if not matches:
+                raise ValueError("No body blocks match the given filters")
+            blocks = (matches[0], matches[-1])
+        first, last = blocks
+        start, end = self.blocks[first].start, self.blocks[last].end
+
+        for window in self._windows:
+            if window[0] <= start and end <= window[1]:
+                return window[3]
+            if start < window[1] and window[0] < end:
+                raise ValueError(
+                    "Blocks overlap an open window; widen that window or save first"
+                )
+
+        path = self._work_dir / f"window{next(self._window_numbers)}.xml"
+        with open(self.xml_path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as data:
+            # Pad the prolog with newlines so the blocks keep their line numbers
+            prolog = data[: self._root_start].replace(b"\n", b"")
+            padding = b"\n" * (self.blocks[first].line - 1)
+            opening = data[self._root_start : self._body_content_start]
+            opening = opening.replace(b"\r", b" ").replace(b"\n", b" ")
+            closing = f"</w:body></{self._root_tag}>".encode()
+            path.write_bytes(prolog + padding + opening + data[start:end] + closing)
+
+        editor = self._editor_factory(path)
+        editor._id_counters = self._id_counters
+        editor._shared_id_keys = frozenset({_CHANGE_ID_KEY})
+        window = [start, end, path, editor]
+        bisect.insort(self._windows, window, key=lambda w: w[0])
+        return editor
+
+    def save(self):
+        """
+        Splice every modified window back into the part and re-index it.
+
+        The part is rewritten through a new file, so a hard link to it is
+        detached rather than modified. Namespaces declared on a window root
+        while editing are declared on the part's root as well.
+
+        Returns:
+            bool: True if the part was rewritten
+        """
+        edits = []
+        namespaces = {}
+        for window in self._windows:
+            start, end, path, editor = window
+            if not editor.dirty:
+                continue
+            editor.save()
+            content = path.read_bytes()
+            body = _BODY_START.search(content)
+            body_content = b""
+            if not body.group(1):
+                body_content = content[body.end() : content.rfind(b"</w:body>")]
+            edits.append((start, end, body_content))
+            root = _ROOT_START.search(content)
+            namespaces.update(_NAMESPACE.findall(root.group()))
+
+        if not edits:
+            return False
+
+        tmp_path = self.xml_path.with_name(self.xml_path.name + ".tmp")
+        with open(self.xml_path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as data:
+            root_tag = data[self._root_start : self._root_end]
+            declared = dict(_NAMESPACE.findall(root_tag))
+            missing = b"".join(
+                b' xmlns%s="%s"' % (b":" + prefix if prefix else b"", uri)
+                for prefix, uri in namespaces.items()
+                if prefix not in declared
+            )
+            if missing:
+                close = self._root_end - (2 if root_tag.endswith(b"/>") else 1)
+                edits.append((close, close, missing))
+
+            with open(tmp_path, "wb") as out:
+                position = 0
+                for start, end, replacement in sorted(edits, key=lambda e: e[0]):
+                    out.write(data[position:start])
+                    out.write(replacement)
+                    position = end
+                out.write(data[position:])
+        os.replace(tmp_path, self.xml_path)
+
+        # Windows keep their editors; shift their offsets to the new layout
+        shift = len(missing)
+        replaced = {start: (end, len(content)) for start, end, content in edits}
+        for window in self._windows:
+            start, end = window[0], window[1]
+            window[0] = start + shift
+            if start in replaced:
+                old_end, length = replaced[start]
+                window[1] = window[0] + length
+                shift += length - (old_end - start)
+            else:
+                window[1] = end + shift
+        self._reindex()
+        return True
+
+    def close(self):
+        """Discard all windows (unsaved edits are lost) and their files."""
+        for _, _, path, _ in self._windows:
+            path.unlink(missing_ok=True)
+        self._windows = []
+
+    # ==================== Private: indexing ====================
+
+    def _reindex(self):
+        """Scan the part once, recording block offsets, lines and paraIds."""
+        self.blocks = []
+        self._para_ids = {}
+        next_change_id = 0
+        with open(self.xml_path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as data:
+            root = _ROOT_START.search(data)
+            body = _BODY_START.search(data)
+            if root is None or body is None:
+                raise ValueError(f"{self.xml_path} has no w:body")
+            self._root_start, self._root_end = root.span()
+            self._root_tag = root.group(1).decode()
+            self._body_content_start = body.end()
+            body_end = data.rfind(b"</w:body>") if not body.group(1) else body.end()
+            line, counted = 1, 0
+
+            def line_of(offset):
+                # Offsets only grow during the scan, so every newline is counted once
+                nonlocal line, counted
+                line += data[counted:offset].count(b"\n")
+                counted = offset
+                return line
+
+            depth = 0
+            block_start = block_tag = None
+            for m in _MARKUP.finditer(data, body.end(), max(body_end, body.end())):
+                if m.group(2) is None:
+                    continue  # comment, CDATA or processing instruction
+                closing, tag, empty = m.group(1), m.group(2), m.group(3)
+                if not closing:
+                    if depth == 0:
+                        block_start, block_tag = m.start(), tag
+                    if tag == b"w:p":
+                        para_id = _PARA_ID.search(m.group())
+                        if para_id:
+                            self._para_ids.setdefault(
+                                para_id.group(1).decode().upper(), len(self.blocks)
+                            )
+                    elif tag in (b"w:ins", b"w:del"):
+                        change_id = _CHANGE_ID.search(m.group())
+                        if change_id and int(change_id.group(1)) >= next_change_id:
+                            next_change_id = int(change_id.group(1)) + 1
+                    if empty:
+                        if depth == 0:
+                            self._add_block(block_tag, block_start, m.end(), line_of)
+                    else:
+                        depth += 1
+                else:
+                    depth -= 1
+                    if depth == 0:
+                        self._add_block(block_tag, block_start, m.end(), line_of)
+
+        # Window editors allocate change ids above every id in the part
+        self._id_counters[_CHANGE_ID_KEY] = max(
+            next_change_id, self._id_counters.get(_CHANGE_ID_KEY, 0)
+        )
+
+    def _add_block(self, tag, start, end, line_of):
+        self.blocks.append(
+            Block(tag.decode(), start, end, line_of(start), line_of(end - 1))
+        )
+
+    def _blocks_containing(self, text):
+        """Indexes of blocks whose w:t text contains text."""
+        blocks = self.blocks
+        hits = set()
+        if not blocks:
+            return hits
+
+        def check(index, pieces):
+            if pieces and text in html.unescape(b"".join(pieces).decode("utf-8")):
+                hits.add(index)
+
+        def next_start(index):
+            return blocks[index + 1].start if index + 1 < len(blocks) else float("inf")
+
+        # Only the text of the block being scanned is held at any time
+        index, pieces = 0, []
+        with open(self.xml_path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as data:
+            for m in _TEXT.finditer(data, blocks[0].start, blocks[-1].end):
+                if m.start() >= next_start(index):
+                    check(index, pieces)
+                    pieces = []
+                    while m.start() >= next_start(index):
+                        index += 1
+                pieces.append(m.group(1))
+        check(index, pieces)
+        return hits
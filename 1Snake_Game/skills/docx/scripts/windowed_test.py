@@ -0,0 +1,134 @@
+import unittest
+import tempfile
+from pathlib import Path
+
+from .document import DocxXMLEditor
+from .windowed import WindowedPart
+
+
+NAMESPACES = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:w14="http://schemas.microsoft.com/office/word/2010/wordml"'
+)
+
+
+def paragraph(para_id, *texts):
+    runs = "".join(f"<w:r><w:t>{text}</w:t></w:r>" for text in texts)
+    return f'<w:p w14:paraId="{para_id}">{runs}</w:p>'
+
+
+# Run from the docx directory: python -m pytest scripts/windowed_test.py
+class TestWindowedPart(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+        self.path = Path(self.folder.name) / "document.xml"
+
+    def open_part(self, *blocks):
+        """Write a part holding blocks (one per line) and index it"""
+        body = "\n".join(blocks)
+        self.path.write_text(
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f"<w:document {NAMESPACES}>\n<w:body>\n{body}\n</w:body>\n</w:document>",
+            encoding="utf-8",
+        )
+        return WindowedPart(
+            self.path,
+            lambda path: DocxXMLEditor(path, rsid="00AB12CD", author="Tester"),
+            work_dir=Path(self.folder.name) / "windows",
+        )
+
+    def test_blocks_are_indexed_by_line_para_id_and_text(self):
+        """Blocks keep their tag and lines; filters find them without parsing"""
+        part = self.open_part(
+            paragraph("0000000A", "first"),
+            "<w:tbl><w:tr><w:tc>\n" + paragraph("0000000B", "in a cell") + "\n</w:tc></w:tr></w:tbl>",
+            paragraph("0000000C", "split ac", "ross runs &amp; more"),
+            "<w:sectPr/>",
+        )
+        self.assertEqual([b.tag for b in part.blocks], ["w:p", "w:tbl", "w:p", "w:sectPr"])
+        self.assertEqual([(b.line, b.end_line) for b in part.blocks], [(4, 4), (5, 7), (8, 8), (9, 9)])
+        self.assertEqual(part.find_blocks(para_id="0000000b"), [1])
+        self.assertEqual(part.find_blocks(contains="across runs & more"), [2])
+        self.assertEqual(part.find_blocks(line_range=(6, 8)), [1, 2])
+        self.assertEqual(part.find_blocks(contains="nowhere"), [])
+
+    def test_save_splices_only_edited_windows(self):
+        """Edits go back in place; unedited blocks keep their bytes"""
+        part = self.open_part(
+            paragraph("0000000A", "keep me"),
+            paragraph("0000000B", "thirty days"),
+            paragraph("0000000C", "untouched"),
+        )
+        before = self.path.read_text(encoding="utf-8")
+        editor = part.window(contains="thirty")
+        part.window(contains="untouched")  # opened, never edited
+        editor.replace_text("thirty", "sixty", tracked=False)
+        self.assertTrue(part.save())
+        before, after = before.splitlines(), self.path.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(len(after), len(before))
+        for line in (3, 5):
+            self.assertEqual(after[line], before[line])
+        self.assertIn("sixty", after[4])
+        self.assertNotIn("thirty", after[4])
+        self.assertFalse(part.save())
+
+    def test_namespaces_declared_in_a_window_reach_the_part(self):
+        part = self.open_part(paragraph("0000000A", "text"))
+        editor = part.window(para_id="0000000A")
+        editor._declare_namespace("w15", "http://schemas.microsoft.com/office/word/2012/wordml")
+        editor.append_to(editor.get_node(tag="w:p"), "<w:r><w:t>more</w:t></w:r>")
+        part.save()
+        root = self.path.read_text(encoding="utf-8").split("<w:body>")[0]
+        self.assertIn('xmlns:w15="http://schemas.microsoft.com/office/word/2012/wordml"', root)
+
+    def test_open_windows_follow_the_offset_shift_after_save(self):
+        """A window after an edited one keeps splicing into the right place"""
+        part = self.open_part(
+            paragraph("0000000A", "short"),
+            paragraph("0000000B", "second"),
+            paragraph("0000000C", "third"),
+        )
+        first = part.window(para_id="0000000A")
+        last = part.window(para_id="0000000C")
+        first.replace_text("short", "a good deal longer than before", tracked=False)
+        part.save()
+        last.replace_text("third", "3rd", tracked=False)
+        part.save()
+        content = self.path.read_text(encoding="utf-8")
+        self.assertIn("a good deal longer than before", content)
+        self.assertIn("<w:t>second</w:t>", content)
+        self.assertIn("<w:t>3rd</w:t>", content)
+        self.assertNotIn("third", content)
+
+    def test_window_reopens_on_text_written_by_a_save(self):
+        part = self.open_part(paragraph("0000000A", "old"), paragraph("0000000B", "other"))
+        part.window(contains="old").replace_text("old", "new", tracked=False)
+        part.save()
+        part.close()
+        self.assertEqual(part.find_blocks(contains="new"), [0])
+        editor = part.window(contains="new")
+        self.assertIsNotNone(editor.get_node(tag="w:t", contains="new"))
+
+    def test_change_ids_stay_unique_after_direct_dom_access(self):
+        """Dropping a window's caches must not reseed the part-wide change id counter"""
+        part = self.open_part(
+            '<w:p w14:paraId="0000000A"><w:ins w:id="500" w:author="A" w:date="2025-01-01T00:00:00Z">'
+            "<w:r><w:t>elsewhere</w:t></w:r></w:ins></w:p>",
+            paragraph("0000000B", "thirty days"),
+        )
+        editor = part.window(contains="thirty")
+        editor.dom  # hands out the whole window
+        editor.mark_dirty()
+        editor.replace_text("thirty", "sixty")
+        ids = sorted(
+            int(elem.getAttribute("w:id"))
+            for tag in ("w:ins", "w:del")
+            for elem in editor.dom.getElementsByTagName(tag)
+        )
+        self.assertEqual(ids, [501, 502])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -221,6 +221,29 @@ class TestGetBoundingBoxMessages(unittest.TestCase):
         self.assertTrue(any("SUCCESS" in msg for msg in messages))
         self.assertFalse(any("FAILURE" in msg for msg in messages))
     
+    def test_many_fields_single_intersection(self):
+        """Test that one intersection is found among many fields on a page"""
+        fields = []
+        for i in range(1000):
+            x, y = (i % 20) * 30, (i // 20) * 20
+            fields.append({
+                "description": f"Field{i}",
+                "page_number": 1,
+                "label_bounding_box": [x, y, x + 10, y + 15],
+                "entry_bounding_box": [x + 10, y, x + 25, y + 15]  # Touches its label
+            })
+        fields[500]["entry_bounding_box"] = [fields[500]["entry_bounding_box"][0], 1000, 310, 1015]
+        fields[999]["label_bounding_box"] = [300, 1010, 320, 1020]  # Overlaps Field500's entry
+        
+        data = {"form_fields": fields}
+        
+        stream = self.create_json_stream(data)
+        messages = get_bounding_box_messages(stream)
+        failures = [msg for msg in messages if "FAILURE" in msg]
+        self.assertEqual(len(failures), 1)
+        self.assertIn("`Field500`", failures[0])
+        self.assertIn("`Field999`", failures[0])
+    
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+Tool to render {{ placeholder }} templates in a .docx or .pptx file, once per record.
+
+The template is compiled once: each XML part holding placeholders becomes a list
+of literal byte segments and slots, so rendering a record only joins bytes.
+Placeholders may be split across runs (Word and PowerPoint often break text at
+spell-check or formatting boundaries). Parts without placeholders are copied
+into every output file as their already-compressed bytes.
+
+Records are JSON objects; {{ customer.name }} looks up record["customer"]["name"].
+
+Example usage:
+    python render.py <template_file> <records.json|records.jsonl> <output_dir> [--name-key KEY] [--jobs N]
+"""
+
+import argparse
+import bisect
+import html
+import io
+import itertools
+import json
+import re
+import struct
+import sys
+import time
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Text elements whose content may hold placeholders (WordprocessingML, DrawingML)
+TEXT_ELEMENT_PATTERN = re.compile(rb"<(w:t|a:t)(\s[^>]*)?(?<!/)>(.*?)</\1>", re.DOTALL)
+
+# Placeholders never span paragraphs
+PARAGRAPH_END_PATTERN = re.compile(rb"</(?:w|a):p>")
+
+# Same pattern the validators strip from text nodes
+PLACEHOLDER_PATTERN = re.compile(rb"\{\{([^}]*)\}\}")
+
+PRESERVE_SPACE = b' xml:space="preserve"'
+
+# Characters that cannot appear in an output file name on common file systems
+UNSAFE_NAME_PATTERN = re.compile(r'[\x00-\x1f/\\<>:"|?*]')
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render a {{ placeholder }} template once per JSON record"
+    )
+    parser.add_argument("template_file", help="Template Office file (.docx/.pptx)")
+    parser.add_argument(
+        "records", help="JSON array of records, or one record per line (.jsonl)"
+    )
+    parser.add_argument("output_dir", help="Directory for the rendered files")
+    parser.add_argument(
+        "--name-key",
+        help="Record field used as the output file name (default: record index)",
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=1, help="Worker processes (default: 1)"
+    )
+    args = parser.parse_args()
+
+    template_file = Path(args.template_file)
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    try:
+        records = list(_read_records(args.records))
+        output_paths = _output_paths(
+            records, output_dir, template_file.suffix, args.name_key
+        )
+        start = time.perf_counter()
+        count = render_documents(template_file, records, output_paths, jobs=args.jobs)
+        elapsed = time.perf_counter() - start
+    except (KeyError, ValueError) as e:
+        sys.exit(f"Error: {e}")
+
+    rate = count / elapsed * 60 if elapsed else 0
+    print(f"Rendered {count} documents in {elapsed:.2f}s ({rate:.0f}/min)")
+
+
+def render_documents(template_file, records, output_paths, jobs=1):
+    """Render template_file once per record.
+
+    Args:
+        template_file: Path to the template Office file
+        records: Iterable of record dicts
+        output_paths: Output file path for each record
+        jobs: Number of worker processes; each compiles the template once
+
+    Returns:
+        int: Number of documents written
+    """
+    if jobs <= 1:
+        template = CompiledTemplate(template_file)
+        count = 0
+        for record, output_path in zip(records, output_paths):
+            template.render(record, output_path)
+            count += 1
+        return count
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(str(template_file),),
+    ) as executor:
+        results = executor.map(_render_in_worker, records, output_paths, chunksize=32)
+        return sum(1 for _ in results)
+
+
+class CompiledTemplate:
+    """A template Office file compiled for repeated rendering.
+
+    Attributes:
+        placeholders (list[str]): Distinct placeholder names, e.g. "customer.name"
+    """
+
+    def __init__(self, template_file):
+        template_file = Path(template_file)
+        if template_file.suffix.lower() not in {".docx", ".pptx"}:
+            raise ValueError(f"{template_file} must be a .docx or .pptx file")
+
+        blob = template_file.read_bytes()
+        self._members = []
+        slots = set()
+        with zipfile.ZipFile(io.BytesIO(blob)) as zf:
+            for info in zf.infolist():
+                segments = None
+                if info.filename.endswith(".xml"):
+                    segments = _compile_part(zf.read(info))
+                if segments is not None:
+                    slots.update(s for s in segments if not isinstance(s, bytes))
+                    self._members.append((info, segments))
+                else:
+                    self._members.append((info, _raw_member(zf, info, blob)))
+
+        self.placeholders = sorted(".".join(path) for path in slots)
+
+    def render(self, record, output):
+        """Write the template filled in from record.
+
+        Args:
+            record: Dict of values for the placeholders
+            output: Output file path, or a binary file object
+
+        Raises:
+            KeyError: If record has no value for a placeholder
+        """
+        if isinstance(output, (str, Path)):
+            with open(output, "wb") as f:
+                self.render(record, f)
+            return
+
+        writer = _ZipWriter(output)
+        for info, entry in self._members:
+            if isinstance(entry, tuple):
+                writer.write_raw(info, *entry)
+            else:
+                writer.write(info, _render_part(entry, record))
+        writer.close()
+
+
+# ==================== Compilation ====================
+
+
+def _compile_part(data):
+    """Split part XML into literal byte segments and placeholder slots.
+
+    Text element contents are concatenated per paragraph, so a placeholder
+    split across runs is found as one. Its slot takes the place of the
+    placeholder text in the first run and the remaining pieces are dropped
+    from the later runs, leaving their markup in place. w:t elements holding
+    a placeholder get xml:space="preserve", since values may start or end
+    with spaces.
+
+    Returns:
+        list: bytes literals and slot tuples (the dotted key path), or None
+        if the part holds no placeholders
+    """
+    if b"{{" not in data:
+        return None
+
+    paragraph_ends = [m.end() for m in PARAGRAPH_END_PATTERN.finditer(data)]
+    text_elements = TEXT_ELEMENT_PATTERN.finditer(data)
+    edits = []
+    for _, group in itertools.groupby(
+        text_elements, key=lambda m: bisect.bisect(paragraph_ends, m.start())
+    ):
+        group = list(group)
+        text = b"".join(m.group(3) for m in group)
+        if b"{{" not in text:
+            continue
+
+        offsets = [0, *itertools.accumulate(len(m.group(3)) for m in group)]
+        touched = set()
+        for placeholder in PLACEHOLDER_PATTERN.finditer(text):
+            key = html.unescape(placeholder.group(1).decode("utf-8")).strip()
+            if not key:
+                continue
+            slot = tuple(key.split("."))
+
+            first = bisect.bisect_right(offsets, placeholder.start()) - 1
+            last = bisect.bisect_left(offsets, placeholder.end()) - 1
+            start = group[first].start(3) + placeholder.start() - offsets[first]
+            end = group[last].start(3) + placeholder.end() - offsets[last]
+            if first == last:
+                edits.append((start, end, slot))
+            else:
+                edits.append((start, group[first].end(3), slot))
+                for m in group[first + 1 : last]:
+                    edits.append((m.start(3), m.end(3), b""))
+                edits.append((group[last].start(3), end, b""))
+            touched.update(range(first, last + 1))
+
+        for index in touched:
+            m = group[index]
+            if m.group(1) == b"w:t" and b"xml:space" not in (m.group(2) or b""):
+                edits.append((m.start(3) - 1, m.start(3) - 1, PRESERVE_SPACE))
+
+    if not edits:
+        return None
+
+    segments = []
+    position = 0
+    for start, end, value in sorted(edits, key=lambda edit: edit[:2]):
+        segments.extend([data[position:start], value])
+        position = end
+    segments.append(data[position:])
+
+    # Merge neighbouring literals so rendering joins as few pieces as possible
+    merged = []
+    for is_literal, run in itertools.groupby(segments, key=lambda s: isinstance(s, bytes)):
+        if is_literal:
+            merged.append(b"".join(run))
+        else:
+            merged.extend(run)
+    return merged
+
+
+def _raw_member(zf, info, blob):
+    """(method, crc, compressed bytes) of a member, taken from blob as stored."""
+    if info.compress_type in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED) and not (
+        info.flag_bits & 0x1
+    ):
+        name_length, extra_length = struct.unpack(
+            "<HH", blob[info.header_offset + 26 : info.header_offset + 30]
+        )
+        start = info.header_offset + 30 + name_length + extra_length
+        return (
+            info.compress_type,
+            info.CRC,
+            blob[start : start + info.compress_size],
+            info.file_size,
+        )
+
+    # Encrypted or unusual compression: recompress once at compile time
+    data = zf.read(info)
+    return (zipfile.ZIP_DEFLATED, zlib.crc32(data), _deflate(data), len(data))
+
+
+# ==================== Rendering ====================
+
+
+def _render_part(segments, record):
+    """Join a compiled part's segments with the record's escaped values."""
+    pieces = []
+    for segment in segments:
+        if isinstance(segment, bytes):
+            pieces.append(segment)
+            continue
+        value = record
+        for key in segment:
+            try:
+                value = value[key]
+            except (KeyError, IndexError, TypeError):
+                raise KeyError(
+                    f"Record has no value for {{{{ {'.'.join(segment)} }}}}"
+                ) from None
+        if value is not None:
+            pieces.append(html.escape(str(value), quote=False).encode("utf-8"))
+    return b"".join(pieces)
+
+
+def _deflate(data):
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush()
+
+
+class _ZipWriter:
+    """Minimal zip writer that also accepts members compressed ahead of time."""
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self._offset = 0
+        self._central_directory = []
+
+    def write(self, info, data):
+        """Deflate and write data under info's name and timestamp."""
+        self.write_raw(
+            info, zipfile.ZIP_DEFLATED, zlib.crc32(data), _deflate(data), len(data)
+        )
+
+    def write_raw(self, info, method, crc, compressed, size):
+        """Write already-compressed member data under info's name and timestamp."""
+        name = info.filename.encode("utf-8")
+        flags = 0 if name.isascii() else 0x800
+        year, month, day, hour, minute, second = info.date_time
+        dos_time = hour << 11 | minute << 5 | second // 2
+        dos_date = max(year - 1980, 0) << 9 | month << 5 | day
+        if self._offset > 0xFFFFFFFF or len(compressed) > 0xFFFFFFFF:
+            raise ValueError("Output exceeds 4 GB; zip64 is not supported")
+
+        fields = (20, flags, method, dos_time, dos_date, crc, len(compressed), size)
+        header = struct.pack("<IHHHHHIIIHH", 0x04034B50, *fields, len(name), 0)
+        self._fileobj.write(header + name)
+        self._fileobj.write(compressed)
+
+        entry = struct.pack(
+            "<IHHHHHHIIIHHHHHII",
+            0x02014B50,
+            20,
+            *fields,
+            len(name),
+            0,
+            0,
+            0,
+            0,
+            info.external_attr,
+            self._offset,
+        )
+        self._central_directory.append(entry + name)
+        self._offset += len(header) + len(name) + len(compressed)
+
+    def close(self):
+        """Write the central directory."""
+        directory = b"".join(self._central_directory)
+        count = len(self._central_directory)
+        self._fileobj.write(directory)
+        self._fileobj.write(
+            struct.pack(
+                "<IHHHHIIH", 0x06054B50, 0, 0, count, count, len(directory), self._offset, 0
+            )
+        )
+
+
+# ==================== Records and workers ====================
+
+
+def _read_records(path):
+    """Yield records from a JSON array file or a JSON-lines file."""
+    path = Path(path)
+    if path.suffix.lower() in {".jsonl", ".ndjson"}:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        with open(path, encoding="utf-8") as f:
+            records = json.load(f)
+        if not isinstance(records, list):
+            raise ValueError(f"{path} must hold a JSON array of records")
+        yield from records
+
+
+def _output_paths(records, output_dir, suffix, name_key=None):
+    """Output file path for each record, all directly inside output_dir.
+
+    Names taken from name_key are reduced to one safe path component, so a
+    value like "../x" or "a/b" cannot write outside output_dir.
+
+    Raises:
+        KeyError: If a record has no name_key field
+        ValueError: If a name is empty once sanitized, or two records would
+            write the same file (compared case-insensitively)
+    """
+    paths = []
+    seen = {}
+    for index, record in enumerate(records):
+        if name_key:
+            name = UNSAFE_NAME_PATTERN.sub("_", str(record[name_key])).strip(" .")
+            if not name:
+                raise ValueError(
+                    f"Record {index}: {record[name_key]!r} is not usable as a file name"
+                )
+        else:
+            name = f"{index:06d}"
+        file_name = f"{name}{suffix}"
+        first = seen.setdefault(file_name.casefold(), index)
+        if first != index:
+            raise ValueError(f"Records {first} and {index} would both write {file_name}")
+        paths.append(output_dir / file_name)
+    return paths
+
+
+_worker_template = None
+
+
+def _init_worker(template_file):
+    global _worker_template
+    _worker_template = CompiledTemplate(template_file)
+
+
+def _render_in_worker(record, output_path):
+    _worker_template.render(record, output_path)
+
+
+if __name__ == "__main__":
+    main()
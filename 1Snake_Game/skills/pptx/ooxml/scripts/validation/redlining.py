@@ -7,6 +7,27 @@ import tempfile
 import zipfile
 from pathlib import Path
 
+WORD_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def unwrap_element(parent, elem):
+    """Replace elem in parent with its children (ElementTree or lxml elements)."""
+    index = list(parent).index(elem)
+    for child in reversed(list(elem)):
+        parent.insert(index, child)
+    parent.remove(elem)
+
+
+def convert_deleted_text(elem):
+    """Convert w:delText/w:delInstrText under elem back to w:t/w:instrText."""
+    renames = {
+        f"{{{WORD_NAMESPACE}}}delText": f"{{{WORD_NAMESPACE}}}t",
+        f"{{{WORD_NAMESPACE}}}delInstrText": f"{{{WORD_NAMESPACE}}}instrText",
+    }
+    for node in elem.iter():
+        if node.tag in renames:
+            node.tag = renames[node.tag]
+
 
 class RedliningValidator:
     """Validator for tracked changes in Word documents."""
@@ -15,9 +36,7 @@ class RedliningValidator:
         self.unpacked_dir = Path(unpacked_dir)
         self.original_docx = Path(original_docx)
         self.verbose = verbose
-        self.namespaces = {
-            "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
-        }
+        self.namespaces = {"w": WORD_NAMESPACE}
 
     def validate(self):
         """Main validation method that returns True if valid, False otherwise."""
@@ -230,26 +249,16 @@ class RedliningValidator:
                 parent.remove(elem)
 
         # Unwrap content in w:del elements where author is "Claude"
-        deltext_tag = f"{{{self.namespaces['w']}}}delText"
-        t_tag = f"{{{self.namespaces['w']}}}t"
-
         for parent in root.iter():
             to_process = []
             for child in parent:
                 if child.tag == del_tag and child.get(author_attr) == "Claude":
-                    to_process.append((child, list(parent).index(child)))
-
-            # Process in reverse order to maintain indices
-            for del_elem, del_index in reversed(to_process):
-                # Convert w:delText to w:t before moving
-                for elem in del_elem.iter():
-                    if elem.tag == deltext_tag:
-                        elem.tag = t_tag
-
-                # Move all children of w:del to its parent before removing w:del
-                for child in reversed(list(del_elem)):
-                    parent.insert(del_index, child)
-                parent.remove(del_elem)
+                    to_process.append(child)
+
+            for del_elem in to_process:
+                # Convert w:delText to w:t, then move the content into the parent
+                convert_deleted_text(del_elem)
+                unwrap_element(parent, del_elem)
 
     def _extract_text_content(self, root):
         """Extract text content from Word XML, preserving paragraph structure.
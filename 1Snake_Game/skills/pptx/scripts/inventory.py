@@ -13,26 +13,59 @@ This module provides functionality to:
 Classes:
     ParagraphData: Represents a text paragraph with formatting
     ShapeData: Represents a shape with position and text content
+    PresentationXml: Read-only access to the slide XML of a .pptx file
+    InventoryCache: Slide inventories kept between runs, keyed by slide content
 
 Main Functions:
     extract_text_inventory: Extract all text from a presentation
+    extract_text_inventory_xml: Same inventory, read directly from the slide XML
+    remeasure_shape: Check an edited shape without modifying the presentation
+    iter_inventory_as_dict: Yield the inventory slide by slide
     save_inventory: Save extracted data to JSON
+    write_inventory: Write slides to JSON or NDJSON as they are extracted
+
+The XML engine never builds python-pptx objects, so it is faster and leaves
+no side effects; its ShapeData have no .shape. Use extract_text_inventory when
+the shapes are going to be edited (see replace.py).
 
 Usage:
     python inventory.py input.pptx output.json
 """
 
 import argparse
+import functools
+import hashlib
 import json
+import math
+import os
 import platform
+import posixpath
 import sys
+import weakref
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
-
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import lxml.etree
+from overlaps import find_overlapping_pairs
 from PIL import Image, ImageDraw, ImageFont
 from pptx import Presentation
-from pptx.enum.text import PP_ALIGN
+from pptx.enum.dml import MSO_THEME_COLOR
+from pptx.enum.shapes import PP_PLACEHOLDER
+from pptx.enum.text import MSO_UNDERLINE, PP_ALIGN
 from pptx.shapes.base import BaseShape
 
 # Type aliases for cleaner signatures
@@ -60,6 +93,15 @@ Examples:
   python inventory.py presentation.pptx inventory.json --issues-only
     Extracts only text shapes that have overflow or overlap issues
 
+  python inventory.py presentation.pptx inventory.json --jobs 4
+    Extracts slides in 4 worker processes (same output as a serial run)
+
+  python inventory.py presentation.pptx inventory.ndjson --format ndjson
+    Writes one {"slide-N": {...}} line per slide as soon as it is extracted
+
+  python inventory.py presentation.pptx inventory.json --cache
+    Re-extracts only the slides that changed since the last --cache run
+
 The output JSON includes:
   - All text content organized by slide and shape
   - Correct absolute positions for shapes in groups
@@ -76,6 +118,41 @@ The output JSON includes:
         action="store_true",
         help="Include only text shapes that have overflow or overlap issues",
     )
+    parser.add_argument(
+        "--format",
+        choices=["json", "ndjson"],
+        default="json",
+        help="Write one JSON document (default) or one line per slide (ndjson)",
+    )
+    parser.add_argument(
+        "--detail",
+        choices=list(ShapeData.DETAILS),
+        default="full",
+        help="Include positions only, positions and issues, or everything including paragraphs (full, default)",
+    )
+    parser.add_argument(
+        "--font-cache",
+        help="JSON file to keep the font index in between runs (rebuilt when a font directory changes)",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["xml", "pptx"],
+        default="xml",
+        help="Read the slide XML directly (xml, default) or through python-pptx objects (pptx)",
+    )
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        const="",
+        metavar="DIR",
+        help="Reuse the inventory of unchanged slides: kept next to the deck, or in a cache shared by all decks when DIR is given",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes extracting slides in parallel (default: 1)",
+    )
 
     args = parser.parse_args()
 
@@ -88,23 +165,42 @@ The output JSON includes:
         print("Error: Input must be a PowerPoint file (.pptx)")
         sys.exit(1)
 
+    if args.font_cache:
+        FontIndex.set_default(FontIndex(cache_path=Path(args.font_cache)))
+
     try:
         print(f"Extracting text inventory from: {args.input}")
         if args.issues_only:
             print(
                 "Filtering to include only text shapes with issues (overflow/overlap)"
             )
-        inventory = extract_text_inventory(input_path, issues_only=args.issues_only)
+        cache = None
+        if args.cache is not None:
+            cache = InventoryCache.for_deck(input_path, args.cache)
+        slides = iter_inventory_as_dict(
+            input_path,
+            issues_only=args.issues_only,
+            jobs=args.jobs,
+            font_cache=args.font_cache,
+            engine=args.engine,
+            cache=cache,
+            detail=args.detail,
+        )
 
+        # Slides are written as they are extracted
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        save_inventory(inventory, output_path)
+        total_slides, total_shapes = write_inventory(
+            slides, output_path, ndjson=args.format == "ndjson"
+        )
 
         print(f"Output saved to: {args.output}")
+        if cache is not None:
+            print(
+                f"Reused {cache.hits} cached slide(s), extracted {cache.misses}"
+            )
 
         # Report statistics
-        total_slides = len(inventory)
-        total_shapes = sum(len(shapes) for shapes in inventory.values())
         if args.issues_only:
             if total_shapes > 0:
                 print(
@@ -125,6 +221,191 @@ The output JSON includes:
         sys.exit(1)
 
 
+class FontIndex:
+    """Font files in the platform font directories, indexed by file name.
+
+    The directories are walked once, including subdirectories. The index can
+    be kept in a JSON file between runs; it is rebuilt when the modification
+    time of any indexed directory has changed (fonts added or removed).
+    """
+
+    if platform.system() == "Darwin":  # macOS
+        FONT_DIRS = ["/System/Library/Fonts/", "/Library/Fonts/", "~/Library/Fonts/"]
+        EXTENSIONS = [".ttf", ".otf", ".ttc", ".dfont"]
+    else:  # Linux
+        FONT_DIRS = [
+            "/usr/share/fonts/truetype/",
+            "/usr/local/share/fonts/",
+            "~/.fonts/",
+        ]
+        EXTENSIONS = [".ttf", ".otf"]
+
+    _default: Optional["FontIndex"] = None
+
+    @classmethod
+    def default(cls) -> "FontIndex":
+        """Process-wide index, built on first use."""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    @classmethod
+    def set_default(cls, index: "FontIndex") -> None:
+        """Replace the process-wide index (e.g. with one persisted to disk)."""
+        cls._default = index
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        """Load the index from cache_path if still current, otherwise build it.
+
+        Args:
+            cache_path: Optional JSON file to load the index from and save it to
+        """
+        self._find_cache: Dict[str, Optional[str]] = {}
+        # One entry per font directory, in lookup order:
+        # (exact file name -> path, [(lowercase file name, path)])
+        self._roots: List[Tuple[Dict[str, str], List[Tuple[str, str]]]] = []
+        self._dir_mtimes: Dict[str, float] = {}
+        self._version: Optional[str] = None
+
+        if cache_path is not None and self._load(cache_path):
+            return
+        self._build()
+        if cache_path is not None:
+            self._save(cache_path)
+
+    def find(self, font_name: str) -> Optional[str]:
+        """Get the file of a font, e.g. 'Arial' or 'DejaVu Sans'.
+
+        Within each font directory, in order, file names matching a variant of
+        the name exactly ('Arial.ttf', 'arial.ttf', 'DejaVuSans.ttf',
+        'DejaVu-Sans.ttf') win over file names merely containing it.
+
+        Returns:
+            Path to the font file, or None if not found
+        """
+        if font_name not in self._find_cache:
+            self._find_cache[font_name] = self._lookup(font_name)
+        return self._find_cache[font_name]
+
+    @property
+    def version(self) -> str:
+        """Digest of the indexed font files; changes when fonts are added or removed."""
+        if self._version is None:
+            self._version = hashlib.sha256(
+                json.dumps(self._roots).encode("utf-8")
+            ).hexdigest()
+        return self._version
+
+    def _lookup(self, font_name: str) -> Optional[str]:
+        font_variations = [
+            font_name,
+            font_name.lower(),
+            font_name.replace(" ", ""),
+            font_name.replace(" ", "-"),
+        ]
+        font_name_lower = font_name.lower().replace(" ", "")
+
+        for exact, files in self._roots:
+            for variant in font_variations:
+                for ext in self.EXTENSIONS:
+                    if f"{variant}{ext}" in exact:
+                        return exact[f"{variant}{ext}"]
+            for file_name_lower, path in files:
+                if font_name_lower in file_name_lower:
+                    return path
+        return None
+
+    def _build(self) -> None:
+        """Walk the font directories, recording files and directory mtimes."""
+        for font_dir in self.FONT_DIRS:
+            exact: Dict[str, str] = {}
+            files: List[Tuple[str, str]] = []
+            font_dir_path = Path(font_dir).expanduser()
+            for dirpath, dirnames, filenames in os.walk(font_dir_path):
+                dirnames.sort()
+                try:
+                    self._dir_mtimes[dirpath] = os.stat(dirpath).st_mtime
+                except OSError:
+                    continue
+                for filename in sorted(filenames):
+                    lower = filename.lower()
+                    if not any(lower.endswith(ext) for ext in self.EXTENSIONS):
+                        continue
+                    path = os.path.join(dirpath, filename)
+                    # Files directly in the font directory take precedence
+                    exact.setdefault(filename, path)
+                    files.append((lower, path))
+            self._roots.append((exact, files))
+
+    def _load(self, cache_path: Path) -> bool:
+        """Load a saved index; False if missing, unreadable or out of date."""
+        try:
+            with open(cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data["font_dirs"] != self.FONT_DIRS:
+                return False
+            for dirpath, mtime in data["dir_mtimes"].items():
+                if os.stat(dirpath).st_mtime != mtime:
+                    return False
+            # A font directory created since the index was saved
+            for font_dir in self.FONT_DIRS:
+                font_dir_path = str(Path(font_dir).expanduser())
+                if font_dir_path not in data["dir_mtimes"] and os.path.isdir(
+                    font_dir_path
+                ):
+                    return False
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+        self._dir_mtimes = data["dir_mtimes"]
+        self._roots = [
+            (exact, [(lower, path) for lower, path in files])
+            for exact, files in data["roots"]
+        ]
+        return True
+
+    def _save(self, cache_path: Path) -> None:
+        data = {
+            "font_dirs": self.FONT_DIRS,
+            "dir_mtimes": self._dir_mtimes,
+            "roots": self._roots,
+        }
+        try:
+            Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+        except OSError:
+            pass  # The index still works, it just is not kept
+
+
+@functools.lru_cache(maxsize=64)
+def load_font(font_path: Optional[str], size: int) -> Any:
+    """Load a font at a size, falling back to PIL's default font.
+
+    Loaded fonts are kept in an LRU cache, as most decks use a handful of
+    font and size combinations across all their paragraphs.
+    """
+    if font_path:
+        try:
+            return ImageFont.truetype(font_path, size=size)
+        except Exception:
+            pass
+    return ImageFont.load_default()
+
+
+_measure_draw = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+
+
+@functools.lru_cache(maxsize=65536)
+def measure_text(font: Any, text: str) -> float:
+    """Width of text in pixels, cached by (font, text).
+
+    Each loaded font is one face at one size, so words repeated across
+    paragraphs and shapes are measured once.
+    """
+    return _measure_draw.textlength(text, font=font)
+
+
 @dataclass
 class ShapeWithPosition:
     """A shape with its absolute position on the slide."""
@@ -137,26 +418,30 @@ class ShapeWithPosition:
 class ParagraphData:
     """Data structure for paragraph properties extracted from a PowerPoint paragraph."""
 
+    __slots__ = (
+        "text",
+        "bullet",
+        "level",
+        "alignment",
+        "space_before",
+        "space_after",
+        "font_name",
+        "font_size",
+        "bold",
+        "italic",
+        "underline",
+        "color",
+        "theme_color",
+        "line_spacing",
+    )
+
     def __init__(self, paragraph: Any):
         """Initialize from a PowerPoint paragraph object.
 
         Args:
             paragraph: The PowerPoint paragraph object
         """
-        self.text: str = paragraph.text.strip()
-        self.bullet: bool = False
-        self.level: Optional[int] = None
-        self.alignment: Optional[str] = None
-        self.space_before: Optional[float] = None
-        self.space_after: Optional[float] = None
-        self.font_name: Optional[str] = None
-        self.font_size: Optional[float] = None
-        self.bold: Optional[bool] = None
-        self.italic: Optional[bool] = None
-        self.underline: Optional[bool] = None
-        self.color: Optional[str] = None
-        self.theme_color: Optional[str] = None
-        self.line_spacing: Optional[float] = None
+        self._init_defaults(paragraph.text.strip())
 
         # Check for bullet formatting
         if (
@@ -228,6 +513,23 @@ class ParagraphData:
                 font_size = self.font_size if self.font_size else 12.0
                 self.line_spacing = round(paragraph.line_spacing * font_size, 2)
 
+    def _init_defaults(self, text: str) -> None:
+        """Set the text and leave every formatting field unset."""
+        self.text: str = text
+        self.bullet: bool = False
+        self.level: Optional[int] = None
+        self.alignment: Optional[str] = None
+        self.space_before: Optional[float] = None
+        self.space_after: Optional[float] = None
+        self.font_name: Optional[str] = None
+        self.font_size: Optional[float] = None
+        self.bold: Optional[bool] = None
+        self.italic: Optional[bool] = None
+        self.underline: Optional[bool] = None
+        self.color: Optional[str] = None
+        self.theme_color: Optional[str] = None
+        self.line_spacing: Optional[float] = None
+
     def to_dict(self) -> ParagraphDict:
         """Convert to dictionary for JSON serialization, excluding None values."""
         result: ParagraphDict = {"text": self.text}
@@ -263,8 +565,47 @@ class ParagraphData:
         return result
 
 
+# Marks a lazily computed ShapeData field that has not been computed yet
+_NOT_COMPUTED: Any = object()
+
+
 class ShapeData:
-    """Data structure for shape properties extracted from a PowerPoint shape."""
+    """Data structure for shape properties extracted from a PowerPoint shape.
+
+    Position and placeholder fields are read when the record is created. The
+    paragraphs and the issue fields (frame_overflow_bottom, slide overflow,
+    warnings) are computed on first access, from the shape as it is then, and
+    cached, so callers that only need positions never pay for text measurement.
+    """
+
+    __slots__ = (
+        "shape",
+        "shape_id",
+        "detail",
+        "slide_width_emu",
+        "slide_height_emu",
+        "placeholder_type",
+        "default_font_size",
+        "left",
+        "top",
+        "width",
+        "height",
+        "left_emu",
+        "top_emu",
+        "width_emu",
+        "height_emu",
+        "overlapping_shapes",
+        "_text_paragraph_list",
+        "_paragraph_entries",
+        "_frame_overflow_bottom",
+        "_slide_overflow",
+        "_warnings",
+    )
+
+    # What to_dict() includes: "positions" (position, size and placeholder
+    # info), "issues" (plus overflow, overlap and warnings) or "full" (plus
+    # paragraphs)
+    DETAILS = ("positions", "issues", "full")
 
     @staticmethod
     def emu_to_inches(emu: int) -> float:
@@ -286,61 +627,7 @@ class ShapeData:
         Returns:
             Path to the font file, or None if not found
         """
-        system = platform.system()
-
-        # Common font file variations to try
-        font_variations = [
-            font_name,
-            font_name.lower(),
-            font_name.replace(" ", ""),
-            font_name.replace(" ", "-"),
-        ]
-
-        # Define font directories and extensions by platform
-        if system == "Darwin":  # macOS
-            font_dirs = [
-                "/System/Library/Fonts/",
-                "/Library/Fonts/",
-                "~/Library/Fonts/",
-            ]
-            extensions = [".ttf", ".otf", ".ttc", ".dfont"]
-        else:  # Linux
-            font_dirs = [
-                "/usr/share/fonts/truetype/",
-                "/usr/local/share/fonts/",
-                "~/.fonts/",
-            ]
-            extensions = [".ttf", ".otf"]
-
-        # Try to find the font file
-        from pathlib import Path
-
-        for font_dir in font_dirs:
-            font_dir_path = Path(font_dir).expanduser()
-            if not font_dir_path.exists():
-                continue
-
-            # First try exact matches
-            for variant in font_variations:
-                for ext in extensions:
-                    font_path = font_dir_path / f"{variant}{ext}"
-                    if font_path.exists():
-                        return str(font_path)
-
-            # Then try fuzzy matching - find files containing the font name
-            try:
-                for file_path in font_dir_path.iterdir():
-                    if file_path.is_file():
-                        file_name_lower = file_path.name.lower()
-                        font_name_lower = font_name.lower().replace(" ", "")
-                        if font_name_lower in file_name_lower and any(
-                            file_name_lower.endswith(ext) for ext in extensions
-                        ):
-                            return str(file_path)
-            except (OSError, PermissionError):
-                continue
-
-        return None
+        return FontIndex.default().find(font_name)
 
     @staticmethod
     def get_slide_dimensions(slide: Any) -> tuple[Optional[int], Optional[int]]:
@@ -370,17 +657,14 @@ class ShapeData:
             Default font size in points, or None if not found
         """
         try:
-            if not hasattr(shape, "placeholder_format"):
+            ph = _placeholder(shape.element)
+            if ph is None:
                 return None
 
-            shape_type = shape.placeholder_format.type  # type: ignore
-            for layout_placeholder in slide_layout.placeholders:
-                if layout_placeholder.placeholder_format.type == shape_type:
-                    # Find first defRPr element with sz (size) attribute
-                    for elem in layout_placeholder.element.iter():
-                        if "defRPr" in elem.tag and (sz := elem.get("sz")):
-                            return float(sz) / 100.0  # Convert EMUs to points
-                    break
+            # First defRPr size in the layout's first placeholder of this type
+            return _layout_tables_for(slide_layout).default_font_sizes.get(
+                _placeholder_type(ph)
+            )
         except Exception:
             pass
         return None
@@ -402,6 +686,7 @@ class ShapeData:
         """
         self.shape = shape  # Store reference to original shape
         self.shape_id: str = ""  # Will be set after sorting
+        self.detail: str = "full"
 
         # Get slide dimensions from slide object
         self.slide_width_emu, self.slide_height_emu = (
@@ -453,29 +738,92 @@ class ShapeData:
         self.width_emu = shape.width if hasattr(shape, "width") else 0
         self.height_emu = shape.height if hasattr(shape, "height") else 0
 
-        # Calculate overflow status
-        self.frame_overflow_bottom: Optional[float] = None
-        self.slide_overflow_right: Optional[float] = None
-        self.slide_overflow_bottom: Optional[float] = None
+        self._reset_computed_fields()
+
+    def _reset_computed_fields(self) -> None:
+        """Start with no lazily computed fields (and no overlaps detected yet)."""
         self.overlapping_shapes: Dict[
             str, float
         ] = {}  # Dict of shape_id -> overlap area in sq inches
-        self.warnings: List[str] = []
-        self._estimate_frame_overflow()
-        self._calculate_slide_overflow()
-        self._detect_bullet_issues()
+        self._text_paragraph_list: Optional[List[Tuple[int, str, Any]]] = None
+        self._paragraph_entries: Optional[List[Tuple[int, str, ParagraphData]]] = None
+        self._frame_overflow_bottom: Optional[float] = _NOT_COMPUTED
+        self._slide_overflow: Optional[Tuple[Optional[float], Optional[float]]] = None
+        self._warnings: Optional[List[str]] = None
 
     @property
     def paragraphs(self) -> List[ParagraphData]:
-        """Calculate paragraphs from the shape's text frame."""
+        """The non-empty paragraphs of the shape's text frame."""
+        return [para_data for _, _, para_data in self._non_empty_paragraphs()]
+
+    @property
+    def frame_overflow_bottom(self) -> Optional[float]:
+        """Estimated text overflow past the bottom of the frame, in inches."""
+        if self._frame_overflow_bottom is _NOT_COMPUTED:
+            self._frame_overflow_bottom = self._estimate_frame_overflow()
+        return self._frame_overflow_bottom
+
+    @property
+    def slide_overflow_right(self) -> Optional[float]:
+        """Overflow past the right edge of the slide, in inches."""
+        return self._slide_overflow_edges()[0]
+
+    @property
+    def slide_overflow_bottom(self) -> Optional[float]:
+        """Overflow past the bottom edge of the slide, in inches."""
+        return self._slide_overflow_edges()[1]
+
+    @property
+    def warnings(self) -> List[str]:
+        """Formatting warnings, e.g. manual bullet symbols."""
+        if self._warnings is None:
+            self._warnings = self._detect_bullet_issues()
+        return self._warnings
+
+    def _cached_text_paragraphs(self) -> List[Tuple[int, str, Any]]:
+        if self._text_paragraph_list is None:
+            self._text_paragraph_list = self._text_paragraphs()
+        return self._text_paragraph_list
+
+    def _non_empty_paragraphs(self) -> List[Tuple[int, str, ParagraphData]]:
+        """(index, text, ParagraphData) for each paragraph with text, built once."""
+        if self._paragraph_entries is None:
+            self._paragraph_entries = [
+                (index, text, self._paragraph_data(paragraph))
+                for index, text, paragraph in self._cached_text_paragraphs()
+                if text.strip()
+            ]
+        return self._paragraph_entries
+
+    def _slide_overflow_edges(self) -> Tuple[Optional[float], Optional[float]]:
+        if self._slide_overflow is None:
+            self._slide_overflow = self._calculate_slide_overflow()
+        return self._slide_overflow
+
+    def _text_paragraphs(self) -> List[Tuple[int, str, Any]]:
+        """(index, text, paragraph) for each paragraph of the shape's text frame."""
         if not self.shape or not hasattr(self.shape, "text_frame"):
             return []
 
-        paragraphs = []
-        for paragraph in self.shape.text_frame.paragraphs:  # type: ignore
-            if paragraph.text.strip():
-                paragraphs.append(ParagraphData(paragraph))
-        return paragraphs
+        text_frame = self.shape.text_frame  # type: ignore
+        if not text_frame:
+            return []
+        return [
+            (index, paragraph.text, paragraph)
+            for index, paragraph in enumerate(text_frame.paragraphs)
+        ]
+
+    def _paragraph_data(self, paragraph: Any) -> ParagraphData:
+        """ParagraphData for a paragraph from _text_paragraphs()."""
+        return ParagraphData(paragraph)
+
+    def _text_frame_margins(self) -> Dict[str, Optional[int]]:
+        """Text frame margins in EMUs (top, bottom, left, right)."""
+        text_frame = self.shape.text_frame  # type: ignore
+        return {
+            side: getattr(text_frame, f"margin_{side}", None)
+            for side in ("top", "bottom", "left", "right")
+        }
 
     def _get_default_font_size(self) -> int:
         """Get default font size from theme text styles or use conservative default."""
@@ -485,41 +833,30 @@ class ShapeData:
             ):
                 return 14
 
-            slide_master = self.shape.part.slide_layout.slide_master  # type: ignore
-            if not hasattr(slide_master, "element"):
-                return 14
+            master = _layout_tables_for(self.shape.part.slide_layout).master  # type: ignore
 
             # Determine theme style based on placeholder type
             style_name = "bodyStyle"  # Default
             if self.placeholder_type and "TITLE" in self.placeholder_type:
                 style_name = "titleStyle"
 
-            # Find font size in theme styles
-            for child in slide_master.element.iter():
-                tag = child.tag.split("}")[-1] if "}" in child.tag else child.tag
-                if tag == style_name:
-                    for elem in child.iter():
-                        if "sz" in elem.attrib:
-                            return int(elem.attrib["sz"]) // 100
+            # First font size in the theme style
+            if style_name in master.style_font_sizes:
+                return master.style_font_sizes[style_name]
         except Exception:
             pass
 
         return 14  # Conservative default for body text
 
-    def _get_usable_dimensions(self, text_frame) -> Tuple[int, int]:
+    def _get_usable_dimensions(self) -> Tuple[int, int]:
         """Get usable width and height in pixels after accounting for margins."""
         # Default PowerPoint margins in inches
         margins = {"top": 0.05, "bottom": 0.05, "left": 0.1, "right": 0.1}
 
         # Override with actual margins if set
-        if hasattr(text_frame, "margin_top") and text_frame.margin_top:
-            margins["top"] = self.emu_to_inches(text_frame.margin_top)
-        if hasattr(text_frame, "margin_bottom") and text_frame.margin_bottom:
-            margins["bottom"] = self.emu_to_inches(text_frame.margin_bottom)
-        if hasattr(text_frame, "margin_left") and text_frame.margin_left:
-            margins["left"] = self.emu_to_inches(text_frame.margin_left)
-        if hasattr(text_frame, "margin_right") and text_frame.margin_right:
-            margins["right"] = self.emu_to_inches(text_frame.margin_right)
+        for side, margin_emu in self._text_frame_margins().items():
+            if margin_emu:
+                margins[side] = self.emu_to_inches(margin_emu)
 
         # Calculate usable area
         usable_width = self.width - margins["left"] - margins["right"]
@@ -531,47 +868,66 @@ class ShapeData:
             self.inches_to_pixels(usable_height),
         )
 
+    # Lines whose width estimated from cached word widths is within this many
+    # pixels of the limit are measured exactly, so kerning or shaping across
+    # words cannot change a line break (0 trusts the estimate)
+    WRAP_VERIFY_PX = 1.0
+
     def _wrap_text_line(self, line: str, max_width_px: int, draw, font) -> List[str]:
         """Wrap a single line of text to fit within max_width_px."""
         if not line:
             return [""]
 
-        # Use textlength for efficient width calculation
-        if draw.textlength(line, font=font) <= max_width_px:
+        # Line widths are summed from cached word and space widths, instead of
+        # measuring every candidate line from scratch
+        words = line.split(" ")
+        widths = [measure_text(font, word) for word in words]
+        space_width = measure_text(font, " ")
+
+        def fits(text: str, estimate: float) -> bool:
+            if abs(estimate - max_width_px) <= self.WRAP_VERIFY_PX:
+                return draw.textlength(text, font=font) <= max_width_px
+            return estimate <= max_width_px
+
+        if fits(line, sum(widths) + space_width * (len(words) - 1)):
             return [line]
 
-        # Need to wrap - split into words
+        # Need to wrap
         wrapped = []
-        words = line.split(" ")
         current_line = ""
-
-        for word in words:
-            test_line = current_line + (" " if current_line else "") + word
-            if draw.textlength(test_line, font=font) <= max_width_px:
-                current_line = test_line
+        current_width = 0.0
+
+        for word, width in zip(words, widths):
+            separator = " " if current_line else ""
+            test_width = current_width + (space_width if separator else 0) + width
+            if fits(current_line + separator + word, test_width):
+                current_line = current_line + separator + word
+                current_width = test_width
             else:
                 if current_line:
                     wrapped.append(current_line)
                 current_line = word
+                current_width = width
 
         if current_line:
             wrapped.append(current_line)
 
         return wrapped
 
-    def _estimate_frame_overflow(self) -> None:
-        """Estimate if text overflows the shape bounds using PIL text measurement."""
-        if not self.shape or not hasattr(self.shape, "text_frame"):
-            return
+    def _estimate_frame_overflow(self) -> Optional[float]:
+        """Estimate if text overflows the shape bounds using PIL text measurement.
 
-        text_frame = self.shape.text_frame  # type: ignore
-        if not text_frame or not text_frame.paragraphs:
-            return
+        Returns:
+            Overflow in inches, or None if the text fits
+        """
+        text_paragraphs = self._non_empty_paragraphs()
+        if not text_paragraphs:
+            return None
 
         # Get usable dimensions after accounting for margins
-        usable_width_px, usable_height_px = self._get_usable_dimensions(text_frame)
+        usable_width_px, usable_height_px = self._get_usable_dimensions()
         if usable_width_px <= 0 or usable_height_px <= 0:
-            return
+            return None
 
         # Set up PIL for text measurement
         dummy_img = Image.new("RGB", (1, 1))
@@ -583,29 +939,16 @@ class ShapeData:
         # Calculate total height of all paragraphs
         total_height_px = 0
 
-        for para_idx, paragraph in enumerate(text_frame.paragraphs):
-            if not paragraph.text.strip():
-                continue
-
-            para_data = ParagraphData(paragraph)
-
+        for para_idx, text, para_data in text_paragraphs:
             # Load font for this paragraph
             font_name = para_data.font_name or "Arial"
             font_size = int(para_data.font_size or default_font_size)
 
-            font = None
-            font_path = self.get_font_path(font_name)
-            if font_path:
-                try:
-                    font = ImageFont.truetype(font_path, size=font_size)
-                except Exception:
-                    font = ImageFont.load_default()
-            else:
-                font = ImageFont.load_default()
+            font = load_font(self.get_font_path(font_name), font_size)
 
             # Wrap all lines in this paragraph
             all_wrapped_lines = []
-            for line in paragraph.text.split("\n"):
+            for line in text.split("\n"):
                 wrapped = self._wrap_text_line(line, usable_width_px, draw, font)
                 all_wrapped_lines.extend(wrapped)
 
@@ -634,12 +977,19 @@ class ShapeData:
             overflow_px = total_height_px - usable_height_px
             overflow_inches = round(overflow_px / 96.0, 2)
             if overflow_inches > 0.05:  # Only report significant overflows
-                self.frame_overflow_bottom = overflow_inches
+                return overflow_inches
+        return None
 
-    def _calculate_slide_overflow(self) -> None:
-        """Calculate if shape overflows the slide boundaries."""
+    def _calculate_slide_overflow(self) -> Tuple[Optional[float], Optional[float]]:
+        """Calculate if shape overflows the slide boundaries.
+
+        Returns:
+            (right, bottom) overflow in inches, None where there is none
+        """
+        overflow_right = None
+        overflow_bottom = None
         if self.slide_width_emu is None or self.slide_height_emu is None:
-            return
+            return overflow_right, overflow_bottom
 
         # Check right overflow (ignore negligible overflows <= 0.01")
         right_edge_emu = self.left_emu + self.width_emu
@@ -647,7 +997,7 @@ class ShapeData:
             overflow_emu = right_edge_emu - self.slide_width_emu
             overflow_inches = round(self.emu_to_inches(overflow_emu), 2)
             if overflow_inches > 0.01:  # Only report significant overflows
-                self.slide_overflow_right = overflow_inches
+                overflow_right = overflow_inches
 
         # Check bottom overflow (ignore negligible overflows <= 0.01")
         bottom_edge_emu = self.top_emu + self.height_emu
@@ -655,38 +1005,32 @@ class ShapeData:
             overflow_emu = bottom_edge_emu - self.slide_height_emu
             overflow_inches = round(self.emu_to_inches(overflow_emu), 2)
             if overflow_inches > 0.01:  # Only report significant overflows
-                self.slide_overflow_bottom = overflow_inches
-
-    def _detect_bullet_issues(self) -> None:
-        """Detect bullet point formatting issues in paragraphs."""
-        if not self.shape or not hasattr(self.shape, "text_frame"):
-            return
+                overflow_bottom = overflow_inches
 
-        text_frame = self.shape.text_frame  # type: ignore
-        if not text_frame or not text_frame.paragraphs:
-            return
+        return overflow_right, overflow_bottom
 
+    def _detect_bullet_issues(self) -> List[str]:
+        """Detect bullet point formatting issues in paragraphs."""
         # Common bullet symbols that indicate manual bullets
         bullet_symbols = ["•", "●", "○"]
 
-        for paragraph in text_frame.paragraphs:
-            text = paragraph.text.strip()
+        for _, text, _ in self._cached_text_paragraphs():
+            text = text.strip()
             # Check for manual bullet symbols
             if text and any(text.startswith(symbol + " ") for symbol in bullet_symbols):
-                self.warnings.append(
-                    "manual_bullet_symbol: use proper bullet formatting"
-                )
-                break
+                return ["manual_bullet_symbol: use proper bullet formatting"]
+        return []
 
     @property
     def has_any_issues(self) -> bool:
         """Check if shape has any issues (overflow, overlap, or warnings)."""
+        # Cheapest checks first; the frame overflow needs text measurement
         return (
-            self.frame_overflow_bottom is not None
-            or self.slide_overflow_right is not None
+            self.slide_overflow_right is not None
             or self.slide_overflow_bottom is not None
             or len(self.overlapping_shapes) > 0
             or len(self.warnings) > 0
+            or self.frame_overflow_bottom is not None
         )
 
     def to_dict(self) -> ShapeDict:
@@ -705,6 +1049,9 @@ class ShapeData:
         if self.default_font_size:
             result["default_font_size"] = self.default_font_size
 
+        if self.detail == "positions":
+            return result
+
         # Add overflow information only if there is overflow
         overflow_data = {}
 
@@ -734,7 +1081,8 @@ class ShapeData:
             result["warnings"] = self.warnings
 
         # Add paragraphs after placeholder_type
-        result["paragraphs"] = [para.to_dict() for para in self.paragraphs]
+        if self.detail == "full":
+            result["paragraphs"] = [para.to_dict() for para in self.paragraphs]
 
         return result
 
@@ -888,31 +1236,35 @@ def detect_overlaps(shapes: List[ShapeData]) -> None:
     Args:
         shapes: List of ShapeData objects with shape_id attributes set
     """
-    n = len(shapes)
+    for i, shape in enumerate(shapes):
+        # Ensure shape IDs are set
+        assert shape.shape_id, f"Shape at index {i} has no shape_id"
 
-    # Compare each pair of shapes
-    for i in range(n):
-        for j in range(i + 1, n):
-            shape1 = shapes[i]
-            shape2 = shapes[j]
+    # Only pairs whose bounds overlap by more than the tolerance are compared
+    rects = [
+        (shape.left, shape.top, shape.left + shape.width, shape.top + shape.height)
+        for shape in shapes
+    ]
+    for i, j in find_overlapping_pairs(rects, tolerance=0.05):
+        shape1 = shapes[i]
+        shape2 = shapes[j]
 
-            # Ensure shape IDs are set
-            assert shape1.shape_id, f"Shape at index {i} has no shape_id"
-            assert shape2.shape_id, f"Shape at index {j} has no shape_id"
+        rect1 = (shape1.left, shape1.top, shape1.width, shape1.height)
+        rect2 = (shape2.left, shape2.top, shape2.width, shape2.height)
 
-            rect1 = (shape1.left, shape1.top, shape1.width, shape1.height)
-            rect2 = (shape2.left, shape2.top, shape2.width, shape2.height)
+        overlaps, overlap_area = calculate_overlap(rect1, rect2)
 
-            overlaps, overlap_area = calculate_overlap(rect1, rect2)
-
-            if overlaps:
-                # Add shape IDs with overlap area in square inches
-                shape1.overlapping_shapes[shape2.shape_id] = overlap_area
-                shape2.overlapping_shapes[shape1.shape_id] = overlap_area
+        if overlaps:
+            # Add shape IDs with overlap area in square inches
+            shape1.overlapping_shapes[shape2.shape_id] = overlap_area
+            shape2.overlapping_shapes[shape1.shape_id] = overlap_area
 
 
 def extract_text_inventory(
-    pptx_path: Path, prs: Optional[Any] = None, issues_only: bool = False
+    pptx_path: Path,
+    prs: Optional[Any] = None,
+    issues_only: bool = False,
+    detail: str = "full",
 ) -> InventoryData:
     """Extract text content from all slides in a PowerPoint presentation.
 
@@ -920,6 +1272,8 @@ def extract_text_inventory(
         pptx_path: Path to the PowerPoint file
         prs: Optional Presentation object to use. If not provided, will load from pptx_path.
         issues_only: If True, only include shapes that have overflow or overlap issues
+        detail: What the shapes' to_dict() includes, one of ShapeData.DETAILS
+            ("full" by default); fields that are left out are never computed
 
     Returns a nested dictionary: {slide-N: {shape-N: ShapeData}}
     Shapes are sorted by visual position (top-to-bottom, left-to-right).
@@ -931,50 +1285,99 @@ def extract_text_inventory(
     inventory: InventoryData = {}
 
     for slide_idx, slide in enumerate(prs.slides):
-        # Collect all valid shapes from this slide with absolute positions
-        shapes_with_positions = []
-        for shape in slide.shapes:  # type: ignore
-            shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
-
-        if not shapes_with_positions:
-            continue
+        slide_inventory = extract_slide_inventory(
+            slide, issues_only=issues_only, detail=detail
+        )
+        if slide_inventory:
+            inventory[f"slide-{slide_idx}"] = slide_inventory
 
-        # Convert to ShapeData with absolute positions and slide reference
-        shape_data_list = [
-            ShapeData(
-                swp.shape,
-                swp.absolute_left,
-                swp.absolute_top,
-                slide,
-            )
-            for swp in shapes_with_positions
-        ]
+    return inventory
 
-        # Sort by visual position and assign stable IDs in one step
-        sorted_shapes = sort_shapes_by_position(shape_data_list)
-        for idx, shape_data in enumerate(sorted_shapes):
-            shape_data.shape_id = f"shape-{idx}"
 
-        # Detect overlaps using the stable shape IDs
-        if len(sorted_shapes) > 1:
-            detect_overlaps(sorted_shapes)
+def extract_slide_inventory(
+    slide: Any, issues_only: bool = False, detail: str = "full"
+) -> Dict[str, ShapeData]:
+    """Extract the text shapes of one slide: {shape-N: ShapeData}.
 
-        # Filter for issues only if requested (after overlap detection)
-        if issues_only:
-            sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
+    Args:
+        slide: The slide object
+        issues_only: If True, only include shapes that have overflow or overlap issues
+        detail: What the shapes' to_dict() includes, one of ShapeData.DETAILS
+            ("full" by default); fields that are left out are never computed
 
-        if not sorted_shapes:
-            continue
+    Returns:
+        Shapes sorted by visual position (empty if the slide has no text)
+    """
+    # Collect all valid shapes from this slide with absolute positions
+    shapes_with_positions = []
+    for shape in slide.shapes:  # type: ignore
+        shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
+
+    if not shapes_with_positions:
+        return {}
+
+    # Convert to ShapeData with absolute positions and slide reference
+    shape_data_list = [
+        ShapeData(
+            swp.shape,
+            swp.absolute_left,
+            swp.absolute_top,
+            slide,
+        )
+        for swp in shapes_with_positions
+    ]
+    return finish_slide_inventory(
+        shape_data_list, issues_only=issues_only, detail=detail
+    )
 
-        # Create slide inventory using the stable shape IDs
-        inventory[f"slide-{slide_idx}"] = {
-            shape_data.shape_id: shape_data for shape_data in sorted_shapes
-        }
 
-    return inventory
+def finish_slide_inventory(
+    shape_data_list: List[ShapeData], issues_only: bool = False, detail: str = "full"
+) -> Dict[str, ShapeData]:
+    """Sort a slide's shapes, assign their IDs and detect overlaps.
 
+    Args:
+        shape_data_list: The slide's text shapes
+        issues_only: If True, only include shapes that have overflow or overlap issues
+        detail: What the shapes' to_dict() includes, one of ShapeData.DETAILS
+            ("full" by default); fields that are left out are never computed
 
-def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> InventoryDict:
+    Returns:
+        {shape-N: ShapeData}, sorted by visual position
+    """
+    if detail not in ShapeData.DETAILS:
+        raise ValueError(f"Unknown detail level: {detail}")
+    if not shape_data_list:
+        return {}
+    for shape_data in shape_data_list:
+        shape_data.detail = detail
+
+    # Sort by visual position and assign stable IDs in one step
+    sorted_shapes = sort_shapes_by_position(shape_data_list)
+    for idx, shape_data in enumerate(sorted_shapes):
+        shape_data.shape_id = f"shape-{idx}"
+
+    # Detect overlaps using the stable shape IDs
+    if len(sorted_shapes) > 1:
+        detect_overlaps(sorted_shapes)
+
+    # Filter for issues only if requested (after overlap detection)
+    if issues_only:
+        sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
+
+    # Create slide inventory using the stable shape IDs
+    return {shape_data.shape_id: shape_data for shape_data in sorted_shapes}
+
+
+def get_inventory_as_dict(
+    pptx_path: Path,
+    issues_only: bool = False,
+    jobs: int = 1,
+    font_cache: Optional[Union[str, Path]] = None,
+    engine: str = "pptx",
+    cache: Optional["InventoryCache"] = None,
+    detail: str = "full",
+) -> InventoryDict:
     """Extract text inventory and return as JSON-serializable dictionaries.
 
     This is a convenience wrapper around extract_text_inventory that returns
@@ -984,36 +1387,1083 @@ def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> Invento
     Args:
         pptx_path: Path to the PowerPoint file
         issues_only: If True, only include shapes that have overflow or overlap issues
+        jobs: Number of worker processes. Each loads the presentation once and
+            extracts disjoint slide ranges; results are merged in slide order,
+            identical to a serial run.
+        font_cache: Optional font index file for the workers (see FontIndex)
+        engine: "pptx" to read through python-pptx, or "xml" to read the slide
+            XML directly (see extract_text_inventory_xml)
+        cache: Optional InventoryCache; only slides whose content changed since
+            they were cached are extracted, and the cache is saved afterwards
+        detail: What the shapes' to_dict() includes, one of ShapeData.DETAILS
+            ("full" by default); fields that are left out are never computed
 
     Returns:
         Nested dictionary with all data serialized for JSON
     """
-    inventory = extract_text_inventory(pptx_path, issues_only=issues_only)
+    return dict(
+        iter_inventory_as_dict(
+            pptx_path,
+            issues_only=issues_only,
+            jobs=jobs,
+            font_cache=font_cache,
+            engine=engine,
+            cache=cache,
+            detail=detail,
+        )
+    )
+
+
+def iter_inventory_as_dict(
+    pptx_path: Path,
+    issues_only: bool = False,
+    jobs: int = 1,
+    font_cache: Optional[Union[str, Path]] = None,
+    engine: str = "pptx",
+    cache: Optional["InventoryCache"] = None,
+    detail: str = "full",
+) -> Iterator[Tuple[str, Dict[str, ShapeDict]]]:
+    """Extract the text inventory slide by slide, as JSON-serializable dicts.
+
+    Yields (slide-N, {shape-N: shape dict}) in slide order as soon as each
+    slide is done, skipping slides without text. Shapes are converted to dicts
+    and dropped right away, so no python-pptx shape outlives its slide. Takes
+    the same arguments as get_inventory_as_dict(); a cache is saved when the
+    iteration ends.
+    """
+    presentation = PresentationXml(pptx_path)
+    slide_count = len(presentation.slide_paths)
+    presentation.close()
+
+    keys: List[str] = []
+    cached: List[Optional[Dict[str, ShapeDict]]] = [None] * slide_count
+    if cache is not None:
+        keys = cache.slide_keys(pptx_path, issues_only, detail)
+        cached = [cache.get(key) for key in keys]
+    missing = [slide_idx for slide_idx, slide in enumerate(cached) if slide is None]
+    extracted = _iter_extracted_slides(
+        pptx_path, missing, issues_only, detail, jobs, font_cache, engine
+    )
+
+    try:
+        for slide_idx, slide in enumerate(cached):
+            if slide is None:
+                slide = next(extracted)
+                if cache is not None:
+                    cache.put(keys[slide_idx], slide)
+            if slide:
+                yield f"slide-{slide_idx}", slide
+    finally:
+        extracted.close()
+        if cache is not None:
+            cache.save()
+
+
+def _iter_extracted_slides(
+    pptx_path: Path,
+    slide_indexes: Sequence[int],
+    issues_only: bool,
+    detail: str,
+    jobs: int,
+    font_cache: Optional[Union[str, Path]],
+    engine: str,
+) -> Generator[Dict[str, ShapeDict], None, None]:
+    """Inventory of each of the given slides as dicts ({} for slides without
+    text), in order, from jobs worker processes if > 1."""
+    if not slide_indexes:
+        return
+
+    if jobs <= 1:
+        source = _SlideSource(str(pptx_path), engine)
+        try:
+            for slide_idx in slide_indexes:
+                yield source.extract(slide_idx, issues_only, detail)
+        finally:
+            source.close()
+        return
+
+    # Several batches per worker, so one slow batch does not hold up the rest
+    batch_size = max(1, math.ceil(len(slide_indexes) / (jobs * 4)))
+    batches = [
+        slide_indexes[start : start + batch_size]
+        for start in range(0, len(slide_indexes), batch_size)
+    ]
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(str(pptx_path), str(font_cache) if font_cache else None, engine),
+    ) as executor:
+        results = executor.map(
+            _extract_slide_list,
+            batches,
+            [issues_only] * len(batches),
+            [detail] * len(batches),
+        )
+        for batch in results:
+            yield from batch
+
 
-    # Convert ShapeData objects to dictionaries
+def inventory_to_dict(inventory: InventoryData) -> InventoryDict:
+    """Convert ShapeData objects to dictionaries for JSON serialization."""
     dict_inventory: InventoryDict = {}
     for slide_key, shapes in inventory.items():
         dict_inventory[slide_key] = {
             shape_key: shape_data.to_dict() for shape_key, shape_data in shapes.items()
         }
-
     return dict_inventory
 
 
-def save_inventory(inventory: InventoryData, output_path: Path) -> None:
+# ==================== Direct XML engine ====================
+# Reads the slide, layout and master parts with lxml instead of python-pptx
+# proxies. Nothing is written to the tree (python-pptx adds <a:solidFill/> when
+# a run's font.color is read), and placeholder inheritance is looked up in
+# tables built once per layout and master.
+
+_NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+}
+_A = "{%s}" % _NS["a"]
+_P = "{%s}" % _NS["p"]
+_R = "{%s}" % _NS["r"]
+_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+# Children of p:spTree and p:grpSp that python-pptx treats as shapes
+_SHAPE_TAGS = {
+    f"{_P}sp",
+    f"{_P}grpSp",
+    f"{_P}graphicFrame",
+    f"{_P}cxnSp",
+    f"{_P}pic",
+    f"{_P}contentPart",
+}
+
+# Master placeholder type a layout placeholder inherits its position from
+_MASTER_PLACEHOLDER_TYPES = {
+    "body": "body",
+    "chart": "body",
+    "clipArt": "body",
+    "ctrTitle": "title",
+    "dgm": "body",
+    "dt": "dt",
+    "ftr": "ftr",
+    "media": "body",
+    "obj": "body",
+    "pic": "body",
+    "sldNum": "sldNum",
+    "subTitle": "body",
+    "tbl": "body",
+    "title": "title",
+}
+
+_FILL_TAGS = {
+    f"{_A}noFill",
+    f"{_A}solidFill",
+    f"{_A}gradFill",
+    f"{_A}blipFill",
+    f"{_A}pattFill",
+    f"{_A}grpFill",
+}
+
+_ALIGNMENTS = {"ctr": "CENTER", "r": "RIGHT", "just": "JUSTIFY"}
+
+
+def _xml_bool(value: Optional[str]) -> Optional[bool]:
+    if value is None:
+        return None
+    return value in ("1", "true")
+
+
+def _centipoints_to_pt(value: str) -> float:
+    """Point size of a centipoint attribute, rounded through EMUs like python-pptx."""
+    return int(int(value) * 127) / 12700.0
+
+
+def _placeholder(elem: Any) -> Any:
+    """The p:ph element of a shape element (in ./*[1]/p:nvPr), or None."""
+    if len(elem) == 0:
+        return None
+    return elem[0].find(f"{_P}nvPr/{_P}ph")
+
+
+def _placeholder_type(ph: Any) -> str:
+    return ph.get("type", "obj")
+
+
+def _own_xfrm_value(elem: Any, attr: str) -> Optional[int]:
+    """Directly applied x, y, cx or cy of a shape element, or None."""
+    if elem.tag == f"{_P}graphicFrame":
+        xfrm = elem.find(f"{_P}xfrm")
+    elif elem.tag == f"{_P}grpSp":
+        xfrm = elem.find(f"{_P}grpSpPr/{_A}xfrm")
+    else:
+        xfrm = elem.find(f"{_P}spPr/{_A}xfrm")
+    if xfrm is None:
+        return None
+    child = xfrm.find(f"{_A}off" if attr in ("x", "y") else f"{_A}ext")
+    if child is None or child.get(attr) is None:
+        return None
+    return int(child.get(attr))
+
+
+def _paragraph_text(p: Any) -> str:
+    """Text of an a:p element: runs, fields and line breaks (as vertical tabs)."""
+    pieces = []
+    for child in p:
+        if child.tag in (f"{_A}r", f"{_A}fld"):
+            t = child.find(f"{_A}t")
+            pieces.append((t.text or "") if t is not None else "")
+        elif child.tag == f"{_A}br":
+            pieces.append("\v")
+    return "".join(pieces)
+
+
+# Master text style (p:txStyles child) a placeholder type draws its defaults from
+_TEXT_STYLES = {
+    "title": "titleStyle",
+    "ctrTitle": "titleStyle",
+    "dt": "otherStyle",
+    "ftr": "otherStyle",
+    "hdr": "otherStyle",
+    "sldNum": "otherStyle",
+}
+
+TextDefaults = Dict[str, Any]  # font_size, font_name, space_before, ...
+
+
+def _level_text_defaults(lst_style: Any, base: List[TextDefaults]) -> List[TextDefaults]:
+    """Per-level text defaults of a list style (a:lstStyle, p:bodyStyle, ...)
+    applied on top of base, one dict for each of the nine outline levels."""
+    levels = [dict(defaults) for defaults in base]
+    if lst_style is None:
+        return levels
+    for level, defaults in enumerate(levels):
+        lvl_ppr = lst_style.find(f"{_A}lvl{level + 1}pPr")
+        if lvl_ppr is None:
+            continue
+        def_rpr = lvl_ppr.find(f"{_A}defRPr")
+        if def_rpr is not None:
+            if def_rpr.get("sz"):
+                defaults["font_size"] = int(def_rpr.get("sz")) / 100.0
+            latin = def_rpr.find(f"{_A}latin")
+            if latin is not None and latin.get("typeface"):
+                defaults["font_name"] = latin.get("typeface")
+        for key, tag in (("space_before", "spcBef"), ("space_after", "spcAft")):
+            spc_pts = lvl_ppr.find(f"{_A}{tag}/{_A}spcPts")
+            if spc_pts is not None:
+                defaults[key] = _centipoints_to_pt(spc_pts.get("val"))
+        ln_spc = lvl_ppr.find(f"{_A}lnSpc")
+        if ln_spc is not None:
+            spc_pts = ln_spc.find(f"{_A}spcPts")
+            spc_pct = ln_spc.find(f"{_A}spcPct")
+            if spc_pts is not None:
+                defaults["line_spacing"] = _centipoints_to_pt(spc_pts.get("val"))
+            elif spc_pct is not None:
+                value = spc_pct.get("val")
+                # Proportional spacing is kept in lines, e.g. 0.9
+                defaults["line_spacing_lines"] = (
+                    float(value[:-1]) / 100.0
+                    if value.endswith("%")
+                    else int(value) / 100000.0
+                )
+    return levels
+
+
+_NO_TEXT_DEFAULTS: List[TextDefaults] = [{} for _ in range(9)]
+
+
+class _MasterTables:
+    """Lookups on a slide master, computed once."""
+
+    def __init__(self, master: Any):
+        self.placeholders: Dict[str, Any] = {}
+        for elem in _shape_elements(master.find(f"{_P}cSld/{_P}spTree")):
+            ph = _placeholder(elem)
+            if ph is not None:
+                self.placeholders.setdefault(_placeholder_type(ph), elem)
+
+        # First sz in each text style, in whole points (0 if absent)
+        self.style_font_sizes: Dict[str, int] = {}
+        # Per-level defaults of each text style
+        self.text_styles: Dict[str, List[TextDefaults]] = {}
+        tx_styles = master.find(f"{_P}txStyles")
+        for style_name in ("titleStyle", "bodyStyle", "otherStyle"):
+            style = tx_styles.find(f"{_P}{style_name}") if tx_styles is not None else None
+            self.text_styles[style_name] = _level_text_defaults(style, _NO_TEXT_DEFAULTS)
+            if style is None:
+                continue
+            for elem in style.iter():
+                if "sz" in elem.attrib:
+                    self.style_font_sizes.setdefault(
+                        style_name, int(elem.attrib["sz"]) // 100
+                    )
+                    break
+
+        # Text style defaults with the master placeholder's list style applied
+        self.placeholder_text_defaults: Dict[str, List[TextDefaults]] = {}
+        for ph_type in _MASTER_PLACEHOLDER_TYPES:
+            master_elem = self.placeholders.get(_MASTER_PLACEHOLDER_TYPES[ph_type])
+            self.placeholder_text_defaults[ph_type] = _level_text_defaults(
+                master_elem.find(f"{_P}txBody/{_A}lstStyle")
+                if master_elem is not None
+                else None,
+                self.text_styles[_TEXT_STYLES.get(ph_type, "bodyStyle")],
+            )
+
+
+class _LayoutTables:
+    """Lookups on a slide layout, computed once."""
+
+    def __init__(self, layout: Any, master: _MasterTables):
+        self.master = master
+        self.placeholders_by_idx: Dict[int, Any] = {}
+        self.default_font_sizes: Dict[str, Optional[float]] = {}
+        self._text_defaults_by_idx: Dict[int, List[TextDefaults]] = {}
+        for elem in _shape_elements(layout.find(f"{_P}cSld/{_P}spTree")):
+            ph = _placeholder(elem)
+            if ph is None:
+                continue
+            idx = int(ph.get("idx", "0"))
+            if idx not in self.placeholders_by_idx:
+                self.placeholders_by_idx[idx] = elem
+                self._text_defaults_by_idx[idx] = _level_text_defaults(
+                    elem.find(f"{_P}txBody/{_A}lstStyle"),
+                    self.master.placeholder_text_defaults.get(
+                        _placeholder_type(ph), self.master.text_styles["bodyStyle"]
+                    ),
+                )
+            ph_type = _placeholder_type(ph)
+            if ph_type not in self.default_font_sizes:
+                # First defRPr with a size in the first placeholder of the type
+                self.default_font_sizes[ph_type] = next(
+                    (
+                        float(sz) / 100.0
+                        for elem in elem.iter(f"{_A}defRPr")
+                        if (sz := elem.get("sz"))
+                    ),
+                    None,
+                )
+
+    def text_defaults(self, ph: Any, level: int = 0) -> TextDefaults:
+        """Resolved text defaults of a slide placeholder at an outline level
+        (0-8): layout list style, then master placeholder, then master text style.
+
+        Keys are only present when set somewhere in the chain: font_size and
+        space_before/space_after in points, font_name, and line_spacing in
+        points or line_spacing_lines for proportional spacing.
+        """
+        levels = self._text_defaults_by_idx.get(int(ph.get("idx", "0")))
+        if levels is None:
+            ph_type = _placeholder_type(ph)
+            levels = self.master.placeholder_text_defaults.get(
+                ph_type, self.master.text_styles["bodyStyle"]
+            )
+        return levels[min(max(level, 0), 8)]
+
+    def inherited_value(self, ph: Any, attr: str) -> Optional[int]:
+        """Position or size a slide placeholder takes from the layout (or master)."""
+        layout_elem = self.placeholders_by_idx.get(int(ph.get("idx", "0")))
+        if layout_elem is None:
+            return None
+        value = _own_xfrm_value(layout_elem, attr)
+        if value is not None or layout_elem.tag != f"{_P}sp":
+            return value
+        layout_ph = _placeholder(layout_elem)
+        master_type = _MASTER_PLACEHOLDER_TYPES.get(_placeholder_type(layout_ph))
+        master_elem = self.master.placeholders.get(master_type)  # type: ignore
+        if master_elem is None:
+            return None
+        return _own_xfrm_value(master_elem, attr)
+
+
+def _shape_elements(tree: Any) -> List[Any]:
+    if tree is None:
+        return []
+    return [child for child in tree if child.tag in _SHAPE_TAGS]
+
+
+# Tables for python-pptx layouts and masters, keyed by their package parts
+_pptx_layout_tables: "weakref.WeakKeyDictionary[Any, _LayoutTables]" = (
+    weakref.WeakKeyDictionary()
+)
+_pptx_master_tables: "weakref.WeakKeyDictionary[Any, _MasterTables]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _layout_tables_for(slide_layout: Any) -> _LayoutTables:
+    """Style and placeholder tables of a python-pptx slide layout, built once
+    per layout (and once per master) and reused for every shape."""
+    part = slide_layout.part
+    tables = _pptx_layout_tables.get(part)
+    if tables is None:
+        slide_master = slide_layout.slide_master
+        master = _pptx_master_tables.get(slide_master.part)
+        if master is None:
+            master = _MasterTables(slide_master.element)
+            _pptx_master_tables[slide_master.part] = master
+        tables = _LayoutTables(slide_layout.element, master)
+        _pptx_layout_tables[part] = tables
+    return tables
+
+
+class PresentationXml:
+    """Read-only view of a .pptx package for the direct XML inventory engine.
+
+    Slides are parsed one at a time as they are iterated; layouts and masters
+    are parsed once and reduced to lookup tables.
+    """
+
+    def __init__(self, pptx_path: Path):
+        self._zip = zipfile.ZipFile(pptx_path)
+        self._layouts: Dict[str, _LayoutTables] = {}
+        self._masters: Dict[str, _MasterTables] = {}
+
+        presentation = self._parse("ppt/presentation.xml")
+        rels = self._rels("ppt/presentation.xml")
+        sld_sz = presentation.find(f"{_P}sldSz")
+        self.slide_width: Optional[int] = None
+        self.slide_height: Optional[int] = None
+        if sld_sz is not None:
+            self.slide_width = int(sld_sz.get("cx"))
+            self.slide_height = int(sld_sz.get("cy"))
+        self.slide_paths = [
+            rels[sld_id.get(f"{_R}id")][1]
+            for sld_id in presentation.iterfind(f"{_P}sldIdLst/{_P}sldId")
+        ]
+
+    def close(self) -> None:
+        self._zip.close()
+
+    def slide(self, index: int) -> Tuple[Any, _LayoutTables]:
+        """The parsed slide part and the tables of its layout."""
+        path = self.slide_paths[index]
+        return self._parse(path), self._layout_tables(
+            self._related(path, "/slideLayout")
+        )
+
+    def slide_parts(self, index: int) -> Tuple[str, Optional[str], Optional[str]]:
+        """Paths of a slide part, its layout and the layout's master."""
+        path = self.slide_paths[index]
+        layout_path = self._related(path, "/slideLayout")
+        master_path = None
+        if layout_path is not None:
+            master_path = self._related(layout_path, "/slideMaster")
+        return path, layout_path, master_path
+
+    def read(self, path: str) -> bytes:
+        """Raw bytes of a part."""
+        return self._zip.read(path)
+
+    def _layout_tables(self, layout_path: Optional[str]) -> _LayoutTables:
+        if layout_path not in self._layouts:
+            master_path = None
+            layout = _EMPTY_PART
+            if layout_path is not None:
+                master_path = self._related(layout_path, "/slideMaster")
+                layout = self._parse(layout_path)
+            if master_path not in self._masters:
+                self._masters[master_path] = _MasterTables(  # type: ignore
+                    self._parse(master_path) if master_path else _EMPTY_PART
+                )
+            self._layouts[layout_path] = _LayoutTables(  # type: ignore
+                layout, self._masters[master_path]  # type: ignore
+            )
+        return self._layouts[layout_path]  # type: ignore
+
+    def _related(self, path: str, rel_type_suffix: str) -> Optional[str]:
+        """Target of the first relationship of a part with the given type."""
+        for rel_type, target in self._rels(path).values():
+            if rel_type.endswith(rel_type_suffix):
+                return target
+        return None
+
+    def _parse(self, path: str) -> Any:
+        return lxml.etree.fromstring(self._zip.read(path))
+
+    def _rels(self, path: str) -> Dict[str, Tuple[str, str]]:
+        """Internal relationships of a part: {rId: (type, target part path)}."""
+        directory, _, name = path.rpartition("/")
+        try:
+            rels = self._parse(f"{directory}/_rels/{name}.rels")
+        except KeyError:
+            return {}
+        result = {}
+        for rel in rels.iterfind(f"{_REL}Relationship"):
+            if rel.get("TargetMode") == "External":
+                continue
+            target = posixpath.normpath(posixpath.join(directory, rel.get("Target")))
+            result[rel.get("Id")] = (rel.get("Type"), target.lstrip("/"))
+        return result
+
+
+_EMPTY_PART = lxml.etree.Element(f"{_P}sld")
+
+
+class XmlParagraphData(ParagraphData):
+    """ParagraphData read directly from an a:p element."""
+
+    __slots__ = ()
+
+    def __init__(self, p: Any):
+        """Initialize from an a:p element.
+
+        Args:
+            p: The a:p lxml element
+        """
+        # super().__init__ is not called: it reads python-pptx objects
+        self._init_defaults(_paragraph_text(p).strip())
+
+        pPr = p.find(f"{_A}pPr")
+        if pPr is not None:
+            if (
+                pPr.find(f"{_A}buChar") is not None
+                or pPr.find(f"{_A}buAutoNum") is not None
+            ):
+                self.bullet = True
+                self.level = int(pPr.get("lvl", "0"))
+            self.alignment = _ALIGNMENTS.get(pPr.get("algn"))  # type: ignore
+            for attr, tag in (("space_before", "spcBef"), ("space_after", "spcAft")):
+                spc_pts = pPr.find(f"{_A}{tag}/{_A}spcPts")
+                if spc_pts is not None and int(spc_pts.get("val")):
+                    setattr(self, attr, _centipoints_to_pt(spc_pts.get("val")))
+
+        # Extract font properties from first run
+        run = p.find(f"{_A}r")
+        rPr = run.find(f"{_A}rPr") if run is not None else None
+        if rPr is not None:
+            latin = rPr.find(f"{_A}latin")
+            if latin is not None and latin.get("typeface"):
+                self.font_name = latin.get("typeface")
+            if rPr.get("sz") and int(rPr.get("sz")):
+                self.font_size = _centipoints_to_pt(rPr.get("sz"))
+            self.bold = _xml_bool(rPr.get("b"))
+            self.italic = _xml_bool(rPr.get("i"))
+            underline = rPr.get("u")
+            if underline is not None:
+                self.underline = (
+                    False
+                    if underline == "none"
+                    else True
+                    if underline == "sng"
+                    else MSO_UNDERLINE.from_xml(underline)  # type: ignore
+                )
+            self._read_color(rPr)
+
+        # Add line spacing if set
+        ln_spc = pPr.find(f"{_A}lnSpc") if pPr is not None else None
+        if ln_spc is not None:
+            spc_pts = ln_spc.find(f"{_A}spcPts")
+            spc_pct = ln_spc.find(f"{_A}spcPct")
+            if spc_pts is not None:
+                self.line_spacing = round(_centipoints_to_pt(spc_pts.get("val")), 2)
+            elif spc_pct is not None:
+                value = spc_pct.get("val")
+                lines = (
+                    float(value[:-1]) / 100.0
+                    if value.endswith("%")
+                    else int(value) / 100000.0
+                )
+                font_size = self.font_size if self.font_size else 12.0
+                self.line_spacing = round(lines * font_size, 2)
+
+    def _read_color(self, rPr: Any) -> None:
+        """RGB or theme color of a solid run fill; other fills report no color."""
+        fill = next((child for child in rPr if child.tag in _FILL_TAGS), None)
+        if fill is None or fill.tag != f"{_A}solidFill" or len(fill) == 0:
+            return
+        color = fill[0]
+        if color.tag == f"{_A}srgbClr":
+            self.color = color.get("val", "").upper()
+        elif color.tag == f"{_A}schemeClr":
+            try:
+                self.theme_color = MSO_THEME_COLOR.from_xml(color.get("val")).name
+            except ValueError:
+                pass
+
+
+class XmlShapeData(ShapeData):
+    """ShapeData read directly from a p:sp element by the direct XML engine."""
+
+    __slots__ = ("_sp", "_layout")
+
+    def __init__(
+        self,
+        sp: Any,
+        absolute_left: int,
+        absolute_top: int,
+        layout: _LayoutTables,
+        slide_size: Tuple[Optional[int], Optional[int]],
+        in_group: bool = False,
+    ):
+        """Initialize from a p:sp element.
+
+        Args:
+            sp: The p:sp lxml element (should be pre-validated)
+            absolute_left: Absolute left position in EMUs
+            absolute_top: Absolute top position in EMUs
+            layout: Tables of the slide's layout and master
+            slide_size: (width, height) of the slide in EMUs
+            in_group: True for shapes inside a group, which do not inherit
+                their size from the layout even when they are placeholders
+        """
+        # super().__init__ is not called: it reads python-pptx objects
+        self.shape = None
+        self.shape_id = ""
+        self.detail = "full"
+        self._sp = sp
+        self._layout = layout
+        self.slide_width_emu, self.slide_height_emu = slide_size
+
+        self.placeholder_type = None
+        self.default_font_size = None
+        ph = _placeholder(sp)
+        if ph is not None:
+            self.placeholder_type = _placeholder_type_name(_placeholder_type(ph))
+            self.default_font_size = layout.default_font_sizes.get(
+                _placeholder_type(ph)
+            )
+
+        width_emu = _xml_dimension(sp, "cx", None if in_group else layout)
+        height_emu = _xml_dimension(sp, "cy", None if in_group else layout)
+        self.left = round(self.emu_to_inches(absolute_left), 2)
+        self.top = round(self.emu_to_inches(absolute_top), 2)
+        self.width = round(self.emu_to_inches(width_emu), 2)
+        self.height = round(self.emu_to_inches(height_emu), 2)
+        self.left_emu = absolute_left
+        self.top_emu = absolute_top
+        self.width_emu = width_emu
+        self.height_emu = height_emu
+        self._reset_computed_fields()
+
+    def _text_paragraphs(self) -> List[Tuple[int, str, Any]]:
+        tx_body = self._sp.find(f"{_P}txBody")
+        if tx_body is None:
+            return []
+        return [
+            (index, _paragraph_text(p), p)
+            for index, p in enumerate(tx_body.iterfind(f"{_A}p"))
+        ]
+
+    def _paragraph_data(self, paragraph: Any) -> ParagraphData:
+        return XmlParagraphData(paragraph)
+
+    def _text_frame_margins(self) -> Dict[str, Optional[int]]:
+        body_pr = self._sp.find(f"{_P}txBody/{_A}bodyPr")
+        margins: Dict[str, Optional[int]] = {}
+        for side, attr in (("top", "tIns"), ("bottom", "bIns"), ("left", "lIns"), ("right", "rIns")):
+            value = body_pr.get(attr) if body_pr is not None else None
+            margins[side] = int(value) if value is not None else None
+        return margins
+
+    def _get_default_font_size(self) -> int:
+        style_name = "bodyStyle"
+        if self.placeholder_type and "TITLE" in self.placeholder_type:
+            style_name = "titleStyle"
+        return self._layout.master.style_font_sizes.get(style_name, 14)
+
+
+@functools.lru_cache(maxsize=None)
+def _placeholder_type_name(ph_type: str) -> Optional[str]:
+    """Placeholder type name as reported by python-pptx, e.g. "CENTER_TITLE"."""
+    try:
+        return PP_PLACEHOLDER.from_xml(ph_type).name
+    except ValueError:
+        return None
+
+
+def _xml_dimension(elem: Any, attr: str, layout: Optional[_LayoutTables]) -> int:
+    """Effective x, y, cx or cy of a shape; slide placeholders inherit from layout."""
+    value = _own_xfrm_value(elem, attr)
+    if value is None and layout is not None and elem.tag == f"{_P}sp":
+        ph = _placeholder(elem)
+        if ph is not None:
+            value = layout.inherited_value(ph, attr)
+    return value or 0
+
+
+def _is_valid_xml_shape(sp: Any) -> bool:
+    """Direct XML counterpart of is_valid_shape()."""
+    if sp.tag != f"{_P}sp":
+        return False
+    tx_body = sp.find(f"{_P}txBody")
+    if tx_body is None:
+        return False
+
+    text = "\n".join(_paragraph_text(p) for p in tx_body.iterfind(f"{_A}p")).strip()
+    if not text:
+        return False
+
+    ph = _placeholder(sp)
+    if ph is not None:
+        placeholder_type = _placeholder_type_name(_placeholder_type(ph))
+        if placeholder_type == "SLIDE_NUMBER":
+            return False
+        if placeholder_type == "FOOTER" and text.isdigit():
+            return False
+
+    return True
+
+
+def _collect_xml_shapes(
+    elem: Any,
+    layout: _LayoutTables,
+    parent_left: int = 0,
+    parent_top: int = 0,
+    in_group: bool = False,
+) -> List[Tuple[Any, int, int, bool]]:
+    """Direct XML counterpart of collect_shapes_with_absolute_positions().
+
+    Returns:
+        (p:sp element, absolute left, absolute top, in group) per text shape
+    """
+    inherit_from = None if in_group else layout
+    if elem.tag == f"{_P}grpSp":
+        group_left = parent_left + _xml_dimension(elem, "x", None)
+        group_top = parent_top + _xml_dimension(elem, "y", None)
+        result = []
+        for child in _shape_elements(elem):
+            result.extend(
+                _collect_xml_shapes(child, layout, group_left, group_top, True)
+            )
+        return result
+
+    if _is_valid_xml_shape(elem):
+        return [
+            (
+                elem,
+                parent_left + _xml_dimension(elem, "x", inherit_from),
+                parent_top + _xml_dimension(elem, "y", inherit_from),
+                in_group,
+            )
+        ]
+    return []
+
+
+def extract_text_inventory_xml(
+    pptx_path: Path, issues_only: bool = False, detail: str = "full"
+) -> InventoryData:
+    """Extract the text inventory by reading the slide XML directly.
+
+    Produces the same inventory as extract_text_inventory() without loading
+    the presentation into python-pptx: nothing in the file or in memory is
+    modified, and it runs several times faster. The ShapeData objects carry
+    no python-pptx shape (their .shape is None), so use extract_text_inventory()
+    when the shapes are to be edited.
+
+    Args:
+        pptx_path: Path to the PowerPoint file
+        issues_only: If True, only include shapes that have overflow or overlap issues
+        detail: What the shapes' to_dict() includes, one of ShapeData.DETAILS
+            ("full" by default); fields that are left out are never computed
+
+    Returns a nested dictionary: {slide-N: {shape-N: ShapeData}}
+    """
+    presentation = PresentationXml(pptx_path)
+    try:
+        return _extract_xml_slides(
+            presentation, range(len(presentation.slide_paths)), issues_only, detail
+        )
+    finally:
+        presentation.close()
+
+
+def _extract_xml_slides(
+    presentation: PresentationXml,
+    slide_indexes: Sequence[int],
+    issues_only: bool,
+    detail: str = "full",
+) -> InventoryData:
+    inventory: InventoryData = {}
+    for slide_idx in slide_indexes:
+        slide_inventory = _extract_xml_slide(
+            presentation, slide_idx, issues_only, detail
+        )
+        if slide_inventory:
+            inventory[f"slide-{slide_idx}"] = slide_inventory
+    return inventory
+
+
+def _extract_xml_slide(
+    presentation: PresentationXml, slide_idx: int, issues_only: bool, detail: str
+) -> Dict[str, ShapeData]:
+    slide, layout = presentation.slide(slide_idx)
+    slide_size = (presentation.slide_width, presentation.slide_height)
+    shapes = []
+    for elem in _shape_elements(slide.find(f"{_P}cSld/{_P}spTree")):
+        shapes.extend(_collect_xml_shapes(elem, layout))
+    return finish_slide_inventory(
+        [
+            XmlShapeData(sp, left, top, layout, slide_size, in_group)
+            for sp, left, top, in_group in shapes
+        ],
+        issues_only=issues_only,
+        detail=detail,
+    )
+
+
+def remeasure_shape(shape_data: ShapeData) -> ShapeData:
+    """Read the shape of a python-pptx ShapeData again through the XML engine.
+
+    For checking a shape after its text was edited in memory: unlike a second
+    python-pptx read, nothing in the tree is modified, so there is no need to
+    save and reload the presentation first. The position, size, slide size
+    and shape_id of the original record are kept.
+
+    Args:
+        shape_data: A record from extract_text_inventory() (with .shape)
+
+    Returns:
+        A new ShapeData for the shape's current text
+    """
+    shape = shape_data.shape
+    sp = shape.element  # type: ignore
+    remeasured = XmlShapeData(
+        sp,
+        shape_data.left_emu,
+        shape_data.top_emu,
+        _layout_tables_for(shape.part.slide_layout),  # type: ignore
+        (shape_data.slide_width_emu, shape_data.slide_height_emu),
+        in_group=sp.getparent().tag == f"{_P}grpSp",
+    )
+    remeasured.shape_id = shape_data.shape_id
+    return remeasured
+
+
+# ==================== Inventory cache ====================
+
+
+class InventoryCache:
+    """Slide inventories kept between runs, keyed by slide content.
+
+    A slide's key is a digest of its XML, its layout and master XML, the slide
+    size, the font index version and the output options, so a slide is only
+    extracted again when something its inventory depends on has changed. The
+    cache is a JSON file, either next to the deck or shared by many decks in a
+    cache directory; beyond max_entries the least recently used slides are
+    dropped.
+    """
+
+    FORMAT = 1  # Bump when the inventory of an unchanged slide would change
+    FILE_NAME = "inventory-cache.json"
+
+    def __init__(self, path: Path, max_entries: int = 5000):
+        """Load the cache file at path, if any.
+
+        Args:
+            path: JSON file to load the cache from and save it to
+            max_entries: Number of slide inventories to keep
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        # Least recently used first
+        self._entries: Dict[str, Dict[str, ShapeDict]] = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data["format"] == self.FORMAT:
+                self._entries = data["slides"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    @classmethod
+    def for_deck(
+        cls, pptx_path: Path, cache_dir: Optional[Union[str, Path]] = None
+    ) -> "InventoryCache":
+        """Sidecar cache next to the deck (deck.pptx.inventory-cache.json), or
+        the shared cache file in cache_dir."""
+        pptx_path = Path(pptx_path)
+        if cache_dir:
+            return cls(Path(cache_dir).expanduser() / cls.FILE_NAME)
+        return cls(pptx_path.with_name(f"{pptx_path.name}.{cls.FILE_NAME}"))
+
+    def slide_keys(
+        self, pptx_path: Path, issues_only: bool, detail: str = "full"
+    ) -> List[str]:
+        """Cache key of every slide of a deck, in slide order."""
+        presentation = PresentationXml(pptx_path)
+        try:
+            digests: Dict[Optional[str], str] = {None: ""}
+
+            def digest(path: Optional[str]) -> str:
+                if path not in digests:
+                    digests[path] = hashlib.sha256(presentation.read(path)).hexdigest()  # type: ignore
+                return digests[path]
+
+            prefix = json.dumps(
+                [
+                    self.FORMAT,
+                    issues_only,
+                    detail,
+                    presentation.slide_width,
+                    presentation.slide_height,
+                    FontIndex.default().version,
+                ]
+            )
+            keys = []
+            for slide_idx in range(len(presentation.slide_paths)):
+                slide_path, layout_path, master_path = presentation.slide_parts(
+                    slide_idx
+                )
+                parts = [digest(slide_path), digest(layout_path), digest(master_path)]
+                keys.append(
+                    hashlib.sha256(
+                        "\n".join([prefix] + parts).encode("utf-8")
+                    ).hexdigest()
+                )
+            return keys
+        finally:
+            presentation.close()
+
+    def get(self, key: str) -> Optional[Dict[str, ShapeDict]]:
+        """Cached inventory of a slide ({} for a slide without text shapes)."""
+        slide = self._entries.pop(key, None)
+        if slide is None:
+            self.misses += 1
+            return None
+        self._entries[key] = slide  # Now the most recently used
+        self.hits += 1
+        return slide
+
+    def put(self, key: str, slide: Dict[str, ShapeDict]) -> None:
+        self._entries.pop(key, None)
+        self._entries[key] = slide
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def save(self) -> None:
+        """Write the cache file, replacing it atomically."""
+        data = {"format": self.FORMAT, "slides": self._entries}
+        temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        except OSError:
+            pass  # The inventory is still correct, it just is not kept
+
+
+def save_inventory(
+    inventory: Union[InventoryData, InventoryDict], output_path: Path
+) -> None:
     """Save inventory to JSON file with proper formatting.
 
-    Converts ShapeData objects to dictionaries for JSON serialization.
+    Converts ShapeData objects to dictionaries for JSON serialization;
+    inventories that are already dictionaries are written as they are.
     """
-    # Convert ShapeData objects to dictionaries
-    json_inventory: InventoryDict = {}
-    for slide_key, shapes in inventory.items():
-        json_inventory[slide_key] = {
-            shape_key: shape_data.to_dict() for shape_key, shape_data in shapes.items()
-        }
+    write_inventory(
+        (
+            (
+                slide_key,
+                {
+                    shape_key: (
+                        shape_data.to_dict()
+                        if isinstance(shape_data, ShapeData)
+                        else shape_data
+                    )
+                    for shape_key, shape_data in shapes.items()
+                },
+            )
+            for slide_key, shapes in inventory.items()
+        ),
+        output_path,
+    )
+
+
+def write_inventory(
+    slides: Iterable[Tuple[str, Dict[str, ShapeDict]]],
+    output_path: Path,
+    ndjson: bool = False,
+) -> Tuple[int, int]:
+    """Write (slide-N, shapes) pairs to a file as they arrive.
 
+    The JSON output is the same document json.dump(indent=2) would produce
+    for the whole inventory, written one slide at a time. With ndjson, each
+    line is a one-slide object {"slide-N": {...}}; merging the lines gives
+    the same inventory. The file is flushed after every slide.
+
+    Returns:
+        Number of slides and of shapes written
+    """
+    total_slides = 0
+    total_shapes = 0
     with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(json_inventory, f, indent=2, ensure_ascii=False)
+        for slide_key, shapes in slides:
+            if ndjson:
+                f.write(json.dumps({slide_key: shapes}, ensure_ascii=False))
+                f.write("\n")
+            else:
+                f.write("{\n" if total_slides == 0 else ",\n")
+                slide_json = json.dumps(shapes, indent=2, ensure_ascii=False)
+                f.write(f"  {json.dumps(slide_key, ensure_ascii=False)}: ")
+                f.write(slide_json.replace("\n", "\n  "))
+            f.flush()
+            total_slides += 1
+            total_shapes += len(shapes)
+        if not ndjson:
+            f.write("\n}" if total_slides else "{}")
+    return total_slides, total_shapes
+
+
+# ==================== Worker processes ====================
+
+class _SlideSource:
+    """An open presentation that slides are extracted from one at a time."""
+
+    def __init__(self, pptx_path: str, engine: str):
+        self._presentation: Any
+        if engine == "xml":
+            self._presentation = PresentationXml(Path(pptx_path))
+        else:
+            self._presentation = Presentation(pptx_path)
+
+    def extract(
+        self, slide_idx: int, issues_only: bool, detail: str
+    ) -> Dict[str, ShapeDict]:
+        """Inventory of one slide as dicts ({} if it has no text)."""
+        if isinstance(self._presentation, PresentationXml):
+            slide_inventory = _extract_xml_slide(
+                self._presentation, slide_idx, issues_only, detail
+            )
+        else:
+            slide_inventory = extract_slide_inventory(
+                self._presentation.slides[slide_idx],
+                issues_only=issues_only,
+                detail=detail,
+            )
+        return {
+            shape_key: shape_data.to_dict()
+            for shape_key, shape_data in slide_inventory.items()
+        }
+
+    def close(self) -> None:
+        if isinstance(self._presentation, PresentationXml):
+            self._presentation.close()
+
+
+_worker_source: Optional[_SlideSource] = None
+
+
+def _init_worker(pptx_path: str, font_cache: Optional[str], engine: str) -> None:
+    global _worker_source
+    _worker_source = _SlideSource(pptx_path, engine)
+    if font_cache:
+        FontIndex.set_default(FontIndex(cache_path=Path(font_cache)))
+
+
+def _extract_slide_list(
+    slide_indexes: Sequence[int], issues_only: bool, detail: str
+) -> List[Dict[str, ShapeDict]]:
+    """Inventory of each of the given slides of the worker's presentation."""
+    return [
+        _worker_source.extract(slide_idx, issues_only, detail)  # type: ignore
+        for slide_idx in slide_indexes
+    ]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,85 @@
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from PIL import Image, ImageDraw, ImageFont
+from inventory import ShapeData
+
+
+SAMPLES = [
+    "",
+    "Short line",
+    "AVAWAY To Ty, WAVE: “Quoted” text with ffi ligatures, Ta Yo Vo 12.50% and more.",
+    "A verylongwordthatcanneverfitonasinglelineatanyofthewidthsbelow sits among short words.",
+    "Double  spaces and trailing space ",
+    "Quarterly revenue grew 12% year over year, driven by subscriptions in EMEA and APAC.",
+]
+
+# Widths from a few characters up to wider than any sample
+WIDTHS = range(20, 900, 11)
+
+
+def sample_fonts():
+    """PIL's bundled font at a few sizes, plus DejaVu when it is installed"""
+    fonts = [ImageFont.load_default(size=size) for size in (11, 18, 32)]
+    dejavu = Path("/usr/share/fonts/truetype/dejavu/DejaVuSerif.ttf")
+    if dejavu.exists():
+        fonts.append(ImageFont.truetype(str(dejavu), 24))
+    return fonts
+
+
+def exact_wrap(line, max_width_px, draw, font):
+    """Greedy wrap measuring every candidate line with textlength"""
+    if not line:
+        return [""]
+    wrapped = []
+    current = ""
+    for word in line.split(" "):
+        candidate = current + " " + word if current else word
+        if draw.textlength(candidate, font=font) <= max_width_px:
+            current = candidate
+        else:
+            if current:
+                wrapped.append(current)
+            current = word
+    if current:
+        wrapped.append(current)
+    return wrapped
+
+
+# Run from the scripts directory: python -m pytest inventory_test.py
+class TestWrapTextLine(unittest.TestCase):
+
+    def setUp(self):
+        self.draw = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+        self.shape = ShapeData.__new__(ShapeData)  # _wrap_text_line reads no fields
+
+    def test_cached_widths_break_lines_like_exact_measurement(self):
+        mismatches = [
+            (font.getname(), font.size, text, width)
+            for font in sample_fonts()
+            for text in SAMPLES
+            for width in WIDTHS
+            if self.shape._wrap_text_line(text, width, self.draw, font)
+            != exact_wrap(text, width, self.draw, font)
+        ]
+        self.assertEqual(mismatches, [])
+
+    def test_estimate_alone_stays_within_tolerance(self):
+        """Without the exact check near the limit, lines overshoot by at most 1px"""
+        with mock.patch.object(ShapeData, "WRAP_VERIFY_PX", 0):
+            for font in sample_fonts():
+                for text in SAMPLES:
+                    for width in WIDTHS:
+                        lines = self.shape._wrap_text_line(text, width, self.draw, font)
+                        self.assertEqual(" ".join(lines).split(), text.split())
+                        for line in lines:
+                            if " " not in line.strip():
+                                continue  # a single word may not fit at all
+                            self.assertLessEqual(
+                                self.draw.textlength(line, font=font), width + 1.0
+                            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Find every overlapping pair among a set of axis-aligned rectangles.
+
+Rectangles are bucketed into a uniform grid sized from their average
+dimensions, and only rectangles sharing a cell are compared. Each pair is
+reported once, from the cell holding the top-left corner of its overlap, so
+the cost is O(n + k) for n rectangles and k overlapping pairs (plus sorting
+the pairs) instead of comparing all n * (n - 1) / 2 pairs.
+
+The same module is used by pptx/scripts/inventory.py (shape overlaps) and
+pdf/scripts/check_bounding_boxes.py (form field bounding boxes).
+
+Usage:
+    from overlaps import find_overlapping_pairs
+
+    pairs = find_overlapping_pairs([(0, 0, 2, 1), (1, 0, 3, 1), (5, 5, 6, 6)])
+    # [(0, 1)]
+"""
+
+import math
+from collections import defaultdict
+from typing import Dict, List, Sequence, Tuple
+
+Rect = Tuple[float, float, float, float]  # (left, top, right, bottom)
+
+
+def find_overlapping_pairs(
+    rects: Sequence[Rect], tolerance: float = 0.0
+) -> List[Tuple[int, int]]:
+    """Find the pairs of rectangles that overlap by more than tolerance.
+
+    Args:
+        rects: (left, top, right, bottom) rectangles, with left <= right and
+            top <= bottom
+        tolerance: Minimum overlap along both axes; a pair is reported when
+            min(right) - max(left) > tolerance and likewise vertically. A
+            negative tolerance also reports rectangles that touch or are up to
+            -tolerance apart.
+
+    Returns:
+        Sorted (i, j) index pairs with i < j
+    """
+    n = len(rects)
+    if n < 2:
+        return []
+
+    # Grow the rectangles so that every reported pair shares at least one cell
+    margin = max(0.0, -tolerance) / 2
+    boxes = [(l - margin, t - margin, r + margin, b + margin) for l, t, r, b in rects]
+
+    origin_x = min(box[0] for box in boxes)
+    origin_y = min(box[1] for box in boxes)
+    extent_x = max(box[2] for box in boxes) - origin_x
+    extent_y = max(box[3] for box in boxes) - origin_y
+
+    # Cells about the size of an average rectangle, but no more than ~4n cells
+    max_cells_per_axis = 2 * math.isqrt(n) + 1
+    cell_width = max(
+        sum(box[2] - box[0] for box in boxes) / n, extent_x / max_cells_per_axis
+    )
+    cell_height = max(
+        sum(box[3] - box[1] for box in boxes) / n, extent_y / max_cells_per_axis
+    )
+    cell_width = cell_width or 1.0
+    cell_height = cell_height or 1.0
+
+    def column(x: float) -> int:
+        return int((x - origin_x) // cell_width)
+
+    def row(y: float) -> int:
+        return int((y - origin_y) // cell_height)
+
+    cells: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+    for index, (left, top, right, bottom) in enumerate(boxes):
+        for cx in range(column(left), column(right) + 1):
+            for cy in range(row(top), row(bottom) + 1):
+                cells[(cx, cy)].append(index)
+
+    pairs = []
+    for (cx, cy), members in cells.items():
+        for position, i in enumerate(members):
+            left_i, top_i, right_i, bottom_i = rects[i]
+            for j in members[position + 1 :]:
+                left_j, top_j, right_j, bottom_j = rects[j]
+                if (
+                    min(right_i, right_j) - max(left_i, left_j) > tolerance
+                    and min(bottom_i, bottom_j) - max(top_i, top_j) > tolerance
+                    # Report the pair only from the cell holding the top-left
+                    # corner of the overlap of the grown rectangles
+                    and column(max(boxes[i][0], boxes[j][0])) == cx
+                    and row(max(boxes[i][1], boxes[j][1])) == cy
+                ):
+                    pairs.append((i, j))
+
+    pairs.sort()
+    return pairs
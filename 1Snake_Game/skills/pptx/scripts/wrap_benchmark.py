@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Time ShapeData._wrap_text_line with cached word widths against exact measurement.
+
+Exact measurement is the same wrap with every candidate line measured by
+textlength (WRAP_VERIFY_PX set to infinity). Both runs wrap the same
+paragraphs at the same widths and must produce the same lines.
+
+Usage:
+    python wrap_benchmark.py [--paragraphs 300] [--font path/to/font.ttf]
+"""
+
+import argparse
+import math
+import random
+import time
+
+from PIL import Image, ImageDraw, ImageFont
+from inventory import ShapeData, measure_text
+
+WORDS = (
+    "the quarterly revenue grew year over year driven by subscriptions in "
+    "EMEA and APAC while operating margin held steady at 12.5% AVAWAY To Ty"
+).split()
+
+
+def paragraphs(count, seed=0):
+    """Deterministic paragraphs of 10 to 80 words"""
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choice(WORDS) for _ in range(rng.randint(10, 80)))
+        for _ in range(count)
+    ]
+
+
+def wrap_all(texts, widths, draw, font, verify_px):
+    ShapeData.WRAP_VERIFY_PX = verify_px
+    shape = ShapeData.__new__(ShapeData)
+    start = time.perf_counter()
+    lines = [
+        shape._wrap_text_line(text, width, draw, font)
+        for text in texts
+        for width in widths
+    ]
+    return time.perf_counter() - start, lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--paragraphs", type=int, default=300)
+    parser.add_argument("--font", help="TrueType font (default: PIL's bundled font)")
+    parser.add_argument("--size", type=int, default=18)
+    args = parser.parse_args()
+
+    font = (
+        ImageFont.truetype(args.font, args.size)
+        if args.font
+        else ImageFont.load_default(size=args.size)
+    )
+    draw = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+    texts = paragraphs(args.paragraphs)
+    widths = (200, 480, 900)
+    default_verify_px = ShapeData.WRAP_VERIFY_PX
+
+    measure_text.cache_clear()
+    exact_time, exact_lines = wrap_all(texts, widths, draw, font, math.inf)
+    measure_text.cache_clear()
+    cached_time, cached_lines = wrap_all(texts, widths, draw, font, default_verify_px)
+
+    mismatches = sum(a != b for a, b in zip(cached_lines, exact_lines))
+    print(f"{len(texts)} paragraphs x {len(widths)} widths")
+    print(f"exact textlength: {exact_time:.3f}s")
+    print(f"cached widths:    {cached_time:.3f}s ({exact_time / cached_time:.1f}x)")
+    print(f"line breaks differing: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()